@@ -0,0 +1,302 @@
+# answer_scoring.py
+"""
+Batch scoring of candidates' technical answers.
+
+Every answer gets a cheap local score from three features, computed with
+NumPy over whole batches:
+
+- length: word count relative to a target length
+- keyword coverage: share of the technology vocabulary (names, aliases,
+  related and parent technologies and domain names from the taxonomy) for
+  the candidate's tech stack that the answer mentions
+- similarity: cosine similarity of hashed bag-of-words vectors between the
+  answer and the question's reference answers (or the question itself)
+
+Answers that score clearly low or clearly high are settled locally. Only
+the ambiguous middle band is sent to the LLM, several answers per request.
+
+    python answer_scoring.py sessions/*.json --output scores.jsonl [--llm]
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import zlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from hiring_assistant import UNCERTAIN_ANSWER_PHRASES
+from llm_gateway import get_gateway
+from taxonomy import get_taxonomy
+
+logger = logging.getLogger(__name__)
+
+AnswerItem = namedtuple("AnswerItem", ["session_id", "question_number", "question", "answer", "tech_stack"])
+AnswerScore = namedtuple("AnswerScore", ["session_id", "question_number", "score", "band", "source",
+                                         "length", "coverage", "similarity"])
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9#+.]*")
+STOPWORDS = frozenset(
+    "a an and are as at be but by can do for from has have how i if in is it its my of on or so that the "
+    "then there this to was we what when which while why with would you your".split()
+)
+
+# Feature weights for the local score, and the penalty for uncertain answers
+WEIGHTS = np.array([0.2, 0.35, 0.45], dtype=np.float32)
+# Weights for answers with nothing to compare against (stored records don't
+# keep the questions): similarity drops out and the rest are renormalized
+WEIGHTS_WITHOUT_REFERENCE = np.array([0.2, 0.35, 0.0], dtype=np.float32) / np.float32(0.55)
+UNCERTAINTY_PENALTY = 0.3
+
+
+def tokenize(text):
+    """Lowercased content words; keeps tokens like c#, c++ and node.js intact."""
+    return [token.rstrip(".") for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class HashedVectorizer:
+    """Bag-of-words vectors in a fixed-size hashed feature space."""
+
+    def __init__(self, dim=4096):
+        self.dim = dim
+        self._columns = {}
+
+    def column(self, token):
+        column = self._columns.get(token)
+        if column is None:
+            # crc32 rather than hash() so columns are stable across processes
+            column = self._columns[token] = zlib.crc32(token.encode()) % self.dim
+        return column
+
+    def transform(self, token_lists):
+        """Return a (len(token_lists), dim) float32 matrix of term counts."""
+        matrix = np.zeros((len(token_lists), self.dim), dtype=np.float32)
+        rows = [row for row, tokens in enumerate(token_lists) for _ in tokens]
+        columns = [self.column(token) for tokens in token_lists for token in tokens]
+        if rows:
+            np.add.at(matrix, (np.array(rows), np.array(columns)), 1.0)
+        return matrix
+
+
+def normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-9)
+
+
+def technology_vocabulary(tech_stack, taxonomy=None):
+    """Words an answer about tech_stack would be expected to use."""
+    taxonomy = taxonomy or get_taxonomy()
+    words = set()
+    for name in taxonomy.matcher.technologies(tech_stack or ""):
+        tech = taxonomy.lookup(name)
+        related = [name, *tech.aliases, *tech.related, *taxonomy.ancestors(name)]
+        for term in related:
+            words.update(tokenize(term))
+        for domain in taxonomy.domain_path(tech.domain):
+            words.update(domain.split("_"))
+    return words
+
+
+def collect_answers(sessions):
+    """
+    Flatten sessions into AnswerItems. A session is either a
+    HiringAssistant.snapshot() dict (questions come from state["questions_asked"])
+    or a stored candidate record (questions unknown).
+    """
+    items = []
+    for index, session in enumerate(sessions):
+        candidate = session.get("candidate_data", session)
+        questions = session.get("state", {}).get("questions_asked", [])
+        session_id = session.get("session_id") or candidate.get("full_name") or str(index)
+        for response in candidate.get("technical_responses") or []:
+            number = response.get("question_number") or 0
+            question = questions[number - 1] if 0 < number <= len(questions) else ""
+            items.append(AnswerItem(session_id, number, question, response.get("response") or "",
+                                    candidate.get("tech_stack") or ""))
+    return items
+
+
+class AnswerScorer:
+    """
+    Scores AnswerItems locally in vectorized batches and resolves the
+    ambiguous band (local score between low and high) with the LLM.
+    references maps question text to a list of reference answers. LLM
+    requests go through the gateway for api_key (see llm_gateway.py), so
+    they share its rate limit, retries and circuit breaker with the
+    interviews using that key.
+    """
+
+    def __init__(self, llm=None, references=None, taxonomy=None, low=0.35, high=0.7, target_words=60,
+                 batch_size=1024, dim=4096, llm_batch_size=10, max_concurrency=4, api_key=None, gateway=None):
+        self.llm = llm
+        self.gateway = gateway or get_gateway(api_key)
+        self.references = references or {}
+        self.taxonomy = taxonomy or get_taxonomy()
+        self.low = low
+        self.high = high
+        self.target_words = target_words
+        self.batch_size = batch_size
+        self.llm_batch_size = llm_batch_size
+        self.max_concurrency = max_concurrency
+        self.vectorizer = HashedVectorizer(dim)
+        self._vocabularies = {}
+
+    def _vocabulary_vector(self, tech_stack):
+        vector = self._vocabularies.get(tech_stack)
+        if vector is None:
+            vector = np.zeros(self.vectorizer.dim, dtype=np.float32)
+            columns = [self.vectorizer.column(word) for word in technology_vocabulary(tech_stack, self.taxonomy)]
+            vector[columns] = 1.0
+            vector = self._vocabularies[tech_stack] = vector
+        return vector
+
+    def features(self, items):
+        """
+        Return an (n, 3) array of length, coverage and similarity features, plus
+        masks of uncertain answers and of answers with a question or references
+        to compare against.
+        """
+        tokens = [tokenize(item.answer) for item in items]
+        answers = self.vectorizer.transform(tokens)
+        present = (answers > 0).astype(np.float32)
+
+        lengths = np.array([len(item.answer.split()) for item in items], dtype=np.float32)
+        length = np.minimum(lengths / self.target_words, 1.0)
+
+        vocab = np.stack([self._vocabulary_vector(item.tech_stack) for item in items])
+        vocab_size = vocab.sum(axis=1)
+        # Mentioning a dozen relevant terms counts as full coverage
+        expected = np.clip(vocab_size, 1, 12)
+        coverage = np.where(vocab_size > 0, np.minimum((present * vocab).sum(axis=1) / expected, 1.0), 0.0)
+
+        # Reference texts for each distinct question; the question itself when there are none
+        questions = list(dict.fromkeys(item.question for item in items))
+        reference_texts, reference_owner = [], []
+        for index, question in enumerate(questions):
+            for text in self.references.get(question) or [question]:
+                reference_texts.append(tokenize(text))
+                reference_owner.append(index)
+        references = normalize_rows(self.vectorizer.transform(reference_texts))
+        similarities = normalize_rows(answers) @ references.T
+        question_index = {question: index for index, question in enumerate(questions)}
+        answer_owner = np.array([question_index[item.question] for item in items])
+        owner_mask = answer_owner[:, None] == np.array(reference_owner)[None, :]
+        # Best match among the answer's own question's references
+        similarity = np.where(owner_mask, similarities, 0.0).max(axis=1)
+
+        uncertain = np.array([any(phrase in item.answer.lower() for phrase in UNCERTAIN_ANSWER_PHRASES)
+                              for item in items])
+        has_reference = np.array([bool(self.references.get(item.question) or item.question.strip())
+                                  for item in items])
+        return np.column_stack([length, coverage, similarity]).astype(np.float32), uncertain, has_reference
+
+    def score_local(self, items):
+        """Return (scores, features) for items, computed batch_size answers at a time."""
+        scores, features = [], []
+        for start in range(0, len(items), self.batch_size):
+            batch_features, uncertain, has_reference = self.features(items[start:start + self.batch_size])
+            weights = np.where(has_reference[:, None], WEIGHTS, WEIGHTS_WITHOUT_REFERENCE)
+            batch_scores = (batch_features * weights).sum(axis=1) - UNCERTAINTY_PENALTY * uncertain
+            scores.append(np.clip(batch_scores, 0.0, 1.0))
+            features.append(batch_features)
+        if not scores:
+            return np.zeros(0, dtype=np.float32), np.zeros((0, 3), dtype=np.float32)
+        return np.concatenate(scores), np.concatenate(features)
+
+    def _score_with_llm(self, batch):
+        """
+        Score one batch of (index, AnswerItem) pairs; returns {index: score in [0, 1]}.
+        A failed request scores nothing, leaving the batch ambiguous.
+        """
+        import prompts
+        from llm_factory import get_chains
+
+        chain = get_chains(self.llm, {"answer_scoring": prompts.ANSWER_SCORING_PROMPT}, output_key="output")["answer_scoring"]
+        answers = "\n\n".join(
+            f"[{index}] Tech stack: {item.tech_stack}\nQuestion: {item.question or '(not recorded)'}\nAnswer: {item.answer}"
+            for index, item in batch
+        )
+        try:
+            output = self.gateway.call(lambda: chain.invoke({"answers": answers})["output"])
+        except Exception:
+            logger.warning("LLM scoring failed for a batch of %d answers", len(batch), exc_info=True)
+            return {}
+        start, end = output.find("["), output.rfind("]")
+        try:
+            results = json.loads(output[start:end + 1]) if start != -1 else []
+        except ValueError:
+            return {}
+        wanted = {index for index, _ in batch}
+        scores = {}
+        for result in results:
+            if isinstance(result, dict) and result.get("id") in wanted and isinstance(result.get("score"), (int, float)):
+                scores[result["id"]] = min(max(result["score"] / 10, 0.0), 1.0)
+        return scores
+
+    def score(self, items):
+        """Score items; returns one AnswerScore per item, in order."""
+        items = list(items)
+        scores, features = self.score_local(items)
+        bands = np.where(scores < self.low, "weak", np.where(scores > self.high, "strong", "ambiguous"))
+        sources = np.full(len(items), "local", dtype=object)
+
+        ambiguous = np.flatnonzero(bands == "ambiguous")
+        if self.llm is not None and len(ambiguous):
+            pending = [(int(index), items[index]) for index in ambiguous]
+            batches = [pending[i:i + self.llm_batch_size] for i in range(0, len(pending), self.llm_batch_size)]
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                for resolved in executor.map(self._score_with_llm, batches):
+                    for index, llm_score in resolved.items():
+                        scores[index] = llm_score
+                        bands[index] = "weak" if llm_score < 0.5 else "strong"
+                        sources[index] = "llm"
+
+        return [
+            AnswerScore(item.session_id, item.question_number, float(scores[i]), str(bands[i]), sources[i],
+                        *(float(value) for value in features[i]))
+            for i, item in enumerate(items)
+        ]
+
+    def score_sessions(self, sessions):
+        """Score every technical response in many sessions at once."""
+        return self.score(collect_answers(sessions))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score technical answers from session snapshots or candidate records.")
+    parser.add_argument("paths", nargs="+", help="Session snapshot or candidate record JSON files")
+    parser.add_argument("--output", default="answer_scores.jsonl")
+    parser.add_argument("--references", help="JSON file mapping question text to a list of reference answers")
+    parser.add_argument("--llm", action="store_true", help="Resolve ambiguous answers with the LLM (needs GROQ_API_KEY)")
+    parser.add_argument("--low", type=float, default=0.35)
+    parser.add_argument("--high", type=float, default=0.7)
+    args = parser.parse_args()
+
+    sessions = []
+    for path in args.paths:
+        with open(path) as f:
+            sessions.append(json.load(f))
+    references = None
+    if args.references:
+        with open(args.references) as f:
+            references = json.load(f)
+    llm = api_key = None
+    if args.llm:
+        from llm_factory import get_chat_model
+        api_key = os.environ["GROQ_API_KEY"]
+        llm = get_chat_model(api_key)
+
+    scorer = AnswerScorer(llm=llm, references=references, low=args.low, high=args.high, api_key=api_key)
+    results = scorer.score_sessions(sessions)
+    with open(args.output, "w") as f:
+        for result in results:
+            f.write(json.dumps(result._asdict()) + "\n")
+    counts = {band: sum(result.band == band for result in results) for band in ("weak", "ambiguous", "strong")}
+    print(f"{len(results)} answers scored ({counts}) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,89 +1,148 @@
-import streamlit as st
-from hiring_assistant import HiringAssistant
-
-# Page configuration
-st.set_page_config(
-    page_title="TalentScout Hiring Assistant",
-    page_icon="👨‍💼",
-    layout="centered"
-)
-
-# Initialize session state
-if "initialized" not in st.session_state:
-    st.session_state.initialized = False
-    st.session_state.messages = []
-    st.session_state.assistant = None
-
-def initialize_assistant():
-    """Initialize the hiring assistant with API key."""
-    api_key = st.session_state.api_key
-    st.session_state.assistant = HiringAssistant(api_key=api_key)
-    st.session_state.initialized = True
-    
-    # Generate initial greeting
-    initial_response = st.session_state.assistant.process_user_input("Hello")
-    st.session_state.messages.append({"role": "assistant", "content": initial_response})
-
-# Main application
-st.title("TalentScout Hiring Assistant")
-
-# Sidebar for configuration
-with st.sidebar:
-    st.header("Configuration")
-    if not st.session_state.initialized:
-        api_key = st.text_input("Enter your Groq API Key", type="password")
-        st.session_state.api_key = api_key
-        if st.button("Start Assistant") and api_key:
-            initialize_assistant()
-            st.rerun()  # Rerun to reflect initialized state
-    else:
-        if st.button("Reset Conversation"):
-            st.session_state.initialized = False
-            st.session_state.messages = []
-            st.session_state.assistant = None
-            st.rerun()
-
-# Chat interface
-if st.session_state.initialized:
-    # Display chat messages using st.chat_message
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
-    
-    # User input with chat-style input
-    if prompt := st.chat_input("Type your message here..."):
-        # Add user message to chat
-        st.session_state.messages.append({"role": "user", "content": prompt})
-        with st.chat_message("user"):
-            st.markdown(prompt)
-        
-        # Process input and get response
-        with st.spinner("Assistant is thinking..."):
-            assistant_response = st.session_state.assistant.process_user_input(prompt)
-        
-        # Add assistant response to chat
-        st.session_state.messages.append({"role": "assistant", "content": assistant_response})
-        with st.chat_message("assistant"):
-            st.markdown(assistant_response)
-        
-        # Rerun to update the UI
-        st.rerun()
-
-    # Display candidate information
-    with st.sidebar:
-        st.header("Candidate Information")
-        candidate_data = st.session_state.assistant.candidate_data
-        
-        st.write(f"Name: {candidate_data['full_name'] or 'Not provided'}")
-        st.write(f"Email: {candidate_data['email'] or 'Not provided'}")
-        st.write(f"Phone: {candidate_data['phone'] or 'Not provided'}")
-        st.write(f"Experience: {candidate_data['experience'] or 'Not provided'}")
-        st.write(f"Position: {candidate_data['desired_position'] or 'Not provided'}")
-        st.write(f"Location: {candidate_data['location'] or 'Not provided'}")
-        st.write(f"Tech Stack: {candidate_data['tech_stack'] or 'Not provided'}")
-        
-        st.header("Conversation State")
-        st.write(f"Stage: {st.session_state.assistant.state['stage']}")
-        st.write(f"Fields Collected: {', '.join(st.session_state.assistant.state['fields_collected']) or 'None'}")
-else:
-    st.info("Please enter your Groq API key in the sidebar to start the assistant.")
+import streamlit as st
+from llm_cache import LRUResponseCache
+from session_store import FileSessionStore
+
+# Page configuration
+st.set_page_config(
+    page_title="TalentScout Hiring Assistant",
+    page_icon="👨‍💼",
+    layout="centered"
+)
+
+# Initialize session state
+if "initialized" not in st.session_state:
+    st.session_state.initialized = False
+    st.session_state.messages = []
+    st.session_state.assistant = None
+    st.session_state.stream_responses = True
+    st.session_state.unsaved_turns = 0
+
+@st.cache_resource
+def get_response_cache():
+    """Process-wide LLM response cache shared by all sessions."""
+    return LRUResponseCache(max_size=1000, ttl=24 * 60 * 60)
+
+@st.cache_resource
+def get_session_store():
+    """Session snapshots, so a conversation survives an app restart."""
+    return FileSessionStore("sessions")
+
+# Turns between session snapshots; the turns in between are replayed from the
+# assistant's journal when the session is restored
+CHECKPOINT_EVERY = 5
+
+def save_session(force=False):
+    """Count a turn and snapshot the current session every CHECKPOINT_EVERY turns."""
+    st.session_state.unsaved_turns += 1
+    if not force and st.session_state.unsaved_turns < CHECKPOINT_EVERY:
+        return
+    assistant = st.session_state.assistant
+    get_session_store().save(assistant.session_id, assistant.snapshot())
+    st.session_state.unsaved_turns = 0
+
+def initialize_assistant():
+    """Initialize the hiring assistant with API key."""
+    # Imported here so the page renders before the LLM libraries are loaded
+    from hiring_assistant import HiringAssistant
+
+    api_key = st.session_state.api_key
+    st.session_state.assistant = HiringAssistant(api_key=api_key, response_cache=get_response_cache())
+    st.session_state.initialized = True
+
+    # Resume the session named in the URL if we still have it, from its
+    # snapshot or, if it was never checkpointed, from its journal
+    session_id = st.experimental_get_query_params().get("session", [None])[0]
+    snapshot = get_session_store().load(session_id) if session_id else None
+    if snapshot:
+        st.session_state.assistant.restore(snapshot)
+    if snapshot or (session_id and st.session_state.assistant.resume(session_id)):
+        # The first logged message is the automatic "Hello" that produced the greeting
+        st.session_state.messages = [
+            {"role": message["role"], "content": message["content"]}
+            for message in st.session_state.assistant.get_conversation_history()[1:]
+        ]
+        return
+
+    # Generate initial greeting
+    initial_response = st.session_state.assistant.process_user_input("Hello")
+    st.session_state.messages.append({"role": "assistant", "content": initial_response})
+    save_session(force=True)
+    st.experimental_set_query_params(session=st.session_state.assistant.session_id)
+
+# Main application
+st.title("TalentScout Hiring Assistant")
+
+# Sidebar for configuration
+with st.sidebar:
+    st.header("Configuration")
+    if not st.session_state.initialized:
+        api_key = st.text_input("Enter your Groq API Key", type="password")
+        st.session_state.api_key = api_key
+        if st.button("Start Assistant") and api_key:
+            initialize_assistant()
+            st.rerun()  # Rerun to reflect initialized state
+    else:
+        st.checkbox("Stream responses", key="stream_responses")
+        if st.button("Reset Conversation"):
+            get_session_store().delete(st.session_state.assistant.session_id)
+            st.experimental_set_query_params()
+            st.session_state.initialized = False
+            st.session_state.messages = []
+            st.session_state.assistant = None
+            st.rerun()
+
+# Chat interface
+if st.session_state.initialized:
+    # Display chat messages using st.chat_message
+    for message in st.session_state.messages:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+    
+    # User input with chat-style input
+    if prompt := st.chat_input("Type your message here..."):
+        # Add user message to chat
+        st.session_state.messages.append({"role": "user", "content": prompt})
+        with st.chat_message("user"):
+            st.markdown(prompt)
+        
+        if st.session_state.stream_responses:
+            # Render tokens as they arrive instead of waiting for the full completion
+            with st.chat_message("assistant"):
+                placeholder = st.empty()
+                assistant_response = ""
+                for chunk in st.session_state.assistant.stream_user_input(prompt):
+                    assistant_response += chunk
+                    placeholder.markdown(assistant_response + "▌")
+                placeholder.markdown(assistant_response)
+        else:
+            # Process input and get response
+            with st.spinner("Assistant is thinking..."):
+                assistant_response = st.session_state.assistant.process_user_input(prompt)
+            with st.chat_message("assistant"):
+                st.markdown(assistant_response)
+        
+        # Add assistant response to chat
+        st.session_state.messages.append({"role": "assistant", "content": assistant_response})
+        save_session()
+        
+        # Rerun to update the UI
+        st.rerun()
+
+    # Display candidate information
+    with st.sidebar:
+        st.header("Candidate Information")
+        candidate_data = st.session_state.assistant.candidate_data
+        
+        st.write(f"Name: {candidate_data['full_name'] or 'Not provided'}")
+        st.write(f"Email: {candidate_data['email'] or 'Not provided'}")
+        st.write(f"Phone: {candidate_data['phone'] or 'Not provided'}")
+        st.write(f"Experience: {candidate_data['experience'] or 'Not provided'}")
+        st.write(f"Position: {candidate_data['desired_position'] or 'Not provided'}")
+        st.write(f"Location: {candidate_data['location'] or 'Not provided'}")
+        st.write(f"Tech Stack: {candidate_data['tech_stack'] or 'Not provided'}")
+        
+        st.header("Conversation State")
+        st.write(f"Stage: {st.session_state.assistant.state['stage']}")
+        st.write(f"Fields Collected: {', '.join(st.session_state.assistant.state['fields_collected']) or 'None'}")
+else:
+    st.info("Please enter your Groq API key in the sidebar to start the assistant.")
@@ -0,0 +1,187 @@
+# batch_screening.py
+"""
+Run pre-written candidate transcripts through the HiringAssistant stage
+machine without a UI.
+
+Input is JSONL, one candidate per line:
+    {"candidate_id": "c-001", "messages": ["Hello", "Jane Doe", "jane@example.com", ...]}
+
+Candidates are screened in parallel on a process pool. Across all workers,
+at most --max-llm-concurrency LLM calls are in flight and at most
+--requests-per-second are started (a shared token bucket). Results are
+appended to the output JSONL as each candidate finishes, so an interrupted
+run picks up where it stopped when started again with the same output file.
+A rerun also retries candidates that failed, appending a new line for each:
+when a candidate_id appears more than once, its last line is authoritative.
+
+    GROQ_API_KEY=... python batch_screening.py transcripts.jsonl --output results.jsonl --workers 8
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+class SharedRateLimiter:
+    """
+    Token bucket shared by every process it is passed to: up to rate
+    acquisitions per second on average, with bursts of up to burst.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self._tokens = multiprocessing.Value("d", self.burst, lock=False)
+        self._updated = multiprocessing.Value("d", time.monotonic(), lock=False)
+        self._lock = multiprocessing.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens = min(self.burst, self._tokens.value + (now - self._updated.value) * self.rate)
+                self._updated.value = now
+                if tokens >= 1:
+                    self._tokens.value = tokens - 1
+                    return
+                self._tokens.value = tokens
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
+
+
+# Per-worker state, set up by _init_worker
+_worker = {}
+
+
+def _init_worker(api_key, semaphore, limiter, assistant_options):
+    _worker.update(api_key=api_key, semaphore=semaphore, limiter=limiter, options=assistant_options)
+
+
+@contextmanager
+def _llm_slot(chain_name):
+    """call_guard for HiringAssistant: rate limit, then hold a global concurrency slot."""
+    if _worker["limiter"] is not None:
+        _worker["limiter"].acquire()
+    with _worker["semaphore"]:
+        yield
+
+
+def screen_candidate(candidate):
+    """Drive one candidate's messages through a fresh HiringAssistant; returns the result record."""
+    from hiring_assistant import HiringAssistant
+    from llm_cache import LRUResponseCache
+
+    if "cache" not in _worker:
+        _worker["cache"] = LRUResponseCache(max_size=1000)
+    assistant = HiringAssistant(_worker["api_key"], response_cache=_worker["cache"], call_guard=_llm_slot,
+                                **_worker["options"])
+    result = {"candidate_id": candidate["candidate_id"], "status": "ok", "error": None}
+    started = time.perf_counter()
+    try:
+        try:
+            for message in candidate.get("messages", []):
+                assistant.process_user_input(message)
+        finally:
+            # Keep whatever was collected, even from a failed conversation
+            assistant.save_candidate_data()
+    except Exception as exc:
+        result.update(status="error", error=repr(exc))
+
+    candidate_data = assistant.candidate_data.to_dict()
+    result.update(
+        stage=assistant.state["stage"],
+        seconds=round(time.perf_counter() - started, 3),
+        transcript=candidate_data.pop("conversation_log"),
+        candidate=candidate_data
+    )
+    return result
+
+
+def read_candidates(path, done):
+    """
+    Yield input candidates not already in done, giving each a candidate_id.
+    Lines that aren't JSON objects are reported on stderr and skipped.
+    """
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                candidate = json.loads(line)
+            except ValueError as exc:
+                print(f"{path}:{line_number}: skipping malformed line ({exc})", file=sys.stderr)
+                continue
+            if not isinstance(candidate, dict):
+                print(f"{path}:{line_number}: skipping line that isn't a JSON object", file=sys.stderr)
+                continue
+            candidate.setdefault("candidate_id", f"line-{line_number}")
+            if candidate["candidate_id"] not in done:
+                yield candidate
+
+
+def completed_ids(output):
+    """Candidate ids whose last result in output, from an earlier run, succeeded."""
+    statuses = {}
+    if not os.path.exists(output):
+        return set()
+    with open(output) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A line cut short when the previous run was killed
+                continue
+            statuses[record["candidate_id"]] = record.get("status")
+    return {candidate_id for candidate_id, status in statuses.items() if status == "ok"}
+
+
+def run_batch(input_path, output, api_key, workers=4, max_llm_concurrency=8, requests_per_second=None,
+              journal_dir=None, progress_every=100):
+    """Screen every not-yet-screened candidate in input_path; returns (screened, failed)."""
+    done = completed_ids(output)
+    semaphore = multiprocessing.BoundedSemaphore(max_llm_concurrency)
+    limiter = SharedRateLimiter(requests_per_second) if requests_per_second else None
+    options = {"journal_dir": journal_dir}
+
+    screened = failed = 0
+    started = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(api_key, semaphore, limiter, options)) as pool, \
+            open(output, "a") as out:
+        for result in pool.imap_unordered(screen_candidate, read_candidates(input_path, done)):
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            screened += 1
+            failed += result["status"] != "ok"
+            if progress_every and screened % progress_every == 0:
+                rate = screened / (time.perf_counter() - started)
+                print(f"{screened} screened ({failed} failed), {rate:.2f} candidates/s", file=sys.stderr)
+    return screened, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Screen pre-written candidate transcripts in batch.")
+    parser.add_argument("input", help="JSONL file of {candidate_id, messages} records")
+    parser.add_argument("--output", default="screening_results.jsonl", help="Results are appended here; reruns resume")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--max-llm-concurrency", type=int, default=8, help="LLM calls in flight across all workers")
+    parser.add_argument("--requests-per-second", type=float, help="Cap on LLM calls started per second, across all workers")
+    parser.add_argument("--journal-dir", help="Also write per-candidate journals and snapshots here")
+    args = parser.parse_args()
+
+    screened, failed = run_batch(
+        args.input, args.output, os.environ["GROQ_API_KEY"],
+        workers=args.workers,
+        max_llm_concurrency=args.max_llm_concurrency,
+        requests_per_second=args.requests_per_second,
+        journal_dir=args.journal_dir
+    )
+    print(f"{screened} candidates screened ({failed} failed), results in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
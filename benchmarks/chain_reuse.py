@@ -0,0 +1,58 @@
+"""
+Micro-benchmark: per-call overhead of building the follow-up chain on every
+call versus fetching it from a ChainRegistry.
+
+Run from the repository root:
+    python -m benchmarks.chain_reuse [--iterations 2000]
+"""
+import argparse
+import timeit
+
+from langchain.chains import LLMChain
+from langchain.prompts import PromptTemplate
+from langchain_core.language_models import FakeListLLM
+
+from chain_registry import ChainRegistry
+from tech_question_generator import FOLLOW_UP_QUESTION_PROMPT
+
+INPUTS = {
+    "tech_stack": "python, django",
+    "previous_question": "How does Django's ORM avoid N+1 queries?",
+    "previous_answer": "select_related and prefetch_related batch the lookups."
+}
+
+
+def build_per_call(llm):
+    """What generate_follow_up_question used to do on every invocation."""
+    template = PromptTemplate(
+        input_variables=FOLLOW_UP_QUESTION_PROMPT.input_variables,
+        template=FOLLOW_UP_QUESTION_PROMPT.template
+    )
+    return LLMChain(llm=llm, prompt=template, verbose=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    llm = FakeListLLM(responses=["Can you walk me through a case where prefetch_related made things slower?"])
+    registry = ChainRegistry()
+
+    def registry_lookup():
+        return registry.get("follow_up_question", llm, FOLLOW_UP_QUESTION_PROMPT, verbose=False)
+
+    cases = [
+        ("construct only: per call", lambda: build_per_call(llm)),
+        ("construct only: registry", registry_lookup),
+        ("construct + run: per call", lambda: build_per_call(llm).run(**INPUTS)),
+        ("construct + run: registry", lambda: registry_lookup().run(**INPUTS)),
+    ]
+    for label, func in cases:
+        func()  # warm up
+        seconds = timeit.timeit(func, number=args.iterations)
+        print(f"{label:<28} {seconds / args.iterations * 1e6:10.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
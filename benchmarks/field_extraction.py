@@ -0,0 +1,125 @@
+"""
+Benchmark: single-pass field extraction versus the previous per-field approach
+(raw regex strings, one re.search per field, repeated lower() calls and a
+substring scan of every known technology).
+
+Run from the repository root:
+    python -m benchmarks.field_extraction [--messages 5000] [--repeat 5] [--extra-technologies 3000]
+
+--extra-technologies pads the taxonomy with synthetic entries to show how both
+approaches scale with taxonomy size.
+"""
+import argparse
+import random
+import re
+import time
+
+from field_extractor import extract_fields
+from taxonomy import Taxonomy, Technology, get_taxonomy
+
+NAMES = ["Jane Doe", "Arjun Mehta", "Li Wei", "Maria Garcia", "Tom O'Brien", "Aisha Khan"]
+CITIES = ["Berlin", "New York", "Bangalore", "Sao Paulo", "Toronto", "London, UK"]
+STACKS = [
+    "Python, Django, PostgreSQL and Docker",
+    "React, TypeScript, Node.js, MongoDB",
+    "Java 17, Spring Boot, Kafka, Kubernetes on AWS",
+    "Go, gRPC, Redis, Terraform, GCP",
+    "Flutter, Dart, Firebase",
+    "C#, .NET, SQL Server, Azure",
+]
+TEMPLATES = [
+    "{name}",
+    "My email is {email}",
+    "You can reach me at {phone}",
+    "I have {years} years of experience",
+    "I'm based in {city}",
+    "I'd like to apply for a senior backend engineer role",
+    "My stack: {stack}",
+    "Hi, I'm {name}, {email}, {phone}, {years} years, based in {city}. I mostly use {stack}.",
+    "Sure! I've been working with {stack} for about {years} yrs now, mostly on data pipelines.",
+    "Not sure what you mean, could you clarify the question?",
+]
+
+
+def make_corpus(size, seed=7):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        name = rng.choice(NAMES)
+        corpus.append(rng.choice(TEMPLATES).format(
+            name=name,
+            email=name.split()[0].lower().replace("'", "") + "@example.com",
+            phone=f"{rng.randint(200, 999)}-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+            years=rng.randint(1, 20),
+            city=rng.choice(CITIES),
+            stack=rng.choice(STACKS),
+        ))
+    return corpus
+
+
+def legacy_extract(text, technology_domains):
+    """The previous approach, kept here as the baseline."""
+    found = {}
+    email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    if email_match:
+        found["email"] = email_match.group(0)
+    phone_match = re.search(r'\b(?:\+\d{1,3}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b', text)
+    if phone_match:
+        found["phone"] = phone_match.group(0)
+    experience_match = re.search(r'(\d+)\s*(?:years?|yrs?)', text.lower())
+    if experience_match:
+        found["experience"] = text
+    if "year" in text.lower():
+        found.setdefault("experience", text)
+    text_lower = text.lower()
+    techs = [tech for tech in technology_domains if tech in text_lower]
+    if techs:
+        found["tech_stack"] = ", ".join(techs)
+    return found
+
+
+def padded_taxonomy(base, extra):
+    """Copy of base with extra synthetic technologies added."""
+    technologies = [base.lookup(name) for name in base.domains]
+    technologies += [
+        Technology(f"synthtech{i:05d}", "synthetic", (f"synth-{i:05d}",), None, ())
+        for i in range(extra)
+    ]
+    return Taxonomy(technologies, base.domain_parents)
+
+
+def timed(func, corpus, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for message in corpus:
+            func(message)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--extra-technologies", type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.messages)
+    taxonomy = get_taxonomy()
+    if args.extra_technologies:
+        taxonomy = padded_taxonomy(taxonomy, args.extra_technologies)
+    taxonomy.matcher  # build the automaton outside the timed region
+
+    legacy = timed(lambda message: legacy_extract(message, taxonomy.domains), corpus, args.repeat)
+    single_pass = timed(lambda message: extract_fields(message, taxonomy=taxonomy), corpus, args.repeat)
+    regex_only = timed(lambda message: extract_fields(message, technologies=False), corpus, args.repeat)
+
+    print(f"{len(corpus)} messages, {len(taxonomy)} known technologies (best of {args.repeat})")
+    for label, seconds in [("legacy per-field", legacy), ("single pass", single_pass),
+                           ("single pass, no tech stack", regex_only)]:
+        print(f"{label:<28} {seconds / len(corpus) * 1e6:8.2f} us/message")
+
+
+if __name__ == "__main__":
+    main()
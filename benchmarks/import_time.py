@@ -0,0 +1,61 @@
+"""
+Benchmark: cold import time of the core modules, measured with
+`python -X importtime` in a fresh interpreter per run.
+
+Run from the repository root:
+    python -m benchmarks.import_time [--repeat 5] [--top 10] [module ...]
+
+For each module, prints the best cumulative import time over the runs and
+the heaviest imports it pulls in, so regressions (an eager langchain import,
+prompt objects built at import time) show up as soon as they land.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+DEFAULT_MODULES = ["hiring_assistant", "tech_question_generator", "prompts", "question_bank", "utils"]
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(module):
+    """Return {imported module: cumulative microseconds} for one cold import of module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time:  self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="Heaviest dependencies to list per module")
+    args = parser.parse_args()
+
+    # Modules the interpreter imports at startup aren't attributable to ours
+    startup = set(import_times("sys"))
+
+    for module in args.modules:
+        runs = [import_times(module) for _ in range(args.repeat)]
+        best = min(runs, key=lambda times: times[module])
+        print(f"{module:<28} {best[module] / 1000:8.1f} ms (best of {args.repeat})")
+        heaviest = sorted(((us, name) for name, us in best.items()
+                           if name != module and "." not in name and name not in startup), reverse=True)[:args.top]
+        for us, name in heaviest:
+            print(f"    {name:<24} {us / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Load test: drive scripted candidate conversations through HiringAssistant
+and TechQuestionGenerator against a local simulated chat model, with no
+network access.
+
+Reports per-stage p50/p95/p99 latency, turns/sec, prompt token counts and
+memory. Run from the repository root:
+    python -m benchmarks.load_test [--conversations 200] [--concurrency 16]
+                                   [--latency 0.05] [--jitter 0.02] [--sync]
+                                   [--think-time 0.5] [--prefetch] [--trace-memory] [--json results.json]
+
+The simulated model sleeps for latency +/- jitter seconds per call, so the
+numbers show the assistant's own overhead on top of a known model latency.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from conversation_memory import estimate_tokens
+from hiring_assistant import HiringAssistant
+from instrumentation import InMemoryMetrics, percentile
+from llm_cache import LRUResponseCache
+from tech_question_generator import TechQuestionGenerator
+
+NAMES = ["Jane Doe", "Arjun Mehta", "Li Wei", "Maria Garcia", "Tom O'Brien", "Aisha Khan"]
+POSITIONS = ["Data Engineer", "Senior Python Developer", "Site Reliability Engineer", "Mobile Developer"]
+CITIES = ["Berlin", "New York", "Bangalore", "Toronto"]
+STACKS = [
+    "Python, Django, PostgreSQL and Docker",
+    "React, TypeScript, Node.js, MongoDB",
+    "Java, Spring Boot, Kafka, Kubernetes",
+    "Go, Redis, Terraform, GCP",
+]
+# Scripted messages must not contain an exit command as a substring
+# ("end", "bye", ...), or the conversation stops early
+ANSWERS = [
+    "I would profile first, then add an index on the columns used in the join.",
+    "Mostly through code review and small pull requests, plus a test for every fix.",
+    "I'm not sure, I haven't used that feature in production.",
+    "Caching at the API layer with a short TTL, and invalidation on writes.",
+    "I'd split the job into idempotent steps so a retry only repeats the failed one.",
+]
+
+
+class SimulatedChatModel(BaseChatModel):
+    """
+    Chat model stand-in that sleeps for a configurable latency and returns
+    canned text shaped like what each prompt expects. Counts calls and
+    estimated prompt/completion tokens in usage.
+    """
+
+    latency: float = 0.05
+    jitter: float = 0.02
+    usage: dict = {}
+
+    @property
+    def _llm_type(self):
+        return "simulated-chat"
+
+    def _respond(self, messages):
+        prompt = "\n".join(str(message.content) for message in messages)
+        if "JSON" in prompt:
+            text = "{}"
+        elif "technical questions" in prompt:
+            text = "\n".join(f"{i}. How would you approach problem {i} in this stack?" for i in range(1, 4))
+        else:
+            text = "Thanks for sharing. Could you tell me a little more about that?"
+        self.usage["calls"] = self.usage.get("calls", 0) + 1
+        self.usage["prompt_tokens"] = self.usage.get("prompt_tokens", 0) + estimate_tokens(prompt)
+        self.usage["completion_tokens"] = self.usage.get("completion_tokens", 0) + estimate_tokens(text)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+    def _delay(self):
+        return max(0.0, self.latency + random.uniform(-self.jitter, self.jitter))
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self._delay())
+        return self._respond(messages)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self._delay())
+        return self._respond(messages)
+
+
+def make_script(rng):
+    """One candidate conversation, from greeting to closing."""
+    name = rng.choice(NAMES)
+    return [
+        "Hello",
+        name,
+        name.split()[0].lower().replace("'", "") + "@example.com",
+        f"{rng.randint(200, 999)}-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+        f"I have {rng.randint(1, 15)} years of experience",
+        rng.choice(POSITIONS),
+        rng.choice(CITIES),
+        rng.choice(STACKS),
+    ] + rng.sample(ANSWERS, 3) + ["Thanks, that's all from me."]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+
+    def record(self, stage, seconds):
+        self.latencies[stage].append(seconds)
+
+    def summary(self):
+        rows = {}
+        for stage, values in self.latencies.items():
+            rows[stage] = {
+                "count": len(values),
+                "p50_ms": percentile(values, 50) * 1000,
+                "p95_ms": percentile(values, 95) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+            }
+        return rows
+
+
+def run_sync(scripts, make_assistant, recorder, think_time):
+    assistants = []
+    for script in scripts:
+        assistant = make_assistant()
+        for message in script:
+            stage = assistant.state["stage"]
+            start = time.perf_counter()
+            assistant.process_user_input(message)
+            recorder.record(stage, time.perf_counter() - start)
+            time.sleep(think_time)
+        assistants.append(assistant)
+    return assistants
+
+
+async def run_async(scripts, make_assistant, recorder, concurrency, think_time):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def converse(script):
+        assistant = make_assistant()
+        async with semaphore:
+            for message in script:
+                stage = assistant.state["stage"]
+                start = time.perf_counter()
+                await assistant.aprocess_user_input(message)
+                recorder.record(stage, time.perf_counter() - start)
+                await asyncio.sleep(think_time)
+        return assistant
+
+    return await asyncio.gather(*(converse(script) for script in scripts))
+
+
+def run_question_generator(llm, scripts, recorder, concurrency):
+    """Question generation and follow-ups for each scripted tech stack."""
+    generator = TechQuestionGenerator(llm, max_concurrency=concurrency, per_technology=True)
+    for script in scripts:
+        tech_stack, answer = script[7], script[8]
+        start = time.perf_counter()
+        questions = generator.generate_questions(tech_stack)
+        recorder.record("tq.generate_questions", time.perf_counter() - start)
+        start = time.perf_counter()
+        generator.generate_follow_up_question(tech_stack, questions[0], answer)
+        recorder.record("tq.follow_up", time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--conversations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16, help="Conversations in flight (async mode)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated model latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.02, help="Uniform +/- jitter on the latency")
+    parser.add_argument("--sync", action="store_true", help="Drive process_user_input sequentially")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the shared response cache")
+    parser.add_argument("--question-generator", type=int, default=20,
+                        help="Conversations whose tech stack is also run through TechQuestionGenerator")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="Seconds the candidate spends typing between turns (not counted as latency)")
+    parser.add_argument("--prefetch", action="store_true", help="Enable speculative next-question prefetch")
+    parser.add_argument("--trace-memory", action="store_true", help="Measure retained memory with tracemalloc (slower)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    rng = random.Random(args.seed)
+    scripts = [make_script(rng) for _ in range(args.conversations)]
+    llm = SimulatedChatModel(latency=args.latency, jitter=args.jitter)
+    cache = None if args.no_cache else LRUResponseCache(max_size=1000)
+    recorder = Recorder()
+    metrics = InMemoryMetrics(window=100000)
+
+    with tempfile.TemporaryDirectory() as journal_dir:
+        def make_assistant():
+            return HiringAssistant("load-test", response_cache=cache, journal_dir=journal_dir, llm=llm,
+                                    metrics=metrics, prefetch_questions=args.prefetch)
+
+        if args.trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        if args.sync:
+            assistants = run_sync(scripts, make_assistant, recorder, args.think_time)
+        else:
+            assistants = asyncio.run(run_async(scripts, make_assistant, recorder, args.concurrency,
+                                               args.think_time))
+        elapsed = time.perf_counter() - start
+        retained = tracemalloc.get_traced_memory()[0] if args.trace_memory else None
+        tracemalloc.stop()
+
+        # The generator's chains are verbose; keep their output out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_question_generator(llm, scripts[:args.question_generator], recorder, args.concurrency)
+
+    turns = sum(len(script) for script in scripts)
+    history_tokens = sum(assistant.get_prompt_stats()["total_prompt_tokens"] for assistant in assistants)
+    results = {
+        "conversations": len(scripts),
+        "turns": turns,
+        "seconds": elapsed,
+        "turns_per_second": turns / elapsed,
+        "llm_calls": llm.usage.get("calls", 0),
+        "prompt_tokens": llm.usage.get("prompt_tokens", 0),
+        "completion_tokens": llm.usage.get("completion_tokens", 0),
+        "history_tokens": history_tokens,
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "retained_bytes_per_session": retained / len(assistants) if retained is not None else None,
+        "stages": recorder.summary(),
+        "chains": metrics.summary()["chains"],
+    }
+
+    mode = "sync" if args.sync else f"async, concurrency {args.concurrency}"
+    print(f"{results['conversations']} conversations, {turns} turns ({mode}), "
+          f"model latency {args.latency * 1000:.0f}+/-{args.jitter * 1000:.0f} ms")
+    print(f"{'stage':<24} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for stage, row in results["stages"].items():
+        print(f"{stage:<24} {row['count']:>6} {row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f}")
+    print(f"{'chain':<24} {'calls':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'cached':>7}")
+    for chain, row in results["chains"].items():
+        print(f"{chain:<24} {row['calls']:>6} {row['p50'] * 1000:>9.1f} {row['p95'] * 1000:>9.1f} "
+              f"{row['p99'] * 1000:>9.1f} {row['cache_hits']:>7}")
+    print(f"throughput: {results['turns_per_second']:.1f} turns/s over {elapsed:.2f} s")
+    calls = results["llm_calls"] or 1
+    print(f"llm calls: {results['llm_calls']}, prompt tokens: {results['prompt_tokens']} "
+          f"({results['prompt_tokens'] / calls:.0f}/call), history tokens: {history_tokens}")
+    print(f"max RSS: {results['max_rss_kib'] / 1024:.1f} MiB", end="")
+    if retained is not None:
+        print(f", retained: {results['retained_bytes_per_session'] / 1024:.1f} KiB/session", end="")
+    print()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Benchmark: per-session memory of the candidate record, conversation state and
+conversation log, as plain dicts with ISO timestamp strings (the previous
+representation) versus the slotted records in models.py.
+
+Run from the repository root:
+    python -m benchmarks.session_memory [--sessions 2000] [--turns 15]
+"""
+import argparse
+import gc
+import tracemalloc
+from datetime import datetime
+
+from models import CandidateProfile, ConversationState, Message
+
+
+def legacy_session(turns):
+    candidate = {
+        "full_name": "Jane Doe", "email": "jane@example.com", "phone": "555-123-4567",
+        "experience": "5 years", "desired_position": "Backend Engineer", "location": "Berlin",
+        "tech_stack": "Python, Django, PostgreSQL", "conversation_log": [], "technical_responses": []
+    }
+    state = {"stage": "tech_questions", "fields_collected": list(candidate)[:7],
+             "current_question": 2, "total_questions": 3, "questions_asked": []}
+    for turn in range(turns):
+        for role in ("user", "assistant"):
+            candidate["conversation_log"].append({
+                "role": role,
+                "content": f"message {turn}",
+                "timestamp": datetime.now().isoformat()
+            })
+    return candidate, state
+
+
+def slotted_session(turns):
+    candidate = CandidateProfile()
+    for field, value in zip(CandidateProfile.__slots__[:7], ("Jane Doe", "jane@example.com", "555-123-4567",
+                                                            "5 years", "Backend Engineer", "Berlin",
+                                                            "Python, Django, PostgreSQL")):
+        candidate[field] = value
+    state = ConversationState()
+    state["stage"] = "tech_questions"
+    state["fields_collected"] = list(CandidateProfile.__slots__[:7])
+    state["current_question"] = 2
+    state["total_questions"] = 3
+    for turn in range(turns):
+        for role in ("user", "assistant"):
+            candidate["conversation_log"].append(Message(role, f"message {turn}"))
+    return candidate, state
+
+
+def measure(build, sessions, turns):
+    """Return bytes allocated per session for the sessions built by build."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(turns) for _ in range(sessions)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--turns", type=int, default=15, help="Candidate turns per session")
+    args = parser.parse_args()
+
+    legacy = measure(legacy_session, args.sessions, args.turns)
+    slotted = measure(slotted_session, args.sessions, args.turns)
+
+    print(f"{args.sessions} sessions, {args.turns * 2} logged messages each")
+    print(f"{'dicts + ISO timestamps':<24} {legacy / 1024:8.1f} KiB/session")
+    print(f"{'slotted records':<24} {slotted / 1024:8.1f} KiB/session  ({1 - slotted / legacy:.0%} smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+# candidate_journal.py
+import atexit
+import glob
+import json
+import os
+import threading
+
+
+class BatchedJournalWriter:
+    """
+    Buffers journal lines per file and appends them in batches.
+    Buffers are flushed by a background thread every flush_interval seconds,
+    when a file accumulates max_buffered lines, or explicitly via flush().
+    """
+
+    def __init__(self, flush_interval=2.0, max_buffered=100):
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self._buffers = {}
+        self._lock = threading.Lock()
+        # Serializes file appends with truncate() so a flush in progress can't
+        # resurrect lines that were just compacted away
+        self._io_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def write(self, path, line):
+        """Queue a line for appending to path."""
+        with self._lock:
+            buffer = self._buffers.setdefault(path, [])
+            buffer.append(line)
+            full = len(buffer) >= self.max_buffered
+        if full:
+            self.flush(path)
+        self._ensure_thread()
+
+    def flush(self, path=None):
+        """Append buffered lines to disk, for one path or for all of them."""
+        with self._io_lock:
+            with self._lock:
+                if path is None:
+                    pending = self._buffers
+                    self._buffers = {}
+                else:
+                    pending = {path: self._buffers.pop(path, [])}
+            for target, lines in pending.items():
+                if not lines:
+                    continue
+                os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+                with open(target, "a") as f:
+                    f.write("\n".join(lines) + "\n")
+
+    def truncate(self, path):
+        """Drop buffered lines for path and delete the file."""
+        with self._io_lock:
+            with self._lock:
+                self._buffers.pop(path, None)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _ensure_thread(self):
+        if self._thread is None and self.flush_interval:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="journal-writer", daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        """Stop the background thread and flush everything."""
+        self._stop.set()
+        self.flush()
+
+
+_default_writer = None
+_default_writer_lock = threading.Lock()
+
+
+def get_default_writer():
+    """Return the process-wide writer, flushed automatically at exit."""
+    global _default_writer
+    if _default_writer is None:
+        with _default_writer_lock:
+            if _default_writer is None:
+                _default_writer = BatchedJournalWriter()
+                atexit.register(_default_writer.close)
+    return _default_writer
+
+
+def safe_filename(name):
+    """Turn a candidate name into a filesystem-safe slug."""
+    return "".join(c for c in name if c.isalnum() or c.isspace()).replace(" ", "_").lower()
+
+
+def read_entries(path):
+    """Return the journal entries in path, skipping a line cut short by a crash."""
+    entries = []
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def apply_entries(record, entries):
+    """
+    Apply journal entries to a candidate record (a snapshot written by
+    SessionJournal.compact, or {} when there is none) and return it. Entries
+    the record already covers, by turn number, are skipped.
+    """
+    session = record.setdefault("session", {})
+    for entry in entries:
+        if entry["turn"] <= session.get("turn", 0):
+            continue
+        record.update(entry["fields"])
+        log = record.setdefault("conversation_log", [])
+        log.append({"role": "user", "content": entry["user"],
+                    "timestamp": entry.get("user_timestamp", entry["timestamp"])})
+        log.append({"role": "assistant", "content": entry["assistant"], "timestamp": entry["timestamp"]})
+        record.setdefault("technical_responses", []).extend(entry["technical_responses"])
+        session.update(turn=entry["turn"], state=entry["state"])
+    return record
+
+
+class SessionJournal:
+    """
+    Append-only journal for one interview session.
+
+    Each turn is appended as one JSON line to <directory>/<session_id>.jsonl,
+    so persisting a turn costs O(turn size). compact() writes the full
+    candidate record to a single snapshot file and truncates the journal;
+    the current state is always the snapshot plus the journal lines after it,
+    which load() reassembles.
+    """
+
+    def __init__(self, session_id, directory="candidates", writer=None):
+        self.session_id = session_id
+        self.directory = directory
+        self.writer = writer or get_default_writer()
+        self.journal_path = os.path.join(directory, f"{session_id}.jsonl")
+        self.snapshot_path = None
+
+    def append(self, entry):
+        """Queue one journal entry (a JSON-serializable dict)."""
+        self.writer.write(self.journal_path, json.dumps(entry, separators=(",", ":")))
+
+    def flush(self):
+        """Write any buffered entries for this session to disk."""
+        self.writer.flush(self.journal_path)
+
+    def compact(self, candidate_data, candidate_name=None, turn=0, state=None):
+        """
+        Write candidate_data as this session's snapshot and truncate the journal.
+        turn and state (the conversation state after that turn) are stored
+        with it under "session", so load() can resume from the snapshot.
+        Returns the snapshot path.
+        """
+        if self.snapshot_path is None:
+            prefix = safe_filename(candidate_name) if candidate_name else "candidate"
+            self.snapshot_path = os.path.join(self.directory, f"{prefix}_{self.session_id[:8]}.json")
+
+        record = dict(candidate_data, session={"session_id": self.session_id, "turn": turn, "state": state})
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(record, f, indent=2)
+        os.replace(tmp_path, self.snapshot_path)
+
+        # The snapshot covers everything journaled so far
+        self.writer.truncate(self.journal_path)
+        return self.snapshot_path
+
+    def find_snapshot(self):
+        """Return the path of this session's snapshot on disk, or None."""
+        if self.snapshot_path and os.path.exists(self.snapshot_path):
+            return self.snapshot_path
+        pattern = os.path.join(glob.escape(self.directory), f"*_{self.session_id[:8]}.json")
+        for path in glob.glob(pattern):
+            try:
+                with open(path) as f:
+                    record = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if (record.get("session") or {}).get("session_id") == self.session_id:
+                return path
+        return None
+
+    def load(self):
+        """
+        Return the session's current candidate record: the snapshot with the
+        journal entries written after it applied. "session" holds the last
+        turn number and conversation state. Returns None if the session left
+        nothing on disk.
+        """
+        self.flush()
+        record = None
+        path = self.find_snapshot()
+        if path:
+            self.snapshot_path = path
+            with open(path) as f:
+                record = json.load(f)
+        entries = read_entries(self.journal_path)
+        if record is None and not entries:
+            return None
+        return apply_entries(record or {}, entries)
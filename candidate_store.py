@@ -0,0 +1,193 @@
+# candidate_store.py
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+
+
+class CandidateStore:
+    """
+    Storage interface for secured candidate records (see utils.secure_store_candidate).
+    Records are dicts that may carry email_hash, phone_hash, stored_at and
+    desired_position, which backends can index.
+    """
+
+    def store(self, record):
+        """Persist one record and return its identifier."""
+        raise NotImplementedError
+
+    def store_many(self, records):
+        """Persist several records and return their identifiers."""
+        return [self.store(record) for record in records]
+
+    def find_by_email_hash(self, email_hash):
+        raise NotImplementedError
+
+    def find_by_phone_hash(self, phone_hash):
+        raise NotImplementedError
+
+    def find_by_position(self, desired_position, limit=100):
+        raise NotImplementedError
+
+    def recent(self, limit=50):
+        """Return the most recently stored records, newest first."""
+        raise NotImplementedError
+
+    def iter_records(self, batch_size=1000):
+        """Yield (identifier, record) for every stored record, reading batch_size at a time."""
+        raise NotImplementedError
+
+
+class FileCandidateStore(CandidateStore):
+    """
+    One JSON file per candidate in a directory (the original storage format).
+    Lookups scan and parse every file, so prefer SQLiteCandidateStore for
+    anything beyond small volumes.
+    """
+
+    def __init__(self, directory="secure_candidates"):
+        self.directory = directory
+
+    def store(self, record):
+        # Generate filename from candidate name or use UUID if name not available
+        if record.get("full_name"):
+            safe_name = "".join(c for c in record["full_name"] if c.isalnum() or c.isspace()).replace(" ", "_").lower()
+            # The suffix keeps same-named candidates stored in the same second apart
+            filename = f"{self.directory}/{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}.json"
+        else:
+            filename = f"{self.directory}/candidate_{uuid.uuid4().hex}.json"
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(filename, "w") as f:
+            json.dump(record, f, indent=2)
+        return filename
+
+    def iter_records(self, batch_size=1000):
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                path = os.path.join(self.directory, name)
+                with open(path) as f:
+                    yield path, json.load(f)
+
+    def _scan(self):
+        return (record for _, record in self.iter_records())
+
+    def find_by_email_hash(self, email_hash):
+        return [record for record in self._scan() if record.get("email_hash") == email_hash]
+
+    def find_by_phone_hash(self, phone_hash):
+        return [record for record in self._scan() if record.get("phone_hash") == phone_hash]
+
+    def find_by_position(self, desired_position, limit=100):
+        position = desired_position.lower()
+        matches = [record for record in self._scan() if (record.get("desired_position") or "").lower() == position]
+        return sorted(matches, key=lambda record: record.get("stored_at", ""), reverse=True)[:limit]
+
+    def recent(self, limit=50):
+        return sorted(self._scan(), key=lambda record: record.get("stored_at", ""), reverse=True)[:limit]
+
+
+class SQLiteCandidateStore(CandidateStore):
+    """
+    SQLite-backed store in WAL mode with indexes on email_hash, phone_hash,
+    stored_at and desired_position. The full record is kept as JSON next to
+    the indexed columns.
+    """
+
+    def __init__(self, path="secure_candidates.sqlite3"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS candidates (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                full_name TEXT,
+                email_hash TEXT,
+                phone_hash TEXT,
+                desired_position TEXT COLLATE NOCASE,
+                stored_at TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_candidates_email_hash ON candidates (email_hash, stored_at);
+            CREATE INDEX IF NOT EXISTS idx_candidates_phone_hash ON candidates (phone_hash, stored_at);
+            CREATE INDEX IF NOT EXISTS idx_candidates_stored_at ON candidates (stored_at);
+            CREATE INDEX IF NOT EXISTS idx_candidates_position ON candidates (desired_position, stored_at);
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def _row(record):
+        return (
+            record.get("full_name"),
+            record.get("email_hash"),
+            record.get("phone_hash"),
+            record.get("desired_position"),
+            record.get("stored_at") or datetime.now().isoformat(),
+            json.dumps(record)
+        )
+
+    def store(self, record):
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO candidates (full_name, email_hash, phone_hash, desired_position, stored_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                self._row(record)
+            )
+            return cursor.lastrowid
+
+    def store_many(self, records):
+        """Insert all records in a single transaction."""
+        rows = [self._row(record) for record in records]
+        with self._lock, self._conn:
+            return [
+                self._conn.execute(
+                    "INSERT INTO candidates (full_name, email_hash, phone_hash, desired_position, stored_at, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    row
+                ).lastrowid
+                for row in rows
+            ]
+
+    def _query(self, sql, params):
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def find_by_email_hash(self, email_hash):
+        return self._query("SELECT data FROM candidates WHERE email_hash = ? ORDER BY stored_at DESC", (email_hash,))
+
+    def find_by_phone_hash(self, phone_hash):
+        return self._query("SELECT data FROM candidates WHERE phone_hash = ? ORDER BY stored_at DESC", (phone_hash,))
+
+    def find_by_position(self, desired_position, limit=100):
+        return self._query(
+            "SELECT data FROM candidates WHERE desired_position = ? ORDER BY stored_at DESC LIMIT ?",
+            (desired_position, limit)
+        )
+
+    def recent(self, limit=50):
+        return self._query("SELECT data FROM candidates ORDER BY stored_at DESC LIMIT ?", (limit,))
+
+    def iter_records(self, batch_size=1000):
+        # Keyset pagination on id so each batch is a short, independent query
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, data FROM candidates WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for row_id, data in rows:
+                yield row_id, json.loads(data)
+            last_id = rows[-1][0]
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
@@ -0,0 +1,55 @@
+# chain_registry.py
+import threading
+from collections import OrderedDict
+
+
+class ChainRegistry:
+    """
+    Builds each LLMChain once and hands out the shared instance afterwards.
+    Chains are keyed by name, LLM instance, prompt and chain options, so a
+    registry can be kept per generator or shared process-wide between
+    sessions that use the same (long-lived) LLM client.
+
+    A chain keeps its LLM alive, so the registry holds at most max_chains
+    chains and drops the least recently used beyond that; an LLM that is no
+    longer in use is released once its chains have been dropped.
+    """
+
+    def __init__(self, max_chains=256):
+        self.max_chains = max_chains
+        self._chains = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name, llm, prompt, chain_kwargs):
+        # id(llm) can't be reused while a chain built over llm is registered,
+        # since the chain holds a reference to it
+        template = getattr(prompt, "template", None) or repr(prompt)
+        variables = tuple(getattr(prompt, "input_variables", ()))
+        return name, id(llm), template, variables, repr(sorted(chain_kwargs.items()))
+
+    def get(self, name, llm, prompt, **chain_kwargs):
+        """Return the chain registered under name for llm and prompt, building it on first use."""
+        key = self._key(name, llm, prompt, chain_kwargs)
+        with self._lock:
+            chain = self._chains.get(key)
+            if chain is not None:
+                self._chains.move_to_end(key)
+                return chain
+            from langchain.chains import LLMChain
+            chain = self._chains[key] = LLMChain(llm=llm, prompt=prompt, **chain_kwargs)
+            while len(self._chains) > self.max_chains:
+                self._chains.popitem(last=False)
+        return chain
+
+    def __len__(self):
+        return len(self._chains)
+
+    def clear(self):
+        """Drop all registered chains."""
+        with self._lock:
+            self._chains.clear()
+
+
+# Process-wide registry for chains over shared LLM clients
+default_registry = ChainRegistry()
@@ -0,0 +1,4 @@
+# Keeps the repository root importable when running pytest from any directory.
+
+# Benchmark scripts (e.g. benchmarks/load_test.py) match pytest's file pattern but aren't tests
+collect_ignore = ["benchmarks"]
@@ -0,0 +1,217 @@
+# conversation_memory.py
+from collections import deque
+
+# Rough characters-per-token ratio for English chat text. Used when no
+# model-specific tokenizer is supplied.
+CHARS_PER_TOKEN = 4
+
+DEFAULT_TOKEN_BUDGET = 1024
+
+# Recent render sizes kept for inspection; totals are kept as counters
+PROMPT_SIZE_HISTORY = 100
+
+TRUNCATION_MARKER = " [... message truncated]"
+
+
+def estimate_tokens(text):
+    """Cheap token estimate for a piece of text (no tokenizer required)."""
+    if not text:
+        return 0
+    return max(1, (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN)
+
+
+def condense_messages(previous_summary, messages, max_chars=600):
+    """
+    Default summarizer: fold evicted messages into a bounded running summary.
+    Keeps the most recent text, since that is what later turns refer to.
+    An LLM-backed summarizer with the same signature can be plugged in instead.
+    """
+    parts = [previous_summary] if previous_summary else []
+    parts.extend(messages)
+    text = " | ".join(parts)
+    if len(text) > max_chars:
+        text = "..." + text[-max_chars:]
+    return text
+
+
+class ConversationMemory:
+    """
+    Rolling, token-budgeted chat history used to build prompts.
+
+    Each message is rendered to a "role: content" line once, when it is
+    appended, and its token count is cached. Chains ask for a view of the
+    most recent lines that fits their own budget, so building a prompt costs
+    O(budget) instead of O(conversation). Lines that no longer fit in the
+    largest budget are evicted and folded into a running summary.
+    """
+
+    def __init__(self, token_budgets=None, default_budget=DEFAULT_TOKEN_BUDGET,
+                 summarizer=condense_messages, token_counter=estimate_tokens):
+        self.token_budgets = dict(token_budgets or {})
+        self.default_budget = default_budget
+        self.summarizer = summarizer
+        self.token_counter = token_counter
+
+        self.summary = ""
+        self.summary_tokens = 0
+        self.turn = 0
+        self.prompt_sizes = deque(maxlen=PROMPT_SIZE_HISTORY)
+        self.prompts_rendered = 0
+        self.total_prompt_tokens = 0
+        self.max_prompt_tokens = 0
+
+        self._lines = deque()
+        self._line_tokens = deque()
+        self._window_tokens = 0
+        self._max_window = max([default_budget] + list(self.token_budgets.values()))
+
+    def budget_for(self, chain_name):
+        """Return the history token budget for a chain."""
+        return self.token_budgets.get(chain_name, self.default_budget)
+
+    def append(self, role, content):
+        """Add a message to the rolling buffer, evicting old lines if needed."""
+        line = f"{role}: {content}"
+        tokens = self.token_counter(line)
+        self._lines.append(line)
+        self._line_tokens.append(tokens)
+        self._window_tokens += tokens
+        if role == "user":
+            self.turn += 1
+
+        if self._window_tokens > self._max_window:
+            self._evict()
+
+    def _evict(self):
+        # Evict down to 3/4 of the window so the summarizer runs once per
+        # batch of old messages rather than on every append.
+        target = (self._max_window * 3) // 4
+        evicted = []
+        while len(self._lines) > 1 and self._window_tokens > target:
+            evicted.append(self._lines.popleft())
+            self._window_tokens -= self._line_tokens.popleft()
+
+        if evicted and self.summarizer:
+            self.summary = self.summarizer(self.summary, evicted)
+            self.summary_tokens = self.token_counter(self.summary)
+
+    def _truncate(self, line, budget):
+        """Cut a line down to at most budget tokens, marking the cut; None if nothing fits."""
+        keep = budget * CHARS_PER_TOKEN - len(TRUNCATION_MARKER)
+        while keep > 0:
+            truncated = line[:keep] + TRUNCATION_MARKER
+            tokens = self.token_counter(truncated)
+            if tokens <= budget:
+                return truncated, tokens
+            keep -= max(1, (tokens - budget) * CHARS_PER_TOKEN)
+        return None
+
+    def render(self, chain_name=None):
+        """
+        Render the chat history for a chain, keeping the newest messages that
+        fit its budget; a newest message larger than the whole budget is
+        truncated. Records the resulting prompt size for the current turn.
+        """
+        budget = self.budget_for(chain_name)
+        if self.summary:
+            budget -= self.summary_tokens
+
+        recent = []
+        used = 0
+        for line, tokens in zip(reversed(self._lines), reversed(self._line_tokens)):
+            if used + tokens > budget:
+                if not recent:
+                    truncated = self._truncate(line, budget)
+                    if truncated:
+                        line, tokens = truncated
+                        used += tokens
+                        recent.append(line)
+                break
+            used += tokens
+            recent.append(line)
+
+        parts = []
+        if self.summary:
+            parts.append(f"(Earlier conversation, condensed: {self.summary})")
+            used += self.summary_tokens
+        omitted = len(self._lines) - len(recent)
+        if omitted:
+            parts.append(f"({omitted} earlier messages omitted)")
+        parts.extend(reversed(recent))
+
+        self.prompt_sizes.append({"turn": self.turn, "chain": chain_name, "tokens": used})
+        self.prompts_rendered += 1
+        self.total_prompt_tokens += used
+        self.max_prompt_tokens = max(self.max_prompt_tokens, used)
+        return "\n".join(parts)
+
+    def snapshot(self, history=True):
+        """
+        Return the buffer state as a JSON-serializable dict. With history=False
+        only the turn and prompt totals are kept, for callers that keep the
+        transcript themselves and rebuild the buffer from it with replay().
+        """
+        data = {
+            "turn": self.turn,
+            "prompt_totals": [self.prompts_rendered, self.total_prompt_tokens, self.max_prompt_tokens]
+        }
+        if history:
+            data.update(
+                summary=self.summary,
+                summary_tokens=self.summary_tokens,
+                lines=list(self._lines),
+                line_tokens=list(self._line_tokens),
+                prompt_sizes=list(self.prompt_sizes)
+            )
+        return data
+
+    def restore(self, data):
+        """
+        Replace the buffer state with one produced by snapshot(). A snapshot
+        taken with history=False only restores the turn and prompt totals.
+        """
+        self.turn = data["turn"]
+        sizes = [entry["tokens"] for entry in data.get("prompt_sizes", [])]
+        # Snapshots from before the totals were kept carry every render
+        totals = data.get("prompt_totals") or [len(sizes), sum(sizes), max(sizes, default=0)]
+        self.prompts_rendered, self.total_prompt_tokens, self.max_prompt_tokens = totals
+        if "lines" not in data:
+            return
+        self.summary = data["summary"]
+        self.summary_tokens = data["summary_tokens"]
+        self.prompt_sizes = deque(data["prompt_sizes"], maxlen=PROMPT_SIZE_HISTORY)
+        self._lines = deque(data["lines"])
+        self._line_tokens = deque(data["line_tokens"])
+        self._window_tokens = sum(self._line_tokens)
+
+    def replay(self, messages):
+        """
+        Rebuild the buffer from (role, content) pairs, e.g. a saved transcript.
+        Prompt-size counters are kept.
+        """
+        self.summary = ""
+        self.summary_tokens = 0
+        self.turn = 0
+        self._lines = deque()
+        self._line_tokens = deque()
+        self._window_tokens = 0
+        for role, content in messages:
+            self.append(role, content)
+
+    @property
+    def last_prompt_tokens(self):
+        """Token count of the most recently rendered history, or 0."""
+        return self.prompt_sizes[-1]["tokens"] if self.prompt_sizes else 0
+
+    def stats(self):
+        """Return counters describing the buffer and prompt sizes so far."""
+        return {
+            "turns": self.turn,
+            "buffered_messages": len(self._lines),
+            "buffered_tokens": self._window_tokens,
+            "summary_tokens": self.summary_tokens,
+            "prompts_rendered": self.prompts_rendered,
+            "last_prompt_tokens": self.last_prompt_tokens,
+            "max_prompt_tokens": self.max_prompt_tokens,
+            "total_prompt_tokens": self.total_prompt_tokens,
+        }
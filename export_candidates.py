@@ -0,0 +1,273 @@
+# export_candidates.py
+"""
+Export stored candidate records to a single columnar dataset for reporting.
+
+Reads the session snapshots written by HiringAssistant.save_candidate_data
+(candidates/, with the turns journaled since each snapshot applied), the
+secured records written by utils.secure_store_candidate (secure_candidates/)
+and, optionally, a SQLiteCandidateStore database. Files
+are parsed on a thread pool and streamed through a generator pipeline into
+fixed-size batches, so memory stays bounded however many records there are.
+
+Output is Parquet when the path ends in .parquet (requires pyarrow), and
+CSV otherwise (gzip-compressed when the path ends in .gz). Each technology
+domain in the taxonomy becomes its own column listing the candidate's
+technologies in that domain.
+
+    python export_candidates.py --output candidates.parquet [--sqlite secure_candidates.sqlite3]
+"""
+import argparse
+import csv
+import gzip
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from candidate_journal import apply_entries, read_entries
+from field_extractor import extract_fields
+from taxonomy import get_taxonomy
+from utils import secure_candidate_record
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pyarrow is optional; CSV export works without it
+    pyarrow = None
+
+BASE_COLUMNS = [
+    "source", "record_id", "full_name", "email", "phone", "email_hash", "phone_hash",
+    "experience", "years_experience", "desired_position", "location", "tech_stack",
+    "technologies", "messages", "technical_responses", "started_at", "stored_at",
+]
+
+
+def domain_columns(taxonomy=None):
+    """One column per technology domain, in a stable order."""
+    taxonomy = taxonomy or get_taxonomy()
+    return sorted(set(taxonomy.domains.values()))
+
+
+def iter_record_files(directory):
+    """Yield the paths of record files in a directory (journals and temp files skipped)."""
+    if not os.path.isdir(directory):
+        return
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(".json"):
+                yield entry.path
+
+
+def iter_journal_files(directory):
+    """Yield the paths of session journals (<session_id>.jsonl) in a directory."""
+    if not os.path.isdir(directory):
+        return
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(".jsonl"):
+                yield entry.path
+
+
+def read_record(path):
+    """Parse one record file; returns None for unreadable or malformed files."""
+    try:
+        with open(path) as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def parallel_map(func, items, workers=8, max_pending=None):
+    """
+    Like ThreadPoolExecutor.map, but never has more than max_pending items in
+    flight, so a long (lazy) input doesn't turn into a long list of futures.
+    Results are yielded in input order.
+    """
+    max_pending = max_pending or workers * 4
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def scan_directory(directory, source, workers=8):
+    """
+    Yield (source, record_id, record) for every record file in directory.
+    Session journals are applied to their snapshots, and sessions that have
+    only a journal so far are included as well.
+    """
+    journals = {os.path.basename(path)[:-len(".jsonl")]: path for path in iter_journal_files(directory)}
+    paths = iter_record_files(directory)
+    for path, record in parallel_map(lambda path: (path, read_record(path)), paths, workers):
+        if record is None:
+            continue
+        session_id = (record.get("session") or {}).get("session_id")
+        if session_id in journals:
+            record = apply_entries(record, read_entries(journals.pop(session_id)))
+        yield source, os.path.basename(path), record
+    for path in journals.values():
+        entries = read_entries(path)
+        if entries:
+            yield source, os.path.basename(path), apply_entries({}, entries)
+
+
+def scan_sqlite(path, batch_size=1000):
+    """Yield (source, record_id, record) for every row of a SQLiteCandidateStore."""
+    from candidate_store import SQLiteCandidateStore
+
+    store = SQLiteCandidateStore(path)
+    try:
+        for record_id, record in store.iter_records(batch_size):
+            yield "sqlite", record_id, record
+    finally:
+        store.close()
+
+
+def to_row(source, record_id, record, domains, taxonomy, mask=True):
+    """Flatten one stored record into an export row; email and phone are masked unless mask is False."""
+    log = record.get("conversation_log") or []
+    # Read before masking, which stamps the record with the current time
+    stored_at = record.get("stored_at") or (log[-1].get("timestamp") if log else None)
+    if mask and not record.get("email_hash") and not record.get("phone_hash"):
+        record = secure_candidate_record(record)
+    experience = record.get("experience")
+    tech_stack = record.get("tech_stack") or ""
+    technologies = taxonomy.matcher.technologies(tech_stack) if tech_stack else []
+
+    row = {
+        "source": source,
+        "record_id": str(record_id),
+        "full_name": record.get("full_name"),
+        "email": record.get("email"),
+        "phone": record.get("phone"),
+        "email_hash": record.get("email_hash"),
+        "phone_hash": record.get("phone_hash"),
+        "experience": experience,
+        "years_experience": extract_fields(experience, technologies=False).years if experience else None,
+        "desired_position": record.get("desired_position"),
+        "location": record.get("location"),
+        "tech_stack": tech_stack or None,
+        "technologies": ";".join(technologies) or None,
+        "messages": len(log),
+        "technical_responses": len(record.get("technical_responses") or []),
+        "started_at": log[0].get("timestamp") if log else None,
+        "stored_at": stored_at,
+    }
+    by_domain = {domain: [] for domain in domains}
+    for tech in technologies:
+        by_domain.setdefault(taxonomy.domain_of(tech), []).append(tech)
+    for domain in domains:
+        row[domain] = ";".join(by_domain[domain]) or None
+    return row
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class CSVExportWriter:
+    def __init__(self, path, columns):
+        opener = gzip.open if path.endswith(".gz") else open
+        self._file = opener(path, "wt", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=columns)
+        self._writer.writeheader()
+
+    def write_batch(self, rows):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetExportWriter:
+    def __init__(self, path, columns):
+        if pyarrow is None:
+            raise RuntimeError("Parquet export requires pyarrow; install it or export to .csv.gz")
+        int_columns = {"messages", "technical_responses"}
+        self.schema = pyarrow.schema([
+            (column, pyarrow.int32() if column in int_columns
+             else pyarrow.float64() if column == "years_experience" else pyarrow.string())
+            for column in columns
+        ])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self.schema, compression="zstd")
+
+    def write_batch(self, rows):
+        self._writer.write_table(pyarrow.Table.from_pylist(rows, schema=self.schema))
+
+    def close(self):
+        self._writer.close()
+
+
+def export_candidates(output, directories=(("candidates", "candidates"), ("secure_candidates", "secure_candidates")),
+                      sqlite_path=None, workers=8, batch_size=5000, mask=True):
+    """
+    Stream every stored record into output and return the number of rows written.
+    directories is a sequence of (path, source label) pairs. Email and phone
+    stored in plaintext are masked and hashed unless mask is False.
+    """
+    taxonomy = get_taxonomy()
+    domains = domain_columns(taxonomy)
+    columns = BASE_COLUMNS + domains
+
+    def records():
+        for directory, source in directories:
+            yield from scan_directory(directory, source, workers)
+        if sqlite_path:
+            yield from scan_sqlite(sqlite_path)
+
+    rows = (to_row(source, record_id, record, domains, taxonomy, mask) for source, record_id, record in records())
+    writer = ParquetExportWriter(output, columns) if output.endswith(".parquet") else CSVExportWriter(output, columns)
+    written = 0
+    try:
+        for batch in batched(rows, batch_size):
+            writer.write_batch(batch)
+            written += len(batch)
+    finally:
+        writer.close()
+    return written
+
+
+def read_export(path):
+    """Load an export into a pandas DataFrame for analysis."""
+    import pandas as pd
+
+    return pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export stored candidate records to Parquet or compressed CSV.")
+    parser.add_argument("--output", default="candidates_export.csv.gz",
+                        help="Output path; .parquet writes Parquet, anything else CSV (.gz compresses)")
+    parser.add_argument("--candidates-dir", default="candidates", help="Session snapshots from save_candidate_data")
+    parser.add_argument("--secure-dir", default="secure_candidates", help="Records from secure_store_candidate")
+    parser.add_argument("--sqlite", help="Also export a SQLiteCandidateStore database")
+    parser.add_argument("--workers", type=int, default=8, help="Threads reading and parsing record files")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows buffered per write")
+    parser.add_argument("--plaintext", action="store_true",
+                        help="Export email and phone from records stored in plaintext as-is instead of masking them")
+    args = parser.parse_args()
+
+    written = export_candidates(
+        args.output,
+        directories=[(args.candidates_dir, "candidates"), (args.secure_dir, "secure_candidates")],
+        sqlite_path=args.sqlite,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        mask=not args.plaintext
+    )
+    print(f"{written} candidate records written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
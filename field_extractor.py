@@ -0,0 +1,87 @@
+# field_extractor.py
+import re
+from collections import namedtuple
+
+from taxonomy import get_taxonomy
+
+EMAIL_REGEX = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+PHONE_REGEX = r'\b(?:\+\d{1,3}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b'
+EXPERIENCE_REGEX = r'(?i:(?P<years>\d+(?:\.\d+)?)\+?\s*(?:years?|yrs?))'
+# A location cue followed by capitalized place names: "based in New York, NY"
+LOCATION_REGEX = (
+    r"(?i:\b(?:based in|located in|living in|live in|i'm from|i am from|relocating to)\s+)"
+    r"(?P<place>[A-Z][\w.'-]*(?:,?\s[A-Z][\w.'-]*)*)"
+)
+
+# Compiled once at import; the individual patterns are also used for validation
+EMAIL_PATTERN = re.compile(EMAIL_REGEX)
+PHONE_PATTERN = re.compile(PHONE_REGEX)
+
+# All regex-based fields as named alternatives of one pattern, so a message is
+# scanned once. Alternatives are tried in order at each position, which makes
+# an email take precedence over the digits inside it.
+FIELD_PATTERN = re.compile(
+    f"(?P<email>{EMAIL_REGEX})"
+    f"|(?P<phone>{PHONE_REGEX})"
+    f"|(?P<experience>{EXPERIENCE_REGEX})"
+    f"|(?P<location>{LOCATION_REGEX})"
+)
+
+FieldMatch = namedtuple("FieldMatch", ["value", "start", "end"])
+
+
+class ExtractionResult:
+    """
+    Fields found in one message. Each regex field is a FieldMatch (value and
+    span) or None; technologies holds tech_matcher.TechMatch tuples.
+    """
+
+    __slots__ = ("email", "phone", "experience", "years", "location", "technologies")
+
+    def __init__(self):
+        self.email = None
+        self.phone = None
+        self.experience = None
+        self.years = None
+        self.location = None
+        self.technologies = []
+
+    def fields(self):
+        """Return the found fields as {field_name: value}."""
+        found = {
+            name: getattr(self, name).value
+            for name in ("email", "phone", "experience", "location")
+            if getattr(self, name) is not None
+        }
+        if self.technologies:
+            found["tech_stack"] = ", ".join(dict.fromkeys(match.technology for match in self.technologies))
+        return found
+
+    def __repr__(self):
+        return f"ExtractionResult({self.fields()!r})"
+
+
+def extract_fields(text, technologies=True, taxonomy=None):
+    """
+    Scan a message for email, phone, years of experience and location in a
+    single regex pass, then for known technologies with the taxonomy's
+    automaton (the process-wide taxonomy unless one is given).
+    The first match of each field wins.
+    """
+    result = ExtractionResult()
+    for match in FIELD_PATTERN.finditer(text):
+        field = match.lastgroup
+        if getattr(result, field) is not None:
+            continue
+        if field == "location":
+            place = match.group("place").rstrip(".")
+            start = match.start("place")
+            result.location = FieldMatch(place, start, start + len(place))
+        else:
+            setattr(result, field, FieldMatch(match.group(field), match.start(field), match.end(field)))
+            if field == "experience":
+                result.years = float(match.group("years"))
+
+    if technologies:
+        result.technologies = (taxonomy or get_taxonomy()).matcher.find(text)
+    return result
@@ -1,483 +1,819 @@
-
-import os
-import json
-from datetime import datetime
-import uuid
-from langchain.llms import OpenAI
-from langchain.promptimport os
-import json
-from datetime import datetime
-import uuid
-from langchain_groq import ChatGroq
-from langchain.chains import LLMChain
-import re
-from prompts import (GREETING_PROMPT, INFO_GATHERING_PROMPT, TECH_QUESTION_PROMPT,
-                    FOLLOW_UP_PROMPT, CLOSING_PROMPT, FALLBACK_PROMPT)
-
-class HiringAssistant:
-    def __init__(self, api_key):
-        self.llm = ChatGroq(
-            groq_api_key=api_key,
-            model_name="mixtral-8x7b-32768",
-            temperature=0.7,
-            max_tokens=500
-        )
-        
-        self.greeting_chain = LLMChain(llm=self.llm, prompt=GREETING_PROMPT, verbose=False, output_key="output")
-        self.info_gathering_chain = LLMChain(llm=self.llm, prompt=INFO_GATHERING_PROMPT, verbose=False, output_key="output")
-        self.tech_question_chain = LLMChain(llm=self.llm, prompt=TECH_QUESTION_PROMPT, verbose=False, output_key="output")
-        self.follow_up_chain = LLMChain(llm=self.llm, prompt=FOLLOW_UP_PROMPT, verbose=False, output_key="output")
-        self.closing_chain = LLMChain(llm=self.llm, prompt=CLOSING_PROMPT, verbose=False, output_key="output")
-        self.fallback_chain = LLMChain(llm=self.llm, prompt=FALLBACK_PROMPT, verbose=False, output_key="output")
-        
-        self.candidate_data = {
-            "full_name": None,
-            "email": None,
-            "phone": None,
-            "experience": None,
-            "desired_position": None,
-            "location": None,
-            "tech_stack": None,
-            "conversation_log": [],
-            "technical_responses": []
-        }
-        
-        self.state = {
-            "stage": "greeting",
-            "fields_collected": [],
-            "current_question": 0,
-            "total_questions": 0,
-            "questions_asked": []
-        }
-    
-    def extract_information(self, user_input):
-        if not self.candidate_data["email"] and "email" not in self.state["fields_collected"]:
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            email_match = re.search(email_pattern, user_input)
-            if email_match:
-                self.candidate_data["email"] = email_match.group(0)
-                self.state["fields_collected"].append("email")
-        
-        if not self.candidate_data["phone"] and "phone" not in self.state["fields_collected"]:
-            phone_pattern = r'\b(?:\+\d{1,3}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b'
-            phone_match = re.search(phone_pattern, user_input)
-            if phone_match:
-                self.candidate_data["phone"] = phone_match.group(0)
-                self.state["fields_collected"].append("phone")
-        
-        if not self.candidate_data["experience"] and "experience" not in self.state["fields_collected"]:
-            experience_pattern = r'(\d+)\s*(?:years?|yrs?)'
-            experience_match = re.search(experience_pattern, user_input.lower())
-            if experience_match:
-                self.candidate_data["experience"] = user_input
-                self.state["fields_collected"].append("experience")
-    
-    def get_remaining_fields(self):
-        all_fields = ["full_name", "email", "phone", "experience", "desired_position", "location", "tech_stack"]
-        return [field.replace("_", " ").title() for field in all_fields if field not in self.state["fields_collected"]]
-    
-    def update_conversation_log(self, role, content):
-        self.candidate_data["conversation_log"].append({
-            "role": role,
-            "content": content,
-            "timestamp": datetime.now().isoformat()
-        })
-    
-    def process_user_input(self, user_input):
-        print(f"Received user input: {user_input}")  # Debug print
-        exit_commands = ["exit", "quit", "bye", "goodbye", "end"]
-        if user_input.lower() in exit_commands or any(cmd in user_input.lower() for cmd in exit_commands):
-            return "Thank you for your time. The conversation has been ended. Have a great day!"
-        
-        self.extract_information(user_input)
-        self.update_conversation_log("user", user_input)
-        
-        chat_history = "\n".join([f"{entry['role']}: {entry['content']}" for entry in self.candidate_data["conversation_log"]])
-        
-        if self.state["stage"] == "greeting":
-            if "full_name" not in self.state["fields_collected"] and any(word in user_input.lower() for word in ["hello", "hi", "hey", "greetings"]):
-                response = self.greeting_chain.invoke({"chat_history": chat_history})["output"]
-            else:
-                self.candidate_data["full_name"] = user_input
-                self.state["fields_collected"].append("full_name")
-                self.state["stage"] = "info_gathering"
-                remaining_fields = self.get_remaining_fields()
-                response = self.info_gathering_chain.invoke({
-                    "chat_history": chat_history,
-                    "remaining_fields": ", ".join(remaining_fields)
-                })["output"]
-        
-        elif self.state["stage"] == "info_gathering":
-            remaining_fields = self.get_remaining_fields()
-            
-            if "full_name" not in self.state["fields_collected"]:
-                self.candidate_data["full_name"] = user_input
-                self.state["fields_collected"].append("full_name")
-            elif "email" not in self.state["fields_collected"] and "@" in user_input:
-                self.candidate_data["email"] = user_input
-                self.state["fields_collected"].append("email")
-            elif "phone" not in self.state["fields_collected"] and any(c.isdigit() for c in user_input):
-                self.candidate_data["phone"] = user_input
-                self.state["fields_collected"].append("phone")
-            elif "experience" not in self.state["fields_collected"] and "year" in user_input.lower():
-                self.candidate_data["experience"] = user_input
-                self.state["fields_collected"].append("experience")
-            elif "desired_position" not in self.state["fields_collected"]:
-                self.candidate_data["desired_position"] = user_input
-                self.state["fields_collected"].append("desired_position")
-            elif "location" not in self.state["fields_collected"]:
-                self.candidate_data["location"] = user_input
-                self.state["fields_collected"].append("location")
-            elif "tech_stack" not in self.state["fields_collected"]:
-                self.candidate_data["tech_stack"] = user_input
-                self.state["fields_collected"].append("tech_stack")
-            else:
-                response = self.fallback_chain.invoke({
-                    "chat_history": chat_history,
-                    "current_stage": self.state["stage"]
-                })["output"]
-                self.update_conversation_log("assistant", response)
-                return response
-            
-            remaining_fields = self.get_remaining_fields()
-            if len(remaining_fields) == 0:
-                self.state["stage"] = "tech_questions"
-                response = self.tech_question_chain.invoke({
-                    "chat_history": chat_history,
-                    "tech_stack": self.candidate_data["tech_stack"]
-                })["output"]
-                self.state["current_question"] = 1
-                self.state["total_questions"] = 3
-            else:
-                response = self.info_gathering_chain.invoke({
-                    "chat_history": chat_history,
-                    "remaining_fields": ", ".join(remaining_fields)
-                })["output"]
-        
-        elif self.state["stage"] == "tech_questions":
-            self.candidate_data["technical_responses"].append({
-                "question_number": self.state["current_question"],
-                "response": user_input
-            })
-            
-            if self.state["current_question"] >= self.state["total_questions"]:
-                self.state["stage"] = "closing"
-                response = self.closing_chain.invoke({
-                    "chat_history": chat_history,
-                    "candidate_name": self.candidate_data["full_name"]
-                })["output"]
-            else:
-                self.state["current_question"] += 1
-                response = self.follow_up_chain.invoke({
-                    "chat_history": chat_history,
-                    "tech_stack": self.candidate_data["tech_stack"],
-                    "question_number": self.state["current_question"],
-                    "total_questions": self.state["total_questions"]
-                })["output"]
-        
-        elif self.state["stage"] == "closing":
-            response = "Thank you again for your time. A recruiter from TalentScout will be in touch soon if your profile matches our current openings."
-        
-        else:
-            response = self.fallback_chain.invoke({
-                "chat_history": chat_history,
-                "current_stage": self.state["stage"]
-            })["output"]
-        
-        self.update_conversation_log("assistant", response)
-        return response
-    
-    def save_candidate_data(self):
-        if self.candidate_data["full_name"]:
-            safe_name = "".join(c for c in self.candidate_data["full_name"] if c.isalnum() or c.isspace()).replace(" ", "_").lower()
-            filename = f"candidates/{safe_name}_{uuid.uuid4().hex[:8]}.json"
-            os.makedirs("candidates", exist_ok=True)
-            with open(filename, "w") as f:
-                json.dump(self.candidate_data, f, indent=2)
-
-    def get_conversation_history(self):
-        return self.candidate_data["conversation_log"]
-
-if __name__ == "__main__":
-    api_key = "your-groq-api-key-here"
-    assistant = HiringAssistant(api_key)
-    print("Welcome to TalentScout's Hiring Assistant!")
-    while True:
-        user_input = input("You: ")
-        response = assistant.process_user_input(user_input)
-        print(f"Assistant: {response}")s import PromptTemplate
-from langchain.chains import LLMChain
-from langchain.memory import ConversationBufferMemory
-# ... rest of your imports
-from prompts import (
-    SYSTEM_PROMPT,
-    GREETING_PROMPT,
-    INFO_GATHERING_PROMPT,
-    TECH_QUESTION_PROMPT,
-    FOLLOW_UP_PROMPT,
-    CLOSING_PROMPT,
-    FALLBACK_PROMPT
-)
-
-class HiringAssistant:
-    def __init__(self, api_key):
-        """Initialize the hiring assistant with API key and conversation state."""
-        # os.environ[""] = api_key
-        os.environ["OPENAI_API_KEY"] = ""
-
-        # Initialize the language model
-        self.llm = OpenAI(temperature=0.7)
-        
-        # Initialize conversation memory
-        self.memory = ConversationBufferMemory(return_messages=True, output_key="output")
-        
-        # Create chains for different conversation stages
-        self.greeting_chain = LLMChain(
-            llm=self.llm,
-            prompt=GREETING_PROMPT,
-            verbose=True,
-            memory=self.memory,
-            output_key="output"
-        )
-        
-        self.info_gathering_chain = LLMChain(
-            llm=self.llm,
-            prompt=INFO_GATHERING_PROMPT,
-            verbose=True,
-            memory=self.memory,
-            output_key="output"
-        )
-        
-        self.tech_question_chain = LLMChain(
-            llm=self.llm,
-            prompt=TECH_QUESTION_PROMPT,
-            verbose=True,
-            memory=self.memory,
-            output_key="output"
-        )
-        
-        self.follow_up_chain = LLMChain(
-            llm=self.llm,
-            prompt=FOLLOW_UP_PROMPT,
-            verbose=True,
-            memory=self.memory,
-            output_key="output"
-        )
-        
-        self.closing_chain = LLMChain(
-            llm=self.llm,
-            prompt=CLOSING_PROMPT,
-            verbose=True,
-            memory=self.memory,
-            output_key="output"
-        )
-        
-        self.fallback_chain = LLMChain(
-            llm=self.llm,
-            prompt=FALLBACK_PROMPT,
-            verbose=True,
-            memory=self.memory,
-            output_key="output"
-        )
-        
-        # Initialize candidate data structure
-        self.candidate_data = {
-            "full_name": None,
-            "email": None,
-            "phone": None,
-            "experience": None,
-            "desired_position": None,
-            "location": None,
-            "tech_stack": None,
-            "conversation_log": [],
-            "technical_responses": []
-        }
-        
-        # Conversation state management
-        self.state = {
-            "stage": "greeting",  # greeting, info_gathering, tech_questions, closing
-            "fields_collected": [],
-            "current_question": 0,
-            "total_questions": 0,
-            "questions_asked": []
-        }
-    
-    def extract_information(self, user_input):
-        """
-        Extract candidate information from user input using pattern matching and NLP.
-        This is a simplified version - in a production system, you would use more 
-        sophisticated NLP techniques or entity extraction.
-        """
-        # This is a placeholder for more sophisticated information extraction
-        # In a real system, you would use NER models or regex patterns
-        
-        # Simple email extraction
-        import re
-        
-        # Email pattern
-        if not self.candidate_data["email"] and "email" not in self.state["fields_collected"]:
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            email_match = re.search(email_pattern, user_input)
-            if email_match:
-                self.candidate_data["email"] = email_match.group(0)
-                self.state["fields_collected"].append("email")
-        
-        # Phone pattern
-        if not self.candidate_data["phone"] and "phone" not in self.state["fields_collected"]:
-            phone_pattern = r'\b(?:\+\d{1,3}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b'
-            phone_match = re.search(phone_pattern, user_input)
-            if phone_match:
-                self.candidate_data["phone"] = phone_match.group(0)
-                self.state["fields_collected"].append("phone")
-        
-        # For other fields, we'll rely on the conversation flow to collect them explicitly
-        # This is because free-form text requires more context to properly extract information
-    
-    def get_remaining_fields(self):
-        """Get the list of fields that still need to be collected."""
-        all_fields = ["full_name", "email", "phone", "experience", "desired_position", "location", "tech_stack"]
-        return [field.replace("_", " ").title() for field in all_fields if field not in self.state["fields_collected"]]
-    
-    def update_conversation_log(self, role, content):
-        """Update the conversation log with a new message."""
-        self.candidate_data["conversation_log"].append({
-            "role": role,
-            "content": content,
-            "timestamp": datetime.now().isoformat()
-        })
-    
-    def process_user_input(self, user_input):
-        """Process user input based on current conversation state and return assistant response."""
-        # Check for exit commands
-        exit_commands = ["exit", "quit", "bye", "goodbye", "end"]
-        if user_input.lower() in exit_commands or any(cmd in user_input.lower() for cmd in exit_commands):
-            return "Thank you for your time. The conversation has been ended. Have a great day!"
-        
-        # Extract any information from the input
-        self.extract_information(user_input)
-        
-        # Update conversation log
-        self.update_conversation_log("user", user_input)
-        
-        # Get chat history for context
-        chat_history = "\n".join([f"{entry['role']}: {entry['content']}" for entry in self.candidate_data["conversation_log"]])
-        
-        # Process based on current stage
-        if self.state["stage"] == "greeting":
-            # After greeting, move to info gathering
-            if "full_name" not in self.state["fields_collected"] and any(word in user_input.lower() for word in ["hello", "hi", "hey", "greetings"]):
-                # Still in greeting phase
-                response = self.greeting_chain.run(chat_history=chat_history)
-            else:
-                # Extract name from first response if possible
-                self.candidate_data["full_name"] = user_input
-                self.state["fields_collected"].append("full_name")
-                self.state["stage"] = "info_gathering"
-                remaining_fields = self.get_remaining_fields()
-                response = self.info_gathering_chain.run(
-                    chat_history=chat_history,
-                    remaining_fields=", ".join(remaining_fields)
-                )
-        
-        elif self.state["stage"] == "info_gathering":
-            # Check if we've collected all required information
-            remaining_fields = self.get_remaining_fields()
-            
-            # Update fields based on latest response
-            if "email" not in self.state["fields_collected"] and "@" in user_input:
-                self.candidate_data["email"] = user_input
-                self.state["fields_collected"].append("email")
-            elif "phone" not in self.state["fields_collected"] and any(c.isdigit() for c in user_input):
-                self.candidate_data["phone"] = user_input
-                self.state["fields_collected"].append("phone")
-            elif "experience" not in self.state["fields_collected"] and any(c.isdigit() for c in user_input) and "year" in user_input.lower():
-                self.candidate_data["experience"] = user_input
-                self.state["fields_collected"].append("experience")
-            elif "desired_position" not in self.state["fields_collected"]:
-                self.candidate_data["desired_position"] = user_input
-                self.state["fields_collected"].append("desired_position")
-            elif "location" not in self.state["fields_collected"]:
-                self.candidate_data["location"] = user_input
-                self.state["fields_collected"].append("location")
-            elif "tech_stack" not in self.state["fields_collected"]:
-                self.candidate_data["tech_stack"] = user_input
-                self.state["fields_collected"].append("tech_stack")
-            
-            # Check if we've collected all fields
-            if len(self.get_remaining_fields()) == 0:
-                # Move to technical questions
-                self.state["stage"] = "tech_questions"
-                response = self.tech_question_chain.run(
-                    chat_history=chat_history,
-                    tech_stack=self.candidate_data["tech_stack"]
-                )
-                self.state["current_question"] = 1
-                self.state["total_questions"] = 3  # Default to 3 questions
-            else:
-                # Continue gathering information
-                response = self.info_gathering_chain.run(
-                    chat_history=chat_history,
-                    remaining_fields=", ".join(remaining_fields)
-                )
-        
-        elif self.state["stage"] == "tech_questions":
-            # Record technical response
-            self.candidate_data["technical_responses"].append({
-                "question_number": self.state["current_question"],
-                "response": user_input
-            })
-            
-            # Check if we've asked all questions
-            if self.state["current_question"] >= self.state["total_questions"]:
-                # Move to closing
-                self.state["stage"] = "closing"
-                response = self.closing_chain.run(
-                chat_history=chat_history,
-                candidate_name=self.candidate_data["full_name"]
-                )
-            else:
-                # Ask next technical question
-                self.state["current_question"] += 1
-                response = self.follow_up_chain.run(
-                    chat_history=chat_history,
-                    tech_stack=self.candidate_data["tech_stack"],
-                    question_number=self.state["current_question"],
-                    total_questions=self.state["total_questions"]
-                )
-        
-        elif self.state["stage"] == "closing":
-            # After closing, any additional input will get a standard response
-            response = "Thank you again for your time. A recruiter from TalentScout will be in touch soon if your profile matches our current openings."
-        
-        else:
-            # Fallback for unexpected states
-            response = self.fallback_chain.run(
-                chat_history=chat_history,
-                current_stage=self.state["stage"]
-            )
-        
-        # Update conversation log with assistant response
-        self.update_conversation_log("assistant", response)
-        
-        # Save candidate data to disk
-        self.save_candidate_data()
-        
-        return response
-    
-    def save_candidate_data(self):
-        """Save candidate data to a JSON file."""
-        if self.candidate_data["full_name"]:
-            # Create a safe filename from candidate name
-            safe_name = "".join(c for c in self.candidate_data["full_name"] if c.isalnum() or c.isspace()).replace(" ", "_").lower()
-            filename = f"candidates/{safe_name}_{uuid.uuid4().hex[:8]}.json"
-            
-            # Ensure directory exists
-            os.makedirs("candidates", exist_ok=True)
-            
-            # Write data to file
-            with open(filename, "w") as f:
-                json.dump(self.candidate_data, f, indent=2)
-
-    def get_conversation_history(self):
-        """Return the conversation history for display purposes."""
-        return self.candidate_data["conversation_log"]
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+import json
+import logging
+import threading
+import time
+import uuid
+import prompts
+from prompts import FIELD_QUESTION_TEMPLATES, MULTI_FIELD_ACKNOWLEDGEMENT, PREFETCHED_QUESTION_TEMPLATE
+from conversation_memory import ConversationMemory, estimate_tokens
+from llm_cache import make_cache_key
+from candidate_journal import SessionJournal, safe_filename
+from field_extractor import extract_fields
+from llm_factory import get_chains, get_chat_model
+from llm_gateway import get_gateway
+from models import CandidateProfile, ConversationState, Message
+from instrumentation import ChainCall, StageTurn
+
+logger = logging.getLogger(__name__)
+
+# Token budget for the chat history rendered into each chain's prompt.
+# Stages that only need recent context get a smaller window.
+HISTORY_TOKEN_BUDGETS = {
+    "greeting": 256,
+    "info_gathering": 768,
+    "tech_question": 1024,
+    "follow_up": 1536,
+    "closing": 512,
+    "fallback": 768
+}
+
+# Chains whose responses may be served from the response cache, and the prompt
+# variables that key them. Only chains whose prompts carry nothing personal are
+# listed: the greeting's history is the same opening message for every candidate,
+# while the other prompts render the candidate's own history and details.
+CACHEABLE_CHAINS = {
+    "greeting": ("chat_history",)
+}
+
+# Chain name -> prompt in prompts.py. Prompts are looked up when the first
+# assistant is built, which keeps langchain out of this module's import.
+ASSISTANT_PROMPTS = {
+    "greeting": "GREETING_PROMPT",
+    "info_gathering": "INFO_GATHERING_PROMPT",
+    "tech_question": "TECH_QUESTION_PROMPT",
+    "follow_up": "FOLLOW_UP_PROMPT",
+    "closing": "CLOSING_PROMPT",
+    "fallback": "FALLBACK_PROMPT",
+    "extraction": "STRUCTURED_EXTRACTION_PROMPT",
+    "next_question": "NEXT_QUESTION_PROMPT"
+}
+
+REQUIRED_FIELDS = ["full_name", "email", "phone", "experience", "desired_position", "location", "tech_stack"]
+
+# Answers containing these get a tailored follow-up instead of a prefetched question
+UNCERTAIN_ANSWER_PHRASES = ("not sure", "don't know", "dont know", "no idea", "never used", "haven't used",
+                            "not familiar", "can you explain", "could you explain")
+
+QUESTION_STARTERS = ("why", "what", "how", "who", "when", "where", "which", "can", "could", "do", "does", "is", "are", "should")
+
+# Bumped whenever the layout produced by HiringAssistant.snapshot() changes;
+# restore() also reads every version listed in READABLE_SNAPSHOT_VERSIONS
+SNAPSHOT_VERSION = 2
+READABLE_SNAPSHOT_VERSIONS = (1, 2)
+
+_prefetch_executor = None
+_prefetch_executor_lock = threading.Lock()
+
+
+def get_prefetch_executor():
+    """Thread pool shared by all sessions for speculative question generation."""
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        with _prefetch_executor_lock:
+            if _prefetch_executor is None:
+                _prefetch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="question-prefetch")
+    return _prefetch_executor
+
+EXIT_MESSAGE = "Thank you for your time. The conversation has been ended. Have a great day!"
+
+class HiringAssistant:
+    def __init__(self, api_key, history_token_budgets=None, templated_intake=True, response_cache=None,
+                 journal_dir="candidates", compact_every=10, structured_intake=True, llm=None,
+                 metrics=None, prefetch_questions=False, prefetch_timeout=30, call_guard=None,
+                 gateway=None):
+        """
+        Initialize the hiring assistant with API key and conversation state.
+        The chat model client is shared by all assistants with the same API key
+        unless an llm is passed in.
+        """
+        self.llm = llm or get_chat_model(api_key)
+
+        # Chains are immutable and built once per client in the process-wide
+        # registry; constructing an assistant only allocates per-candidate state
+        assistant_prompts = {chain: getattr(prompts, name) for chain, name in ASSISTANT_PROMPTS.items()}
+        self.chains = get_chains(self.llm, assistant_prompts, verbose=False, output_key="output")
+        self.greeting_chain = self.chains["greeting"]
+        self.info_gathering_chain = self.chains["info_gathering"]
+        self.tech_question_chain = self.chains["tech_question"]
+        self.follow_up_chain = self.chains["follow_up"]
+        self.closing_chain = self.chains["closing"]
+        self.fallback_chain = self.chains["fallback"]
+        self.extraction_chain = self.chains["extraction"]
+
+        # Rolling chat history used to build prompts; the full transcript
+        # stays in candidate_data["conversation_log"]
+        self.memory = ConversationMemory(token_budgets=history_token_budgets or HISTORY_TOKEN_BUDGETS)
+
+        # Answer routine intake turns from FIELD_QUESTION_TEMPLATES instead of the LLM
+        self.templated_intake = templated_intake
+
+        # Fill every field found in a multi-field message (patterns first, then
+        # one structured LLM call) instead of one field per turn
+        self.structured_intake = structured_intake
+
+        # Optional llm_cache.ResponseCache, usually shared across sessions
+        self.response_cache = response_cache
+
+        # Optional instrumentation.MetricsSink receiving per-chain and per-turn events
+        self.metrics = metrics
+
+        # Generate the next technical question in the background while the
+        # candidate answers the current one; see _start_question_prefetch
+        self.prefetch_questions = prefetch_questions
+        self.prefetch_timeout = prefetch_timeout
+        self._prefetch = None
+
+        # Optional callable taking the chain name and returning a context manager
+        # held around each blocking LLM call, e.g. a cross-process concurrency
+        # limit or rate limiter (see batch_screening.py)
+        self.call_guard = call_guard
+
+        # Rate limiting, retries with backoff, circuit breaking and coalescing of
+        # identical in-flight calls; by default shared by every assistant using
+        # this API key (see llm_gateway.py)
+        self.gateway = gateway or get_gateway(api_key)
+
+        # Slotted records with dict-style access; see models.py
+        self.candidate_data = CandidateProfile()
+        self.state = ConversationState()
+
+        # Append-only journal of turns, compacted into a snapshot every
+        # compact_every turns and when the closing stage is entered; None disables it
+        self.session_id = uuid.uuid4().hex
+        self.journal = SessionJournal(self.session_id, journal_dir) if journal_dir else None
+        self.compact_every = compact_every
+        self._turns_since_compaction = 0
+        self._journaled_fields = {}
+        self._journaled_responses = 0
+        self._journaled_stage = self.state["stage"]
+
+    def extract_information(self, user_input):
+        """Extract candidate information from user input using pattern matching."""
+        wanted = [field for field in ("email", "phone", "experience")
+                  if not self.candidate_data[field] and field not in self.state["fields_collected"]]
+        if not wanted:
+            return
+
+        extracted = extract_fields(user_input, technologies=False)
+        for field in wanted:
+            match = getattr(extracted, field)
+            if match:
+                # Experience keeps the candidate's full answer for context
+                self.candidate_data[field] = user_input if field == "experience" else match.value
+                self.state["fields_collected"].append(field)
+
+    def get_remaining_field_keys(self):
+        """Get the keys of fields that still need to be collected, in asking order."""
+        return [field for field in REQUIRED_FIELDS if field not in self.state["fields_collected"]]
+
+    def get_remaining_fields(self):
+        """Get the list of fields that still need to be collected."""
+        return [field.replace("_", " ").title() for field in self.get_remaining_field_keys()]
+
+    def is_routine_answer(self, user_input):
+        """
+        Heuristic for a plain, on-script answer to an intake question.
+        Questions and long free-form messages are left to the LLM.
+        """
+        text = user_input.strip().lower()
+        if not text or "?" in text:
+            return False
+        if text.split()[0] in QUESTION_STARTERS:
+            return False
+        return len(text.split()) <= 40
+
+    def _templated_intake_response(self, collected_before, expected_field, user_input):
+        """
+        Return the templated question for the next field if this turn was routine:
+        the candidate supplied exactly the field we asked for. Returns None otherwise.
+        """
+        if not self.templated_intake or not self.is_routine_answer(user_input):
+            return None
+        if self.state["fields_collected"][collected_before:] != [expected_field]:
+            return None
+        remaining = self.get_remaining_field_keys()
+        if not remaining:
+            return None
+        return " ".join(FIELD_QUESTION_TEMPLATES[remaining[0]]).strip()
+
+    def looks_multi_field(self, extracted, expected_field):
+        """
+        Heuristic for a message that carries several intake fields at once: it
+        provides a field other than the one just asked for (expected_field).
+        """
+        fields = extracted.fields()
+        if expected_field != "tech_stack":
+            # Technologies named in another field's answer (e.g. experience) aren't a tech stack
+            fields.pop("tech_stack", None)
+        return any(field != expected_field for field in fields)
+
+    def _set_field(self, field, value):
+        self.candidate_data[field] = value
+        self.state["fields_collected"].append(field)
+
+    def _extract_fields_with_llm(self, user_input, fields):
+        """Ask the LLM for the given fields as JSON; returns {field: value} for those it found."""
+        output = self._run_chain("extraction", {"message": user_input, "fields": ", ".join(fields)})
+        start, end = output.find("{"), output.rfind("}")
+        try:
+            data = json.loads(output[start:end + 1]) if start != -1 else {}
+        except ValueError:
+            return {}
+        return {field: str(data[field]).strip() for field in fields
+                if isinstance(data.get(field), (str, int, float)) and str(data[field]).strip()}
+
+    def _fill_fields_from_message(self, user_input, expected_field):
+        """
+        Structured intake: fill every remaining field a multi-field message provides.
+        Pattern matching runs first; whatever it can't find is requested from the
+        LLM in a single JSON extraction call. expected_field is the field asked
+        for before this turn's answer was stored. Returns the newly filled field
+        keys, or None when the message isn't a multi-field message.
+        """
+        remaining = self.get_remaining_field_keys()
+        if not self.structured_intake or not remaining:
+            return None
+        extracted = extract_fields(user_input)
+        if not self.looks_multi_field(extracted, expected_field):
+            return None
+
+        filled = []
+        for field, value in extracted.fields().items():
+            if field == "tech_stack" and expected_field != "tech_stack":
+                # Matched technologies may be a fragment of another field's answer;
+                # the LLM extraction below sees the whole message instead
+                continue
+            if field in remaining:
+                self._set_field(field, value)
+                filled.append(field)
+            elif field != expected_field and self.candidate_data.get(field) == user_input:
+                # Store just the matched value rather than the whole message; the
+                # answer to the question asked keeps its full text
+                self.candidate_data[field] = value
+        missing = [field for field in remaining if field not in filled]
+        if missing:
+            for field, value in self._extract_fields_with_llm(user_input, missing).items():
+                self._set_field(field, value)
+                filled.append(field)
+        return filled
+
+    def _next_intake_step(self, collected_before, expected_field, user_input, structured):
+        """Decide the response after intake fields were updated for this turn."""
+        remaining_fields = self.get_remaining_fields()
+        if len(remaining_fields) == 0:
+            self.state["stage"] = "tech_questions"
+            self.state["current_question"] = 1
+            self.state["total_questions"] = 3
+            return "tech_question", {
+                "chat_history": self.memory.render("tech_question"),
+                "tech_stack": self.candidate_data["tech_stack"]
+            }
+        if structured and self.templated_intake:
+            new_fields = self.state["fields_collected"][collected_before:]
+            labels = [field.replace("_", " ") for field in new_fields]
+            listed = labels[0] if len(labels) == 1 else ", ".join(labels[:-1]) + " and " + labels[-1]
+            acknowledgement = MULTI_FIELD_ACKNOWLEDGEMENT.format(fields=listed)
+            return None, acknowledgement + " " + FIELD_QUESTION_TEMPLATES[self.get_remaining_field_keys()[0]][1]
+        templated = self._templated_intake_response(collected_before, expected_field, user_input)
+        if templated:
+            return None, templated
+        return "info_gathering", {
+            "chat_history": self.memory.render("info_gathering"),
+            "remaining_fields": ", ".join(remaining_fields)
+        }
+
+    def update_conversation_log(self, role, content):
+        """Update the conversation log with a new message."""
+        self.candidate_data["conversation_log"].append(Message(role, content))
+        self.memory.append(role, content)
+
+    def warrants_follow_up(self, user_input):
+        """
+        Heuristic for an answer that the next question should respond to:
+        very short, uncertain, or a question back to the interviewer.
+        """
+        text = user_input.strip().lower()
+        return len(text.split()) < 6 or "?" in text or any(phrase in text for phrase in UNCERTAIN_ANSWER_PHRASES)
+
+    def _start_question_prefetch(self):
+        """
+        Start generating the next technical question in the background, right
+        after the current one has been shown to the candidate.
+        """
+        next_question = self.state["current_question"] + 1
+        if next_question > self.state["total_questions"]:
+            return
+        payload = {
+            "tech_stack": self.candidate_data["tech_stack"],
+            "question_number": next_question,
+            "total_questions": self.state["total_questions"],
+            "previous_questions": "\n".join(f"- {question}" for question in self.state["questions_asked"])
+        }
+        future = get_prefetch_executor().submit(self._run_chain, "next_question", payload)
+        self._prefetch = (next_question, future)
+
+    def _take_prefetched_question(self, user_input):
+        """
+        Return the prefetched question for the current question number, or None
+        when there is none, it failed, or the answer warrants a tailored follow-up
+        (in which case the prefetch is cancelled and the follow-up chain runs).
+        """
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is None:
+            return None
+        question_number, future = prefetch
+        if question_number != self.state["current_question"] or self.warrants_follow_up(user_input):
+            future.cancel()
+            return None
+        try:
+            question = future.result(timeout=self.prefetch_timeout).strip()
+        except Exception:
+            future.cancel()
+            return None
+        return question or None
+
+    def _complete_turn(self, user_input, response):
+        """Log the assistant response and persist the turn."""
+        self.update_conversation_log("assistant", response)
+        if self.state["stage"] == "tech_questions":
+            # Every response in this stage presents a question
+            self.state["questions_asked"].append(response)
+            if self.prefetch_questions:
+                self._start_question_prefetch()
+        if self.journal is None:
+            return
+
+        changed_fields = {}
+        for field in REQUIRED_FIELDS:
+            if self.candidate_data[field] != self._journaled_fields.get(field):
+                changed_fields[field] = self.candidate_data[field]
+        self._journaled_fields.update(changed_fields)
+        new_responses = self.candidate_data["technical_responses"][self._journaled_responses:]
+        self._journaled_responses += len(new_responses)
+
+        user_message, assistant_message = self.candidate_data["conversation_log"][-2:]
+        self.journal.append({
+            "turn": self.memory.turn,
+            "stage": self.state["stage"],
+            "user": user_input,
+            "assistant": response,
+            "user_timestamp": user_message.isoformat(),
+            "timestamp": assistant_message.isoformat(),
+            "fields": changed_fields,
+            "technical_responses": new_responses,
+            "state": self.state.to_dict()
+        })
+
+        entered_closing = self.state["stage"] == "closing" and self._journaled_stage != "closing"
+        self._journaled_stage = self.state["stage"]
+        self._turns_since_compaction += 1
+        if entered_closing or self._turns_since_compaction >= self.compact_every:
+            self.save_candidate_data()
+
+    def is_exit_command(self, user_input):
+        """Check whether the candidate asked to end the conversation."""
+        exit_commands = ["exit", "quit", "bye", "goodbye", "end"]
+        return user_input.lower() in exit_commands or any(cmd in user_input.lower() for cmd in exit_commands)
+
+    def _plan_response(self, user_input):
+        """
+        Record the user message, advance the conversation state and decide how to respond.
+        Returns (chain_name, chain_inputs) when the response needs an LLM call,
+        or (None, response_text) when it is fixed.
+        """
+        collected_before = len(self.state["fields_collected"])
+        remaining_before = self.get_remaining_field_keys()
+        expected_field = remaining_before[0] if remaining_before else None
+        self.extract_information(user_input)
+        extracted = len(self.state["fields_collected"]) > collected_before
+        self.update_conversation_log("user", user_input)
+
+        if self.state["stage"] == "greeting":
+            if "full_name" not in self.state["fields_collected"] and any(word in user_input.lower() for word in ["hello", "hi", "hey", "greetings"]):
+                return "greeting", {"chat_history": self.memory.render("greeting")}
+
+            structured = self._fill_fields_from_message(user_input, "full_name")
+            if "full_name" not in self.state["fields_collected"] and structured is None:
+                # Only a single-field message can be taken as the name verbatim;
+                # otherwise the name is asked for next
+                self._set_field("full_name", user_input)
+            self.state["stage"] = "info_gathering"
+            return self._next_intake_step(collected_before, "full_name", user_input, structured)
+
+        elif self.state["stage"] == "info_gathering":
+            structured = self._fill_fields_from_message(user_input, expected_field)
+            if extracted or structured:
+                # Pattern matching or structured extraction already took this
+                # turn's answer; don't also store the message in the next empty field
+                pass
+            elif "full_name" not in self.state["fields_collected"]:
+                self.candidate_data["full_name"] = user_input
+                self.state["fields_collected"].append("full_name")
+            elif "email" not in self.state["fields_collected"] and "@" in user_input:
+                self.candidate_data["email"] = user_input
+                self.state["fields_collected"].append("email")
+            elif "phone" not in self.state["fields_collected"] and any(c.isdigit() for c in user_input):
+                self.candidate_data["phone"] = user_input
+                self.state["fields_collected"].append("phone")
+            elif "experience" not in self.state["fields_collected"] and "year" in user_input.lower():
+                self.candidate_data["experience"] = user_input
+                self.state["fields_collected"].append("experience")
+            elif "desired_position" not in self.state["fields_collected"]:
+                self.candidate_data["desired_position"] = user_input
+                self.state["fields_collected"].append("desired_position")
+            elif "location" not in self.state["fields_collected"]:
+                self.candidate_data["location"] = user_input
+                self.state["fields_collected"].append("location")
+            elif "tech_stack" not in self.state["fields_collected"]:
+                self.candidate_data["tech_stack"] = user_input
+                self.state["fields_collected"].append("tech_stack")
+            else:
+                return "fallback", {
+                    "chat_history": self.memory.render("fallback"),
+                    "current_stage": self.state["stage"]
+                }
+
+            return self._next_intake_step(collected_before, expected_field, user_input, structured)
+
+        elif self.state["stage"] == "tech_questions":
+            self.candidate_data["technical_responses"].append({
+                "question_number": self.state["current_question"],
+                "response": user_input
+            })
+
+            if self.state["current_question"] >= self.state["total_questions"]:
+                self.state["stage"] = "closing"
+                return "closing", {
+                    "chat_history": self.memory.render("closing"),
+                    "candidate_name": self.candidate_data["full_name"]
+                }
+            self.state["current_question"] += 1
+            prefetched = self._take_prefetched_question(user_input)
+            if prefetched:
+                return None, PREFETCHED_QUESTION_TEMPLATE.format(
+                    question_number=self.state["current_question"],
+                    total_questions=self.state["total_questions"],
+                    question=prefetched
+                )
+            return "follow_up", {
+                "chat_history": self.memory.render("follow_up"),
+                "tech_stack": self.candidate_data["tech_stack"],
+                "question_number": self.state["current_question"],
+                "total_questions": self.state["total_questions"]
+            }
+
+        elif self.state["stage"] == "closing":
+            return None, "Thank you again for your time. A recruiter from TalentScout will be in touch soon if your profile matches our current openings."
+
+        return "fallback", {
+            "chat_history": self.memory.render("fallback"),
+            "current_stage": self.state["stage"]
+        }
+
+    def _cache_key(self, chain_name, payload):
+        """Return the response cache key for a chain call, or None if it isn't cacheable."""
+        if self.response_cache is None or chain_name not in CACHEABLE_CHAINS:
+            return None
+        variables = {name: payload[name] for name in CACHEABLE_CHAINS[chain_name]}
+        return make_cache_key(self.chains[chain_name].prompt.template, variables)
+
+    def _cached_response(self, cache_key):
+        if cache_key is None:
+            return None
+        return self.response_cache.get(cache_key)
+
+    def _cache_response(self, cache_key, response):
+        if cache_key is not None:
+            self.response_cache.set(cache_key, response)
+
+    def _record_chain_call(self, chain_name, payload, response, started, cache_hit=False, error=None):
+        if self.metrics is None:
+            return
+        prompt_tokens = 0 if cache_hit else estimate_tokens(self.chains[chain_name].prompt.format(**payload))
+        self.metrics.chain_call(ChainCall(
+            chain_name, self.state["stage"], time.perf_counter() - started, prompt_tokens,
+            estimate_tokens(response), cache_hit, repr(error) if error else None
+        ))
+
+    def _guarded(self, chain_name):
+        return self.call_guard(chain_name) if self.call_guard else nullcontext()
+
+    @asynccontextmanager
+    async def _aguarded(self, chain_name):
+        """
+        Hold call_guard around an async LLM call. Entering a guard may block
+        (waiting for a slot or a rate limit), so that happens on a worker thread.
+        """
+        if self.call_guard is None:
+            yield
+            return
+        guard = self.call_guard(chain_name)
+        entering = asyncio.ensure_future(asyncio.to_thread(guard.__enter__))
+        try:
+            await asyncio.shield(entering)
+        except asyncio.CancelledError:
+            # The worker thread may still acquire the guard; release it once it has
+            entering.add_done_callback(
+                lambda future: future.cancelled() or future.exception() or guard.__exit__(None, None, None))
+            raise
+        # Exiting only releases what was acquired, so it runs on the event loop
+        try:
+            yield
+        except BaseException as exc:
+            if not guard.__exit__(type(exc), exc, exc.__traceback__):
+                raise
+        else:
+            guard.__exit__(None, None, None)
+
+    def _flight_key(self, chain_name, payload):
+        """Key under which identical in-flight calls to the same model are coalesced."""
+        return id(self.llm), make_cache_key(self.chains[chain_name].prompt.template, payload)
+
+    def _invoke_chain(self, chain_name, payload):
+        with self._guarded(chain_name):
+            return self.chains[chain_name].invoke(payload)["output"]
+
+    def _run_chain(self, chain_name, payload):
+        """Return the chain's response, from the response cache when possible."""
+        started = time.perf_counter()
+        cache_key = self._cache_key(chain_name, payload)
+        response = self._cached_response(cache_key)
+        if response is not None:
+            self._record_chain_call(chain_name, payload, response, started, cache_hit=True)
+            return response
+        try:
+            response = self.gateway.call(lambda: self._invoke_chain(chain_name, payload),
+                                         key=self._flight_key(chain_name, payload))
+        except Exception as exc:
+            self._record_chain_call(chain_name, payload, None, started, error=exc)
+            raise
+        self._record_chain_call(chain_name, payload, response, started)
+        self._cache_response(cache_key, response)
+        return response
+
+    def _stream_chain(self, chain_name, prompt):
+        with self._guarded(chain_name):
+            yield from self.llm.stream(prompt)
+
+    async def _ainvoke_chain(self, chain_name, payload):
+        async with self._aguarded(chain_name):
+            return (await self.chains[chain_name].ainvoke(payload))["output"]
+
+    async def _astream_chain(self, chain_name, prompt):
+        async with self._aguarded(chain_name):
+            async for chunk in self.llm.astream(prompt):
+                yield chunk
+
+    async def _arun_chain(self, chain_name, payload):
+        """Async variant of _run_chain."""
+        started = time.perf_counter()
+        cache_key = self._cache_key(chain_name, payload)
+        response = self._cached_response(cache_key)
+        if response is not None:
+            self._record_chain_call(chain_name, payload, response, started, cache_hit=True)
+            return response
+        try:
+            response = await self.gateway.acall(lambda: self._ainvoke_chain(chain_name, payload),
+                                                key=self._flight_key(chain_name, payload))
+        except Exception as exc:
+            self._record_chain_call(chain_name, payload, None, started, error=exc)
+            raise
+        self._record_chain_call(chain_name, payload, response, started)
+        self._cache_response(cache_key, response)
+        return response
+
+    @contextmanager
+    def _timed_turn(self):
+        """Record a StageTurn for the turn processed inside the block."""
+        if self.metrics is None:
+            yield
+            return
+        stage = self.state["stage"]
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception as exc:
+            self.metrics.stage_turn(StageTurn(stage, self.state["stage"], time.perf_counter() - started, repr(exc)))
+            raise
+        self.metrics.stage_turn(StageTurn(stage, self.state["stage"], time.perf_counter() - started, None))
+
+    def process_user_input(self, user_input):
+        """Process user input based on current conversation state and return assistant response."""
+        logger.debug("Received user input: %s", user_input)
+        with self._timed_turn():
+            if self.is_exit_command(user_input):
+                self.save_candidate_data()
+                return EXIT_MESSAGE
+
+            chain_name, payload = self._plan_response(user_input)
+            response = payload if chain_name is None else self._run_chain(chain_name, payload)
+            self._complete_turn(user_input, response)
+            return response
+
+    async def aprocess_user_input(self, user_input):
+        """Async variant of process_user_input using the chains' async interface."""
+        logger.debug("Received user input: %s", user_input)
+        with self._timed_turn():
+            if self.is_exit_command(user_input):
+                await asyncio.to_thread(self.save_candidate_data)
+                return EXIT_MESSAGE
+
+            # Planning may make a blocking extraction call; keep it off the event loop
+            chain_name, payload = await asyncio.to_thread(self._plan_response, user_input)
+            response = payload if chain_name is None else await self._arun_chain(chain_name, payload)
+            # Journal and snapshot writes stay off the event loop too
+            await asyncio.to_thread(self._complete_turn, user_input, response)
+            return response
+
+    def stream_user_input(self, user_input):
+        """
+        Process user input like process_user_input, but yield the response in
+        chunks as the model produces them. The full response is logged once the
+        stream is exhausted.
+        """
+        logger.debug("Received user input: %s", user_input)
+        with self._timed_turn():
+            if self.is_exit_command(user_input):
+                self.save_candidate_data()
+                yield EXIT_MESSAGE
+                return
+
+            chain_name, payload = self._plan_response(user_input)
+            started = time.perf_counter()
+            cache_key = self._cache_key(chain_name, payload) if chain_name else None
+            cached = self._cached_response(cache_key)
+            if chain_name is None or cached is not None:
+                response = payload if chain_name is None else cached
+                if cached is not None:
+                    self._record_chain_call(chain_name, payload, response, started, cache_hit=True)
+                yield response
+            else:
+                chunks = []
+                prompt = self.chains[chain_name].prompt.format_prompt(**payload)
+                try:
+                    for chunk in self.gateway.stream(lambda: self._stream_chain(chain_name, prompt)):
+                        chunks.append(chunk.content)
+                        yield chunk.content
+                except Exception as exc:
+                    self._record_chain_call(chain_name, payload, None, started, error=exc)
+                    raise
+                response = "".join(chunks)
+                self._record_chain_call(chain_name, payload, response, started)
+                self._cache_response(cache_key, response)
+
+            self._complete_turn(user_input, response)
+
+    async def astream_user_input(self, user_input):
+        """Async generator variant of stream_user_input."""
+        logger.debug("Received user input: %s", user_input)
+        with self._timed_turn():
+            if self.is_exit_command(user_input):
+                await asyncio.to_thread(self.save_candidate_data)
+                yield EXIT_MESSAGE
+                return
+
+            # Planning may make a blocking extraction call; keep it off the event loop
+            chain_name, payload = await asyncio.to_thread(self._plan_response, user_input)
+            started = time.perf_counter()
+            cache_key = self._cache_key(chain_name, payload) if chain_name else None
+            cached = self._cached_response(cache_key)
+            if chain_name is None or cached is not None:
+                response = payload if chain_name is None else cached
+                if cached is not None:
+                    self._record_chain_call(chain_name, payload, response, started, cache_hit=True)
+                yield response
+            else:
+                chunks = []
+                prompt = self.chains[chain_name].prompt.format_prompt(**payload)
+                try:
+                    async for chunk in self.gateway.astream(lambda: self._astream_chain(chain_name, prompt)):
+                        chunks.append(chunk.content)
+                        yield chunk.content
+                except Exception as exc:
+                    self._record_chain_call(chain_name, payload, None, started, error=exc)
+                    raise
+                response = "".join(chunks)
+                self._record_chain_call(chain_name, payload, response, started)
+                self._cache_response(cache_key, response)
+
+            await asyncio.to_thread(self._complete_turn, user_input, response)
+
+    def save_candidate_data(self):
+        """
+        Compact the session journal into a single JSON snapshot of the candidate data.
+        Returns the snapshot path, or None if there is nothing to save yet.
+        """
+        if self.journal is None or not self.candidate_data["full_name"]:
+            return None
+        self._turns_since_compaction = 0
+        return self.journal.compact(self.candidate_data.to_dict(), self.candidate_data["full_name"],
+                                    turn=self.memory.turn, state=self.state.to_dict())
+
+    def snapshot(self):
+        """
+        Return the complete session state as a JSON-serializable dict, so the
+        session can be restored later or on another worker with restore().
+        The transcript is stored once, in candidate_data; the rolling chat
+        history is rebuilt from it on restore.
+        """
+        return {
+            "version": SNAPSHOT_VERSION,
+            "session_id": self.session_id,
+            "candidate_data": self.candidate_data.to_dict(),
+            "state": self.state.to_dict(),
+            "memory": self.memory.snapshot(history=False),
+            "journal": {
+                "snapshot_path": self.journal.snapshot_path if self.journal else None,
+                "turns_since_compaction": self._turns_since_compaction,
+                "fields": self._journaled_fields,
+                "responses": self._journaled_responses
+            }
+        }
+
+    def restore(self, snapshot):
+        """
+        Load session state produced by snapshot() into this assistant, then
+        replay any turns journaled after it was taken. The LLM client, chains
+        and cache stay those of this instance.
+        """
+        if snapshot.get("version") not in READABLE_SNAPSHOT_VERSIONS:
+            raise ValueError(f"Unsupported session snapshot version: {snapshot.get('version')!r}")
+
+        self.session_id = snapshot["session_id"]
+        self.candidate_data = CandidateProfile.from_dict(snapshot["candidate_data"])
+        self.state = ConversationState.from_dict(snapshot["state"])
+        # Version 1 snapshots carry the chat history; later ones are rebuilt from the transcript
+        self.memory.replay((message.role, message.content) for message in self.candidate_data["conversation_log"])
+        self.memory.restore(snapshot["memory"])
+        # A prefetch in flight belonged to the previous state
+        self._prefetch = None
+
+        journal_state = snapshot["journal"]
+        if self.journal is not None:
+            # Keep appending to the same journal and snapshot files
+            self.journal = SessionJournal(self.session_id, self.journal.directory, self.journal.writer)
+            self.journal.snapshot_path = journal_state["snapshot_path"]
+        self._turns_since_compaction = journal_state["turns_since_compaction"]
+        self._journaled_fields = journal_state["fields"]
+        self._journaled_responses = journal_state["responses"]
+        self._journaled_stage = self.state["stage"]
+        self._replay_journal()
+
+    def resume(self, session_id):
+        """
+        Recover a session from its journal and candidate snapshot alone, e.g.
+        when the process died before the session was ever checkpointed.
+        Returns False, leaving the assistant as it was, if there is nothing to recover.
+        """
+        if self.journal is None or safe_filename(session_id) != session_id:
+            # Session ids become file names; only ids this class generates are accepted
+            return False
+        previous = self.session_id, self.journal
+        self.session_id = session_id
+        self.journal = SessionJournal(session_id, self.journal.directory, self.journal.writer)
+        if self._replay_journal():
+            return True
+        self.session_id, self.journal = previous
+        return False
+
+    def _replay_journal(self):
+        """
+        Bring the session up to date with the turns journaled after its
+        current state, and fold them into a fresh candidate snapshot.
+        Returns whether anything was replayed.
+        """
+        record = self.journal.load() if self.journal is not None else None
+        session = (record or {}).get("session") or {}
+        if not session.get("state") or session.get("turn", 0) <= self.memory.turn:
+            return False
+
+        self.candidate_data = CandidateProfile.from_dict(record)
+        self.state = ConversationState.from_dict(session["state"])
+        self.memory.replay((message.role, message.content) for message in self.candidate_data["conversation_log"])
+        self.memory.turn = session["turn"]
+        self._prefetch = None
+        self._journaled_fields = {field: self.candidate_data[field] for field in REQUIRED_FIELDS}
+        self._journaled_responses = len(self.candidate_data["technical_responses"])
+        self._journaled_stage = self.state["stage"]
+        self.save_candidate_data()
+        return True
+
+    def get_conversation_history(self):
+        """Return the conversation history for display purposes."""
+        return self.candidate_data["conversation_log"]
+
+    def get_prompt_stats(self):
+        """Return prompt-size counters from the conversation memory."""
+        return self.memory.stats()
+
+if __name__ == "__main__":
+    api_key = "your-groq-api-key-here"
+    assistant = HiringAssistant(api_key)
+    print("Welcome to TalentScout's Hiring Assistant!")
+    while True:
+        user_input = input("You: ")
+        response = assistant.process_user_input(user_input)
+        print(f"Assistant: {response}")
@@ -0,0 +1,216 @@
+# instrumentation.py
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque, namedtuple
+
+# One chain invocation (or cache hit standing in for one). Token counts are
+# estimates from conversation_memory.estimate_tokens.
+ChainCall = namedtuple("ChainCall", ["chain", "stage", "seconds", "prompt_tokens", "completion_tokens",
+                                     "cache_hit", "error"])
+
+# One processed turn: the stage it ran in, the stage it left the
+# conversation in and its wall time
+StageTurn = namedtuple("StageTurn", ["stage", "next_stage", "seconds", "error"])
+
+
+class MetricsSink:
+    """
+    Receives ChainCall and StageTurn events from HiringAssistant.
+    Sinks must be cheap and must not raise; they are called on the request path.
+    """
+
+    def chain_call(self, event):
+        pass
+
+    def stage_turn(self, event):
+        pass
+
+
+class MultiSink(MetricsSink):
+    """Fans events out to several sinks."""
+
+    def __init__(self, *sinks):
+        self.sinks = sinks
+
+    def chain_call(self, event):
+        for sink in self.sinks:
+            sink.chain_call(event)
+
+    def stage_turn(self, event):
+        for sink in self.sinks:
+            sink.stage_turn(event)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of values, in any order; 0.0 when there are none."""
+    values = sorted(values)
+    if not values:
+        return 0.0
+    return values[max(0, min(len(values) - 1, round(pct / 100 * len(values)) - 1))]
+
+
+class InMemoryMetrics(MetricsSink):
+    """
+    Aggregates events in process: counters and token totals per chain and
+    stage, plus the most recent latencies (window per series) for percentiles.
+    """
+
+    def __init__(self, window=1000):
+        self.window = window
+        self._lock = threading.Lock()
+        self.chains = defaultdict(lambda: {"calls": 0, "errors": 0, "cache_hits": 0, "seconds": 0.0,
+                                           "prompt_tokens": 0, "completion_tokens": 0})
+        self.stages = defaultdict(lambda: {"turns": 0, "errors": 0, "seconds": 0.0})
+        self.transitions = defaultdict(int)
+        self._latencies = defaultdict(lambda: deque(maxlen=self.window))
+
+    def chain_call(self, event):
+        with self._lock:
+            totals = self.chains[event.chain]
+            totals["calls"] += 1
+            totals["errors"] += bool(event.error)
+            totals["cache_hits"] += bool(event.cache_hit)
+            totals["seconds"] += event.seconds
+            totals["prompt_tokens"] += event.prompt_tokens
+            totals["completion_tokens"] += event.completion_tokens
+            self._latencies["chain", event.chain].append(event.seconds)
+
+    def stage_turn(self, event):
+        with self._lock:
+            totals = self.stages[event.stage]
+            totals["turns"] += 1
+            totals["errors"] += bool(event.error)
+            totals["seconds"] += event.seconds
+            if event.next_stage != event.stage:
+                self.transitions[event.stage, event.next_stage] += 1
+            self._latencies["stage", event.stage].append(event.seconds)
+
+    def percentiles(self, kind, name, pcts=(50, 95, 99)):
+        """Latency percentiles in seconds over the recent window of a chain or stage."""
+        with self._lock:
+            values = list(self._latencies[kind, name])
+        return {pct: percentile(values, pct) for pct in pcts}
+
+    def summary(self):
+        """Return all aggregates as plain dicts."""
+        with self._lock:
+            chains = {name: dict(totals) for name, totals in self.chains.items()}
+            stages = {name: dict(totals) for name, totals in self.stages.items()}
+            transitions = {f"{source}->{target}": count for (source, target), count in self.transitions.items()}
+        for name, totals in chains.items():
+            totals.update({f"p{pct}": value for pct, value in self.percentiles("chain", name).items()})
+        for name, totals in stages.items():
+            totals.update({f"p{pct}": value for pct, value in self.percentiles("stage", name).items()})
+        return {"chains": chains, "stages": stages, "transitions": transitions}
+
+
+class PrometheusTextfileSink(InMemoryMetrics):
+    """
+    Aggregates like InMemoryMetrics and periodically rewrites a file in the
+    Prometheus text exposition format, for node_exporter's textfile collector
+    or any scraper that reads files. The file is replaced atomically at most
+    once every write_interval seconds, and on write().
+    """
+
+    PREFIX = "hiring_assistant"
+
+    def __init__(self, path, write_interval=15.0, window=1000):
+        super().__init__(window)
+        self.path = path
+        self.write_interval = write_interval
+        self._last_write = 0.0
+        # Serializes writers of the shared temp file
+        self._write_lock = threading.Lock()
+
+    def chain_call(self, event):
+        super().chain_call(event)
+        self._maybe_write()
+
+    def stage_turn(self, event):
+        super().stage_turn(event)
+        self._maybe_write()
+
+    def _maybe_write(self):
+        if time.monotonic() - self._last_write < self.write_interval:
+            return
+        # Skip rather than wait when another thread is already writing
+        if self._write_lock.acquire(blocking=False):
+            try:
+                self._write()
+            finally:
+                self._write_lock.release()
+
+    def render(self):
+        """Return the current metrics in Prometheus text format."""
+        summary = self.summary()
+        lines = []
+
+        def series(name, kind, help_text, samples):
+            lines.append(f"# HELP {self.PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {self.PREFIX}_{name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{val}"' for key, val in labels.items())
+                lines.append(f"{self.PREFIX}_{name}{{{label_text}}} {value}")
+
+        chains = summary["chains"].items()
+        series("chain_calls_total", "counter", "Chain invocations, including cache hits.",
+               [({"chain": name}, totals["calls"]) for name, totals in chains])
+        series("chain_errors_total", "counter", "Chain invocations that raised.",
+               [({"chain": name}, totals["errors"]) for name, totals in chains])
+        series("chain_cache_hits_total", "counter", "Chain calls served from the response cache.",
+               [({"chain": name}, totals["cache_hits"]) for name, totals in chains])
+        series("chain_prompt_tokens_total", "counter", "Estimated prompt tokens sent.",
+               [({"chain": name}, totals["prompt_tokens"]) for name, totals in chains])
+        series("chain_completion_tokens_total", "counter", "Estimated completion tokens received.",
+               [({"chain": name}, totals["completion_tokens"]) for name, totals in chains])
+        series("chain_seconds", "summary", "Chain invocation wall time over the recent window.",
+               [({"chain": name, "quantile": f"0.{pct}"}, totals[f"p{pct}"])
+                for name, totals in chains for pct in (50, 95, 99)])
+        lines.extend(f'{self.PREFIX}_chain_seconds_sum{{chain="{name}"}} {totals["seconds"]}'
+                     for name, totals in chains)
+        lines.extend(f'{self.PREFIX}_chain_seconds_count{{chain="{name}"}} {totals["calls"]}'
+                     for name, totals in chains)
+
+        stages = summary["stages"].items()
+        series("stage_turns_total", "counter", "Turns processed per conversation stage.",
+               [({"stage": name}, totals["turns"]) for name, totals in stages])
+        series("stage_errors_total", "counter", "Turns that raised, per stage.",
+               [({"stage": name}, totals["errors"]) for name, totals in stages])
+        series("stage_seconds_total", "counter", "Wall time spent processing turns, per stage.",
+               [({"stage": name}, totals["seconds"]) for name, totals in stages])
+        series("stage_transitions_total", "counter", "Stage changes.",
+               [(dict(zip(("from", "to"), key.split("->"))), count)
+                for key, count in summary["transitions"].items()])
+        return "\n".join(lines) + "\n"
+
+    def write(self):
+        """Rewrite the metrics file now."""
+        with self._write_lock:
+            self._write()
+
+    def _write(self):
+        self._last_write = time.monotonic()
+        tmp_path = self.path + ".tmp"
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(tmp_path, "w") as f:
+            f.write(self.render())
+        os.replace(tmp_path, self.path)
+
+
+class LogSink(MetricsSink):
+    """Writes every event as one structured JSON log record."""
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger("hiring_assistant.metrics")
+        self.level = level
+
+    def chain_call(self, event):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, json.dumps({"event": "chain_call", **event._asdict()}))
+
+    def stage_turn(self, event):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, json.dumps({"event": "stage_turn", **event._asdict()}))
@@ -0,0 +1,180 @@
+# llm_cache.py
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_text(value):
+    """Lowercase and collapse whitespace so trivially different inputs share a key."""
+    return " ".join(str(value).lower().split())
+
+
+def normalize_tech_stack(value):
+    """Normalize a free-form tech stack into a sorted, de-duplicated list."""
+    items = re.split(r"[,;/|\n]+|\band\b|&", str(value).lower())
+    return ", ".join(sorted({" ".join(item.split()) for item in items if item.strip()}))
+
+
+# Per-variable normalizers; anything not listed uses normalize_text
+NORMALIZERS = {
+    "tech_stack": normalize_tech_stack
+}
+
+
+def make_cache_key(template, variables):
+    """
+    Build a cache key from a prompt template and its (normalized) input variables.
+    """
+    normalized = {
+        name: NORMALIZERS.get(name, normalize_text)(value)
+        for name, value in sorted(variables.items())
+    }
+    payload = json.dumps({"template": template, "variables": normalized}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Base class for LLM response caches.
+    Subclasses implement _get, _set and __len__; hit/miss accounting lives here.
+    """
+
+    def __init__(self, max_size=1000, ttl=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        """Return the cached response for key, or None on a miss."""
+        value = self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """Store a response under key."""
+        self._set(key, value)
+
+    def _expired(self, created_at, now):
+        return self.ttl is not None and now - created_at > self.ttl
+
+    def stats(self):
+        """Return hit/miss/eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self)
+        }
+
+
+class LRUResponseCache(ResponseCache):
+    """In-memory LRU cache with optional TTL (seconds)."""
+
+    def __init__(self, max_size=1000, ttl=None):
+        super().__init__(max_size=max_size, ttl=ttl)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, created_at = entry
+            if self._expired(created_at, time.monotonic()):
+                del self._entries[key]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    On-disk cache backed by SQLite, shared across processes and restarts.
+    Entries older than ttl are ignored and purged; the least recently used
+    entries are evicted once max_size is exceeded.
+    """
+
+    def __init__(self, path="llm_cache.sqlite3", max_size=10000, ttl=None):
+        super().__init__(max_size=max_size, ttl=ttl)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)")
+        self._conn.commit()
+
+    def _get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if self._expired(created_at, now):
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.expirations += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            return value
+
+    def _set(self, key, value):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, value, now, now)
+            )
+            overflow = self._count() - self.max_size
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY last_access LIMIT ?)",
+                    (overflow,)
+                )
+                self.evictions += overflow
+            self._conn.commit()
+
+    def _count(self):
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __len__(self):
+        with self._lock:
+            return self._count()
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
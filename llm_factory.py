@@ -0,0 +1,62 @@
+# llm_factory.py
+import threading
+
+from chain_registry import default_registry
+
+DEFAULT_MODEL = "mixtral-8x7b-32768"
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _build_chat_model(api_key, model_name, temperature, max_tokens, max_connections):
+    from langchain_groq import ChatGroq
+
+    client_kwargs = {}
+    if max_connections:
+        # Bounded connection pools shared by every session using this client
+        import httpx
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        client_kwargs["http_client"] = httpx.Client(limits=limits, timeout=httpx.Timeout(60.0, pool=None))
+        client_kwargs["http_async_client"] = httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(60.0, pool=None))
+
+    return ChatGroq(
+        groq_api_key=api_key,
+        model_name=model_name,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        **client_kwargs
+    )
+
+
+def get_chat_model(api_key, model_name=DEFAULT_MODEL, temperature=0.7, max_tokens=500, max_connections=None):
+    """
+    Return the process-wide chat model client for these settings, creating it
+    on first use. Sessions that share a client also share its HTTP connection
+    pool, so only the first one pays for connection setup.
+    """
+    key = (api_key, model_name, temperature, max_tokens, max_connections)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _build_chat_model(api_key, model_name, temperature, max_tokens, max_connections)
+                _clients[key] = client
+    return client
+
+
+def get_chains(llm, prompts, registry=None, **chain_kwargs):
+    """
+    Return {name: LLMChain} for the given {name: PromptTemplate}, built once per
+    llm in the registry (the process-wide one by default).
+    """
+    registry = registry if registry is not None else default_registry
+    return {name: registry.get(name, llm, prompt, **chain_kwargs) for name, prompt in prompts.items()}
+
+
+def clear_clients():
+    """Forget all cached clients and the chains built over them."""
+    with _clients_lock:
+        _clients.clear()
+    default_registry.clear()
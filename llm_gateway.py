@@ -0,0 +1,363 @@
+# llm_gateway.py
+import asyncio
+import math
+import random
+import threading
+import time
+from concurrent.futures import Future
+
+# HTTP statuses worth retrying: rate limited, or a transient server-side failure
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+# Exception class names used by the groq/openai SDKs and httpx for transient failures
+RETRYABLE_ERROR_NAMES = {"RateLimitError", "APITimeoutError", "APIConnectionError", "InternalServerError",
+                         "ServiceUnavailableError", "TimeoutException", "ConnectError", "ReadTimeout"}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the provider while the circuit breaker is open."""
+
+    def __init__(self, retry_after):
+        super().__init__(f"LLM provider circuit is open after repeated failures; retry in {math.ceil(retry_after)}s")
+        self.retry_after = retry_after
+
+
+class _FlightAbandoned(Exception):
+    """Handed to coalesced callers when the call they joined was cancelled or interrupted."""
+
+
+def is_retryable(exc):
+    """True for rate limits, timeouts, connection errors and 5xx responses."""
+    status = getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+    if status in RETRYABLE_STATUS_CODES:
+        return True
+    return type(exc).__name__ in RETRYABLE_ERROR_NAMES or isinstance(exc, (TimeoutError, ConnectionError))
+
+
+class TokenBucket:
+    """Allows rate acquisitions per second on average, with bursts of up to burst."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self):
+        """Take a token if one is available; otherwise return the seconds to wait for one."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failed calls, rejecting calls for
+    reset_timeout seconds. Then lets a single trial call through: success
+    closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if time.monotonic() - self.opened_at >= self.reset_timeout else "open"
+
+    def retry_after(self):
+        """Seconds until the circuit lets a call through again (at least one while it is open)."""
+        if self.opened_at is None:
+            return 0.0
+        return max(1.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def before_call(self):
+        """Admit a call or raise CircuitOpenError; returns True when the call is the half-open trial."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return False
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+        raise CircuitOpenError(self.retry_after())
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self, trial=False):
+        with self._lock:
+            self.failures += 1
+            if trial or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            if trial:
+                self._trial_in_flight = False
+
+    def release(self, trial):
+        """End a call that says nothing about the provider's health (e.g. it was cancelled)."""
+        if trial:
+            with self._lock:
+                self._trial_in_flight = False
+
+
+class LLMGateway:
+    """
+    Shared front door for LLM calls made with one API key: token-bucket rate
+    limiting, retries with jittered exponential backoff on transient errors,
+    a circuit breaker, and single-flight coalescing so concurrent calls with
+    the same key share one request.
+
+    The breaker sees logical calls: retries happen inside one admitted call,
+    and a call counts as one failure only if it ends in a retryable error.
+    """
+
+    def __init__(self, requests_per_second=None, burst=None, max_retries=3, base_delay=0.5, max_delay=8.0,
+                 failure_threshold=5, reset_timeout=30.0):
+        self.bucket = TokenBucket(requests_per_second, burst) if requests_per_second else None
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._in_flight = {}
+        self._async_in_flight = {}
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "coalesced": 0, "retries": 0, "rejected": 0}
+
+    def backoff(self, attempt):
+        """Full-jitter exponential backoff delay for a retry attempt (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def _admit(self):
+        try:
+            return self.breaker.before_call()
+        except CircuitOpenError:
+            self.stats["rejected"] += 1
+            raise
+
+    def _settle(self, trial, exc=None):
+        """Record the outcome of a logical call with the breaker."""
+        if exc is None:
+            self.breaker.record_success()
+        elif isinstance(exc, Exception) and is_retryable(exc):
+            self.breaker.record_failure(trial)
+        else:
+            # A non-retryable error or a cancellation isn't a sign of an unhealthy provider
+            self.breaker.release(trial)
+
+    def _should_retry(self, exc, attempt):
+        if attempt >= self.max_retries or not is_retryable(exc):
+            return False
+        self.stats["retries"] += 1
+        return True
+
+    def _call_with_retries(self, func):
+        trial = self._admit()
+        attempt = 0
+        try:
+            while True:
+                if self.bucket:
+                    self.bucket.acquire()
+                try:
+                    result = func()
+                    break
+                except Exception as exc:
+                    if not self._should_retry(exc, attempt):
+                        raise
+                time.sleep(self.backoff(attempt))
+                attempt += 1
+        except BaseException as exc:
+            self._settle(trial, exc)
+            raise
+        self._settle(trial)
+        return result
+
+    async def _acall_with_retries(self, func):
+        trial = self._admit()
+        attempt = 0
+        try:
+            while True:
+                if self.bucket:
+                    await self.bucket.acquire_async()
+                try:
+                    result = await func()
+                    break
+                except Exception as exc:
+                    if not self._should_retry(exc, attempt):
+                        raise
+                await asyncio.sleep(self.backoff(attempt))
+                attempt += 1
+        except BaseException as exc:
+            self._settle(trial, exc)
+            raise
+        self._settle(trial)
+        return result
+
+    def call(self, func, key=None):
+        """
+        Run func() through the gateway. Calls made with the same key while one
+        is already in flight wait for and share its result (or exception). If
+        that call is interrupted instead, they retry it themselves.
+        """
+        self.stats["calls"] += 1
+        if key is None:
+            return self._call_with_retries(func)
+
+        while True:
+            with self._lock:
+                future = self._in_flight.get(key)
+                if future is None:
+                    future = self._in_flight[key] = Future()
+                    break
+            self.stats["coalesced"] += 1
+            try:
+                return future.result()
+            except _FlightAbandoned:
+                continue
+
+        try:
+            result = self._call_with_retries(func)
+        except BaseException as exc:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(exc if isinstance(exc, Exception) else _FlightAbandoned())
+            raise
+        with self._lock:
+            del self._in_flight[key]
+        future.set_result(result)
+        return result
+
+    async def acall(self, func, key=None):
+        """
+        Async variant of call(); func is a zero-argument coroutine function.
+        Cancelling the caller that makes the shared request doesn't cancel the
+        callers coalesced onto it: one of them takes the request over.
+        """
+        self.stats["calls"] += 1
+        if key is None:
+            return await self._acall_with_retries(func)
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        while True:
+            future = self._async_in_flight.get(flight_key)
+            if future is None:
+                future = self._async_in_flight[flight_key] = loop.create_future()
+                break
+            self.stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(future)
+            except _FlightAbandoned:
+                continue
+
+        try:
+            result = await self._acall_with_retries(func)
+        except BaseException as exc:
+            del self._async_in_flight[flight_key]
+            future.set_exception(exc if isinstance(exc, Exception) else _FlightAbandoned())
+            # Mark the exception retrieved when nobody else was waiting for it
+            future.exception()
+            raise
+        del self._async_in_flight[flight_key]
+        future.set_result(result)
+        return result
+
+    def stream(self, func):
+        """
+        Yield the chunks of func(), a zero-argument callable returning an
+        iterable of chunks. A stream that fails before its first chunk is
+        retried like call(); after that, errors propagate. Streams are never
+        coalesced.
+        """
+        self.stats["calls"] += 1
+        trial = self._admit()
+        attempt = 0
+        try:
+            while True:
+                if self.bucket:
+                    self.bucket.acquire()
+                started = False
+                try:
+                    for chunk in func():
+                        started = True
+                        yield chunk
+                    break
+                except Exception as exc:
+                    if started or not self._should_retry(exc, attempt):
+                        raise
+                time.sleep(self.backoff(attempt))
+                attempt += 1
+        except BaseException as exc:
+            self._settle(trial, exc)
+            raise
+        self._settle(trial)
+
+    async def astream(self, func):
+        """Async variant of stream(); func returns an async iterable of chunks."""
+        self.stats["calls"] += 1
+        trial = self._admit()
+        attempt = 0
+        try:
+            while True:
+                if self.bucket:
+                    await self.bucket.acquire_async()
+                started = False
+                try:
+                    async for chunk in func():
+                        started = True
+                        yield chunk
+                    break
+                except Exception as exc:
+                    if started or not self._should_retry(exc, attempt):
+                        raise
+                await asyncio.sleep(self.backoff(attempt))
+                attempt += 1
+        except BaseException as exc:
+            self._settle(trial, exc)
+            raise
+        self._settle(trial)
+
+
+_gateways = {}
+_gateways_lock = threading.Lock()
+
+
+def get_gateway(api_key, **settings):
+    """
+    Return the process-wide gateway for an API key, creating it with settings
+    on first use (later settings for the same key are ignored).
+    """
+    gateway = _gateways.get(api_key)
+    if gateway is None:
+        with _gateways_lock:
+            gateway = _gateways.get(api_key)
+            if gateway is None:
+                gateway = _gateways[api_key] = LLMGateway(**settings)
+    return gateway
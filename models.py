@@ -0,0 +1,132 @@
+# models.py
+import sys
+import time
+from datetime import datetime
+
+# Role names are interned so every message shares one string object per role
+ROLES = {role: sys.intern(role) for role in ("user", "assistant", "system")}
+
+
+def _intern_role(role):
+    return ROLES.get(role) or sys.intern(role)
+
+
+class Record:
+    """
+    Base for the fixed-field session records below. Fields live in __slots__
+    (no per-instance __dict__), while dict-style access (record["stage"],
+    record.get("email")) keeps working for existing callers. to_dict() gives
+    the plain JSON shape.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def get(self, key, default=None):
+        # Through __getitem__, so subclasses that convert values on access agree
+        return self[key] if key in self.__slots__ else default
+
+    def keys(self):
+        return self.__slots__
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        record = cls()
+        for key in cls.__slots__:
+            if key in data:
+                value = data[key]
+                setattr(record, key, list(value) if isinstance(value, list) else value)
+        return record
+
+    def __eq__(self, other):
+        return type(other) is type(self) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class Message(Record):
+    """One conversation log entry. The timestamp is a POSIX float, rendered as ISO in to_dict()."""
+
+    __slots__ = ("role", "content", "timestamp")
+
+    def __init__(self, role="user", content="", timestamp=None):
+        self.role = _intern_role(role)
+        self.content = content
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    def __getitem__(self, key):
+        if key == "timestamp":
+            return self.isoformat()
+        return super().__getitem__(key)
+
+    def isoformat(self):
+        return datetime.fromtimestamp(self.timestamp).isoformat()
+
+    def to_dict(self):
+        return {"role": self.role, "content": self.content, "timestamp": self.isoformat()}
+
+    @classmethod
+    def from_dict(cls, data):
+        timestamp = data.get("timestamp")
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp).timestamp()
+        return cls(data["role"], data["content"], timestamp)
+
+
+class CandidateProfile(Record):
+    """Candidate details collected during intake, plus the transcript and technical answers."""
+
+    __slots__ = ("full_name", "email", "phone", "experience", "desired_position", "location",
+                 "tech_stack", "conversation_log", "technical_responses")
+
+    def __init__(self):
+        self.full_name = None
+        self.email = None
+        self.phone = None
+        self.experience = None
+        self.desired_position = None
+        self.location = None
+        self.tech_stack = None
+        self.conversation_log = []
+        self.technical_responses = []
+
+    def to_dict(self):
+        data = super().to_dict()
+        data["conversation_log"] = [message.to_dict() for message in self.conversation_log]
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        profile = super().from_dict(data)
+        profile.conversation_log = [Message.from_dict(message) for message in data.get("conversation_log", [])]
+        profile.technical_responses = list(data.get("technical_responses", []))
+        return profile
+
+
+class ConversationState(Record):
+    """Where the conversation is: stage, collected intake fields and question progress."""
+
+    __slots__ = ("stage", "fields_collected", "current_question", "total_questions", "questions_asked")
+
+    def __init__(self):
+        self.stage = "greeting"  # greeting, info_gathering, tech_questions, closing
+        self.fields_collected = []
+        self.current_question = 0
+        self.total_questions = 0
+        self.questions_asked = []
@@ -0,0 +1,115 @@
+# question_bank.py
+import argparse
+import json
+import os
+
+DEFAULT_BANK_PATH = "data/question_bank.json"
+
+DIFFICULTY_LEVELS = ["basic", "advanced"]
+
+
+class QuestionBank:
+    """
+    Pre-generated technical questions indexed by technology and difficulty:
+    {technology: {difficulty: [question, ...]}}.
+    Lookups are plain dict accesses, so assembling a candidate's question set
+    costs O(technologies in their stack), independent of bank size.
+    """
+
+    def __init__(self, questions=None):
+        self.questions = questions or {}
+
+    @classmethod
+    def load(cls, path=DEFAULT_BANK_PATH):
+        """Load a bank from disk; a missing file gives an empty bank."""
+        if not os.path.exists(path):
+            return cls()
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def save(self, path=DEFAULT_BANK_PATH):
+        """Write the bank to disk atomically."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.questions, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def __contains__(self, technology):
+        return technology in self.questions
+
+    def add(self, technology, difficulty, questions):
+        """Store the questions for one technology and difficulty level."""
+        self.questions.setdefault(technology, {})[difficulty] = list(questions)
+
+    def get(self, technology, difficulty):
+        """Return the stored questions for a technology and difficulty level."""
+        return self.questions.get(technology, {}).get(difficulty, [])
+
+    def assemble(self, technologies, num_questions=5, difficulties=DIFFICULTY_LEVELS):
+        """
+        Build a question set for the given technologies.
+        Questions are taken round-robin across technologies, easier levels first,
+        so every known technology is covered before any gets a second question.
+        Returns (questions, missing_technologies).
+        """
+        known = [tech for tech in technologies if tech in self.questions]
+        missing = [tech for tech in technologies if tech not in self.questions]
+
+        questions = []
+        if num_questions <= 0:
+            return questions, missing
+        for difficulty in difficulties:
+            pools = [self.get(tech, difficulty) for tech in known]
+            depth = max((len(pool) for pool in pools), default=0)
+            for i in range(depth):
+                for pool in pools:
+                    if i < len(pool):
+                        questions.append(pool[i])
+                        if len(questions) >= num_questions:
+                            return questions, missing
+        return questions, missing
+
+
+def build_question_bank(generator, technologies, bank=None, difficulties=DIFFICULTY_LEVELS, refresh=False):
+    """
+    Offline batch job: generate questions for every technology and difficulty
+    level with the generator's LLM chain (fanned out over its thread pool)
+    and store them in the bank.
+    Technologies already in the bank are skipped unless refresh is True.
+    """
+    bank = bank if bank is not None else QuestionBank()
+    pending = [tech for tech in technologies if refresh or tech not in bank]
+    jobs = [(tech, difficulty) for tech in pending for difficulty in difficulties]
+    for (tech, difficulty), questions in zip(jobs, generator.generate_question_batches(jobs)):
+        bank.add(tech, difficulty, questions)
+    return bank
+
+
+def main():
+    from langchain_groq import ChatGroq
+    from tech_question_generator import TECHNOLOGY_DOMAINS, TechQuestionGenerator
+
+    parser = argparse.ArgumentParser(description="Pre-generate the technical question bank.")
+    parser.add_argument("--output", default=DEFAULT_BANK_PATH, help="Path of the question bank JSON file")
+    parser.add_argument("--tech", action="append", help="Technology to generate (repeatable, default: all known)")
+    parser.add_argument("--refresh", action="store_true", help="Regenerate technologies already in the bank")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum concurrent LLM calls")
+    parser.add_argument("--timeout", type=float, default=60, help="Per-call timeout in seconds")
+    args = parser.parse_args()
+
+    llm = ChatGroq(
+        groq_api_key=os.environ["GROQ_API_KEY"],
+        model_name="mixtral-8x7b-32768",
+        temperature=0.7,
+        max_tokens=500
+    )
+    generator = TechQuestionGenerator(llm, max_concurrency=args.concurrency, timeout=args.timeout)
+    bank = QuestionBank.load(args.output)
+    build_question_bank(generator, args.tech or list(TECHNOLOGY_DOMAINS), bank=bank, refresh=args.refresh)
+    bank.save(args.output)
+    print(f"Question bank with {len(bank.questions)} technologies written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
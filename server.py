@@ -0,0 +1,347 @@
+# server.py
+"""
+Headless multi-session server for the hiring assistant.
+
+Exposes an HTTP/WebSocket API so many screenings can run concurrently in one
+process:
+
+    POST   /sessions                 create a session, returns the greeting
+    POST   /sessions/{id}/messages   {"message": "..."} -> {"response": "...", "stage": "..."}
+    GET    /sessions/{id}/ws         WebSocket; each text frame is a candidate message,
+                                     answered with streamed {"type": "chunk"} frames
+                                     and a final {"type": "done"} frame, or an
+                                     {"type": "error"} frame if it couldn't be answered
+    DELETE /sessions/{id}            end the session and persist its data
+    GET    /health                   liveness and session count
+
+Run with:
+    GROQ_API_KEY=... python server.py --port 8080 [--session-store sessions.sqlite3]
+
+With --session-store, idle sessions are moved out of memory and sessions
+survive restarts; any worker sharing the store can resume them.
+"""
+import argparse
+import asyncio
+import logging
+import math
+import os
+import time
+import uuid
+
+from aiohttp import WSMsgType, web
+
+from hiring_assistant import HiringAssistant
+from llm_cache import LRUResponseCache
+from instrumentation import LogSink, MultiSink, PrometheusTextfileSink
+from llm_factory import get_chat_model
+from llm_gateway import CircuitOpenError, get_gateway
+from session_store import FileSessionStore, SQLiteSessionStore
+
+logger = logging.getLogger(__name__)
+
+
+class SessionEntry:
+    __slots__ = ("assistant", "lock", "last_active", "unsaved_turns")
+
+    def __init__(self, assistant):
+        self.assistant = assistant
+        self.lock = asyncio.Lock()
+        self.last_active = time.monotonic()
+        # Turns processed since the session was last written to the store
+        self.unsaved_turns = 0
+
+
+class SessionManager:
+    """
+    Holds live HiringAssistant sessions. Messages for one session are
+    processed one at a time; sessions idle for longer than idle_timeout
+    seconds are evicted by a background task. Store and file I/O runs on
+    worker threads, off the event loop.
+
+    With a session_store, evicted sessions are snapshotted to it and
+    rehydrated on their next request, and live sessions are snapshotted on
+    shutdown so they survive restarts. Live sessions are also checkpointed
+    every checkpoint_every turns; after a crash, the turns since are
+    replayed from the assistant's journal. Without a store, eviction ends
+    the session.
+    """
+
+    def __init__(self, assistant_factory, idle_timeout=1800, sweep_interval=60, session_store=None,
+                 checkpoint_every=5):
+        self.assistant_factory = assistant_factory
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self.session_store = session_store
+        self.checkpoint_every = checkpoint_every
+        self.sessions = {}
+        # session_id -> task writing the snapshot of a session being suspended
+        self._suspending = {}
+        self._sweeper = None
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def create(self):
+        """Start a new session and return its id."""
+        assistant = self.assistant_factory()
+        self.sessions[assistant.session_id] = SessionEntry(assistant)
+        return assistant.session_id
+
+    async def get(self, session_id):
+        """Return the session entry, rehydrating it from the store if needed; None if unknown."""
+        suspending = self._suspending.get(session_id)
+        if suspending is not None:
+            # Let the snapshot being written land before reading it back
+            await asyncio.wait([suspending])
+        entry = self.sessions.get(session_id)
+        if entry is None and self.session_store is not None:
+            snapshot = await asyncio.to_thread(self.session_store.load, session_id)
+            assistant = self.assistant_factory()
+            if snapshot is not None:
+                # Restoring replays the session's journal, which reads files
+                await asyncio.to_thread(assistant.restore, snapshot)
+            elif not await asyncio.to_thread(assistant.resume, session_id):
+                # Not checkpointed before the process stopped, and nothing journaled either
+                assistant = None
+            if assistant is not None:
+                entry = self.sessions.setdefault(session_id, SessionEntry(assistant))
+        if entry is not None:
+            entry.last_active = time.monotonic()
+        return entry
+
+    async def checkpoint(self, session_id):
+        """
+        Record a processed turn, writing the session's snapshot to the store (if
+        there is one) every checkpoint_every turns. Sessions without a journal
+        to recover the turns in between are written every turn.
+        """
+        entry = self.sessions.get(session_id)
+        if entry is None or self.session_store is None:
+            return
+        entry.unsaved_turns += 1
+        if entry.unsaved_turns < self.checkpoint_every and entry.assistant.journal is not None:
+            return
+        entry.unsaved_turns = 0
+        snapshot = entry.assistant.snapshot()
+        await asyncio.to_thread(self.session_store.save, session_id, snapshot)
+
+    def _persist(self, session_id, assistant):
+        assistant.save_candidate_data()
+        self.session_store.save(session_id, assistant.snapshot())
+
+    async def suspend(self, session_id):
+        """Snapshot a session to the store and drop it from memory."""
+        entry = self.sessions.pop(session_id, None)
+        if entry is None:
+            return False
+        task = self._suspending[session_id] = asyncio.ensure_future(
+            asyncio.to_thread(self._persist, session_id, entry.assistant)
+        )
+        try:
+            await task
+        finally:
+            del self._suspending[session_id]
+        return True
+
+    async def close(self, session_id):
+        """End a session and persist its candidate data. Returns False if unknown."""
+        entry = await self.get(session_id)
+        if entry is None:
+            return False
+        # Wait for a message being processed to finish before ending the session
+        async with entry.lock:
+            if self.sessions.pop(session_id, None) is None:
+                return False
+            await asyncio.to_thread(entry.assistant.save_candidate_data)
+            if self.session_store is not None:
+                await asyncio.to_thread(self.session_store.delete, session_id)
+        return True
+
+    async def evict_idle(self):
+        """Suspend (or, without a store, close) sessions idle for longer than idle_timeout."""
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [session_id for session_id, entry in self.sessions.items()
+                if entry.last_active < cutoff and not entry.lock.locked()]
+        for session_id in idle:
+            if self.session_store is not None:
+                await self.suspend(session_id)
+            else:
+                await self.close(session_id)
+        return idle
+
+    async def _sweep(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            await self.evict_idle()
+
+    def start(self):
+        self._sweeper = asyncio.create_task(self._sweep())
+
+    async def stop(self):
+        if self._sweeper:
+            self._sweeper.cancel()
+        for session_id in list(self.sessions):
+            if self.session_store is not None:
+                await self.suspend(session_id)
+            else:
+                await self.close(session_id)
+
+
+def build_llm(api_key, max_connections):
+    """
+    One chat model client shared by every session, with a bounded pool of
+    outbound HTTP connections.
+    """
+    return get_chat_model(api_key, max_connections=max_connections)
+
+
+def create_app(manager, max_in_flight=64):
+    """Build the aiohttp application around a SessionManager."""
+    # Bounds how many messages are processed at once across all sessions
+    in_flight = asyncio.Semaphore(max_in_flight)
+    routes = web.RouteTableDef()
+
+    @web.middleware
+    async def provider_unavailable(request, handler):
+        # Fail fast while the LLM gateway's circuit breaker is open
+        try:
+            return await handler(request)
+        except CircuitOpenError as exc:
+            raise web.HTTPServiceUnavailable(text=str(exc), headers={"Retry-After": str(math.ceil(exc.retry_after))})
+
+    async def session_or_404(request):
+        entry = await manager.get(request.match_info["session_id"])
+        if entry is None:
+            raise web.HTTPNotFound(text="Unknown or expired session")
+        return entry
+
+    @routes.get("/health")
+    async def health(request):
+        return web.json_response({"status": "ok", "sessions": len(manager)})
+
+    @routes.post("/sessions")
+    async def create_session(request):
+        session_id = manager.create()
+        entry = await manager.get(session_id)
+        async with entry.lock, in_flight:
+            greeting = await entry.assistant.aprocess_user_input("Hello")
+            await manager.checkpoint(session_id)
+        return web.json_response({"session_id": session_id, "response": greeting}, status=201)
+
+    @routes.post("/sessions/{session_id}/messages")
+    async def post_message(request):
+        entry = await session_or_404(request)
+        body = await request.json()
+        message = (body.get("message") or "").strip()
+        if not message:
+            raise web.HTTPBadRequest(text="'message' is required")
+        async with entry.lock, in_flight:
+            response = await entry.assistant.aprocess_user_input(message)
+            await manager.checkpoint(entry.assistant.session_id)
+        return web.json_response({"response": response, "stage": entry.assistant.state["stage"]})
+
+    @routes.get("/sessions/{session_id}/ws")
+    async def session_socket(request):
+        session_id = request.match_info["session_id"]
+        await session_or_404(request)
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+        async for frame in ws:
+            if frame.type != WSMsgType.TEXT:
+                break
+            # Resolve the session for every frame: while the socket sat idle it
+            # may have been suspended to the store, or ended
+            entry = await manager.get(session_id)
+            if entry is None:
+                await ws.send_json({"type": "error", "error": "Unknown or expired session"})
+                break
+            async with entry.lock, in_flight:
+                try:
+                    async for chunk in entry.assistant.astream_user_input(frame.data):
+                        await ws.send_json({"type": "chunk", "text": chunk})
+                except CircuitOpenError as exc:
+                    # The response has started, so the middleware can't turn this into a 503
+                    await ws.send_json({"type": "error", "error": str(exc),
+                                        "retry_after": math.ceil(exc.retry_after)})
+                    continue
+                except Exception:
+                    # Keep the socket open for the candidate's next message
+                    logger.exception("Failed to answer a message in session %s", session_id)
+                    if ws.closed:
+                        break
+                    await ws.send_json({"type": "error", "error": "The message could not be answered"})
+                    continue
+                await manager.checkpoint(session_id)
+            entry.last_active = time.monotonic()
+            await ws.send_json({"type": "done", "stage": entry.assistant.state["stage"]})
+        return ws
+
+    @routes.delete("/sessions/{session_id}")
+    async def close_session(request):
+        if not await manager.close(request.match_info["session_id"]):
+            raise web.HTTPNotFound(text="Unknown or expired session")
+        return web.Response(status=204)
+
+    app = web.Application(middlewares=[provider_unavailable])
+    app.add_routes(routes)
+
+    async def on_startup(app):
+        manager.start()
+
+    async def on_cleanup(app):
+        await manager.stop()
+
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the hiring assistant as a multi-session API server.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--idle-timeout", type=float, default=1800, help="Seconds before an idle session is evicted")
+    parser.add_argument("--max-llm-connections", type=int, default=32, help="Size of the shared outbound LLM connection pool")
+    parser.add_argument("--session-store", help="SQLite file (*.sqlite3, *.db) or directory to keep suspended sessions in")
+    parser.add_argument("--metrics-file", help="Write Prometheus text-format metrics to this file")
+    parser.add_argument("--log-metrics", action="store_true", help="Log every chain call and turn as structured JSON")
+    parser.add_argument("--prefetch-questions", action="store_true",
+                        help="Generate the next technical question while the candidate answers the current one")
+    parser.add_argument("--requests-per-second", type=float,
+                        help="Client-side cap on LLM requests started per second for the API key")
+    parser.add_argument("--max-retries", type=int, default=3,
+                        help="Retries, with jittered exponential backoff, of rate-limited or failed LLM calls")
+    parser.add_argument("--max-in-flight", type=int, default=64, help="Messages processed concurrently across sessions")
+    parser.add_argument("--checkpoint-every", type=int, default=5,
+                        help="Turns between snapshots of a live session to the session store")
+    args = parser.parse_args()
+
+    api_key = os.environ["GROQ_API_KEY"]
+    llm = build_llm(api_key, args.max_llm_connections)
+    gateway = get_gateway(api_key, requests_per_second=args.requests_per_second, max_retries=args.max_retries)
+    cache = LRUResponseCache(max_size=1000, ttl=24 * 60 * 60)
+    session_store = None
+    if args.session_store:
+        if args.session_store.endswith((".sqlite3", ".db")):
+            session_store = SQLiteSessionStore(args.session_store)
+        else:
+            session_store = FileSessionStore(args.session_store)
+    sinks = []
+    if args.metrics_file:
+        sinks.append(PrometheusTextfileSink(args.metrics_file))
+    if args.log_metrics:
+        logging.basicConfig(level=logging.INFO)
+        sinks.append(LogSink())
+    metrics = MultiSink(*sinks) if sinks else None
+    manager = SessionManager(
+        lambda: HiringAssistant(api_key, response_cache=cache, llm=llm, metrics=metrics, gateway=gateway,
+                                  prefetch_questions=args.prefetch_questions),
+        idle_timeout=args.idle_timeout,
+        session_store=session_store,
+        checkpoint_every=args.checkpoint_every
+    )
+    web.run_app(create_app(manager, args.max_in_flight), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
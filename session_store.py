@@ -0,0 +1,112 @@
+# session_store.py
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from candidate_journal import safe_filename
+
+
+def dumps_snapshot(snapshot):
+    """Serialize a HiringAssistant.snapshot() dict to compact JSON."""
+    return json.dumps(snapshot, separators=(",", ":"))
+
+
+def loads_snapshot(data):
+    """Parse a snapshot serialized with dumps_snapshot()."""
+    return json.loads(data)
+
+
+class SessionStore:
+    """
+    Storage interface for live interview sessions (see HiringAssistant.snapshot).
+    Unlike CandidateStore, records are overwritten on every save and deleted
+    once the session ends.
+    """
+
+    def save(self, session_id, snapshot):
+        """Persist the latest snapshot of a session."""
+        raise NotImplementedError
+
+    def load(self, session_id):
+        """Return the stored snapshot for a session, or None."""
+        raise NotImplementedError
+
+    def delete(self, session_id):
+        """Forget a session. Unknown ids are ignored."""
+        raise NotImplementedError
+
+
+class FileSessionStore(SessionStore):
+    """One JSON file per session in a directory, replaced atomically on save."""
+
+    def __init__(self, directory="sessions"):
+        self.directory = directory
+
+    def _path(self, session_id):
+        return os.path.join(self.directory, f"{safe_filename(session_id)}.json")
+
+    def save(self, session_id, snapshot):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(session_id)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(dumps_snapshot(snapshot))
+        os.replace(tmp_path, path)
+
+    def load(self, session_id):
+        try:
+            with open(self._path(session_id)) as f:
+                return loads_snapshot(f.read())
+        except FileNotFoundError:
+            return None
+
+    def delete(self, session_id):
+        try:
+            os.remove(self._path(session_id))
+        except FileNotFoundError:
+            pass
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    SQLite-backed store in WAL mode, keyed by session id. Suitable for
+    several worker processes sharing one host.
+    """
+
+    def __init__(self, path="sessions.sqlite3"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                updated_at TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions (updated_at);
+        """)
+        self._conn.commit()
+
+    def save(self, session_id, snapshot):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (session_id, updated_at, data) VALUES (?, ?, ?)",
+                (session_id, datetime.now().isoformat(), dumps_snapshot(snapshot))
+            )
+
+    def load(self, session_id):
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+        return loads_snapshot(row[0]) if row else None
+
+    def delete(self, session_id):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
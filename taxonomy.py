@@ -0,0 +1,126 @@
+# taxonomy.py
+import json
+import os
+from collections import namedtuple
+from functools import lru_cache
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; JSON taxonomies work without it
+    msgpack = None
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "technologies.json")
+
+Technology = namedtuple("Technology", ["name", "domain", "aliases", "parent", "related"])
+
+
+class Taxonomy:
+    """
+    Technology taxonomy: canonical names, aliases, domains (with parent
+    domains) and parent/related technologies.
+    Every lookup goes through a dict index, so it is O(1) regardless of
+    taxonomy size.
+    """
+
+    def __init__(self, technologies, domains=None):
+        self.domain_parents = dict(domains or {})
+        self._by_name = {}
+        self._by_surface = {}
+        for tech in technologies:
+            self._by_name[tech.name] = tech
+            self._by_surface[tech.name] = tech.name
+            for alias in tech.aliases:
+                self._by_surface.setdefault(alias, tech.name)
+        self._matcher = None
+        self._domains = None
+
+    @classmethod
+    def from_dict(cls, data):
+        technologies = [
+            Technology(
+                name=entry["name"].lower(),
+                domain=entry["domain"],
+                aliases=tuple(alias.lower() for alias in entry.get("aliases", ())),
+                parent=entry.get("parent"),
+                related=tuple(entry.get("related", ()))
+            )
+            for entry in data["technologies"]
+        ]
+        return cls(technologies, data.get("domains"))
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def __contains__(self, name):
+        return name.lower() in self._by_surface
+
+    def lookup(self, name):
+        """Return the Technology for a canonical name or alias, or None."""
+        canonical = self._by_surface.get(name.lower())
+        return self._by_name[canonical] if canonical else None
+
+    def domain_of(self, name):
+        """Return the domain of a technology, or None if unknown."""
+        tech = self.lookup(name)
+        return tech.domain if tech else None
+
+    def domain_path(self, domain):
+        """Return the domain followed by its parent domains, most specific first."""
+        path = []
+        while domain and domain not in path:
+            path.append(domain)
+            domain = self.domain_parents.get(domain)
+        return path
+
+    def ancestors(self, name):
+        """Return the parent technologies of a technology, nearest first."""
+        chain = []
+        tech = self.lookup(name)
+        while tech and tech.parent and tech.parent not in chain:
+            chain.append(tech.parent)
+            tech = self._by_name.get(tech.parent)
+        return chain
+
+    def related(self, name):
+        """Return the technologies related to a technology."""
+        tech = self.lookup(name)
+        return list(tech.related) if tech else []
+
+    @property
+    def domains(self):
+        """Mapping of canonical technology name to domain."""
+        if self._domains is None:
+            self._domains = {name: tech.domain for name, tech in self._by_name.items()}
+        return self._domains
+
+    @property
+    def surface_forms(self):
+        """Mapping of every name and alias to its canonical technology."""
+        return self._by_surface
+
+    @property
+    def matcher(self):
+        """tech_matcher.TechMatcher over all names and aliases, built on first use."""
+        if self._matcher is None:
+            from tech_matcher import TechMatcher
+            self._matcher = TechMatcher(self._by_surface)
+        return self._matcher
+
+
+def load_taxonomy(path=DEFAULT_TAXONOMY_PATH):
+    """Load a taxonomy from a JSON or msgpack (.msgpack) data file."""
+    if path.endswith(".msgpack"):
+        if msgpack is None:
+            raise ImportError("msgpack is required to load " + path)
+        with open(path, "rb") as f:
+            data = msgpack.unpack(f, raw=False)
+    else:
+        with open(path) as f:
+            data = json.load(f)
+    return Taxonomy.from_dict(data)
+
+
+@lru_cache(maxsize=None)
+def get_taxonomy(path=DEFAULT_TAXONOMY_PATH):
+    """Load the taxonomy on first use and share it process-wide."""
+    return load_taxonomy(path)
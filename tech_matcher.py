@@ -0,0 +1,96 @@
+# tech_matcher.py
+import re
+from collections import deque, namedtuple
+
+TechMatch = namedtuple("TechMatch", ["start", "end", "technology", "version"])
+
+# Optional version suffix directly after a technology name: "python3", "java 17", "vue v3.4"
+VERSION_PATTERN = re.compile(r"\s?v?(\d+(?:\.\d+)*)")
+
+
+class TechMatcher:
+    """
+    Multi-pattern matcher for technology names (Aho-Corasick automaton).
+
+    All surface forms (canonical names and aliases) are compiled once into a
+    single automaton, so a tech stack description is scanned in one pass
+    regardless of how many technologies are known. Matches must sit on word
+    boundaries ("go" does not match "good", "java" does not match
+    "javascript"), may carry a version suffix, and overlapping matches are
+    resolved leftmost-longest ("react native" wins over "react").
+    """
+
+    def __init__(self, patterns):
+        """patterns maps each surface form (name or alias) to its canonical technology."""
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for surface, technology in patterns.items():
+            self._add(surface.lower(), technology)
+        self._build_failure_links()
+
+    def _add(self, surface, technology):
+        node = 0
+        for ch in surface:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[node][ch] = next_node
+            node = next_node
+        self._output[node].append((surface, technology))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._output[child].extend(self._output[self._fail[child]])
+
+    def _candidates(self, text):
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for surface, technology in output[node]:
+                start = i - len(surface) + 1
+                end = i + 1
+                if surface[0].isalnum() and start > 0 and text[start - 1].isalnum():
+                    continue
+                version = None
+                if surface[-1].isalnum():
+                    version_match = VERSION_PATTERN.match(text, end)
+                    if version_match and not _is_word_char(text, version_match.end()):
+                        version = version_match.group(1)
+                        end = version_match.end()
+                    elif _is_word_char(text, end):
+                        continue
+                yield TechMatch(start, end, technology, version)
+
+    def find(self, text):
+        """Return non-overlapping TechMatch tuples in text order."""
+        candidates = sorted(self._candidates(text.lower()), key=lambda m: (m.start, m.start - m.end))
+        matches = []
+        last_end = 0
+        for match in candidates:
+            if match.start >= last_end:
+                matches.append(match)
+                last_end = match.end
+        return matches
+
+    def technologies(self, text):
+        """Return the distinct canonical technologies mentioned in text, in order of appearance."""
+        return list(dict.fromkeys(match.technology for match in self.find(text)))
+
+
+def _is_word_char(text, index):
+    return index < len(text) and text[index].isalnum()
@@ -1,166 +1,209 @@
-from langchain.llms import OpenAI
-from langchain.prompts import PromptTemplate
-from langchain.chains import LLMChain
-
-# Dictionary mapping technologies to their domains
-TECHNOLOGY_DOMAINS = {
-    "python": "programming_language",
-    "java": "programming_language",
-    "javascript": "programming_language",
-    "typescript": "programming_language",
-    "c#": "programming_language",
-    "ruby": "programming_language",
-    "go": "programming_language",
-    "php": "programming_language",
-    "react": "frontend_framework",
-    "angular": "frontend_framework",
-    "vue": "frontend_framework",
-    "svelte": "frontend_framework",
-    "django": "backend_framework",
-    "flask": "backend_framework",
-    "spring": "backend_framework",
-    "laravel": "backend_framework",
-    "express": "backend_framework",
-    "node": "backend_framework",
-    "mysql": "database",
-    "postgresql": "database",
-    "mongodb": "database",
-    "redis": "database",
-    "sql server": "database",
-    "oracle": "database",
-    "docker": "devops",
-    "kubernetes": "devops",
-    "jenkins": "devops",
-    "aws": "cloud",
-    "azure": "cloud",
-    "gcp": "cloud",
-    "git": "version_control",
-    "terraform": "infrastructure",
-    "react native": "mobile",
-    "flutter": "mobile",
-    "swift": "mobile",
-    "kotlin": "mobile"
-}
-
-class TechQuestionGenerator:
-    def __init__(self, llm):
-        """Initialize the tech question generator with an LLM."""
-        self.llm = llm
-        
-        # Create template for generating questions
-        self.question_template = PromptTemplate(
-            input_variables=["tech_stack", "difficulty_level"],
-            template="""
-            Generate {difficulty_level} technical questions to assess a candidate's proficiency in the following technologies: {tech_stack}
-            
-            For each technology, create 1-2 questions that:
-            1. Assess real-world knowledge and practical application (not just syntax)
-            2. Cannot be easily answered with a simple Google search
-            3. Reveal the depth of the candidate's understanding
-            4. Are specific to the technology mentioned
-            5. Can be answered concisely in a chat format (not requiring code samples)
-            
-            Format each question with a clear indication of which technology it's testing.
-            """
-        )
-        
-        self.question_chain = LLMChain(
-            llm=self.llm,
-            prompt=self.question_template,
-            verbose=True
-        )
-    
-    def parse_tech_stack(self, tech_stack_text):
-        """
-        Parse the tech stack text to identify known technologies.
-        Returns a dictionary grouped by domain.
-        """
-        # Convert to lowercase for easier matching
-        text_lower = tech_stack_text.lower()
-        
-        # Initialize results
-        tech_domains = {}
-        
-        # Check for each known technology
-        for tech, domain in TECHNOLOGY_DOMAINS.items():
-            if tech in text_lower:
-                if domain not in tech_domains:
-                    tech_domains[domain] = []
-                tech_domains[domain].append(tech)
-        
-        return tech_domains
-    
-    def generate_questions(self, tech_stack, num_questions=5):
-        """
-        Generate technical questions based on the candidate's tech stack.
-        Returns a list of questions.
-        """
-        # Parse tech stack to identify technologies by domain
-        tech_domains = self.parse_tech_stack(tech_stack)
-        
-        # Prepare the tech stack string for the prompt
-        tech_stack_formatted = ", ".join([tech for domain in tech_domains.values() for tech in domain])
-        if not tech_stack_formatted:
-            tech_stack_formatted = tech_stack  # Use original if no matches found
-        
-# Generate different difficulty questions
-        basic_questions = self.question_chain.run(
-            tech_stack=tech_stack_formatted,
-            difficulty_level="basic"
-        )
-        
-        advanced_questions = self.question_chain.run(
-            tech_stack=tech_stack_formatted,
-            difficulty_level="advanced"
-        )
-        
-        # Parse questions from the responses
-        # In a production system, you'd need more robust parsing
-        all_questions = []
-        
-        # Simple parsing by line breaks and filtering
-        basic_lines = [line.strip() for line in basic_questions.split("\n") if line.strip()]
-        advanced_lines = [line.strip() for line in advanced_questions.split("\n") if line.strip()]
-        
-        # Filter lines that look like questions (ending with ?)
-        for line in basic_lines + advanced_lines:
-            if line.endswith("?") and len(line) > 10:  # Simple heuristic for questions
-                all_questions.append(line)
-        
-        # Limit to requested number, but ensure at least one question if any generated
-        return all_questions[:num_questions] if all_questions else ["Could you describe your experience with " + tech_stack_formatted + "?"]
-    
-    def generate_follow_up_question(self, tech_stack, previous_question, previous_answer):
-        """
-        Generate a follow-up question based on the candidate's previous answer.
-        This provides more dynamic conversation flow.
-        """
-        follow_up_template = PromptTemplate(
-            input_variables=["tech_stack", "previous_question", "previous_answer"],
-            template="""
-            Based on the candidate's answer to a technical question about {tech_stack}, generate a relevant follow-up question.
-            
-            Previous question: {previous_question}
-            Candidate's answer: {previous_answer}
-            
-            The follow-up question should:
-            1. Dig deeper into the topic based on their response
-            2. Test a related but different aspect of the technology
-            3. Be more specific if their previous answer was very general
-            4. Assess practical application if their previous answer was theoretical
-            
-            Generate ONE natural follow-up question that a skilled technical interviewer would ask.
-            """
-        )
-        
-        follow_up_chain = LLMChain(
-            llm=self.llm,
-            prompt=follow_up_template,
-            verbose=True
-        )
-        
-        return follow_up_chain.run(
-            tech_stack=tech_stack,
-            previous_question=previous_question,
-            previous_answer=previous_answer
-        ).strip()
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+from chain_registry import ChainRegistry
+from taxonomy import get_taxonomy
+
+logger = logging.getLogger(__name__)
+
+# The technology taxonomy (domains, aliases, parents) lives in data/technologies.json
+# and is loaded on first use; see taxonomy.py.
+def __getattr__(name):
+    # TECHNOLOGY_DOMAINS is resolved lazily so importing this module stays cheap
+    if name == "TECHNOLOGY_DOMAINS":
+        return get_taxonomy().domains
+    # Prompt templates are built on first use so langchain isn't imported with this module
+    if name in ("QUESTION_PROMPT", "FOLLOW_UP_QUESTION_PROMPT"):
+        return _prompt(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_tech_matcher():
+    """Return the process-wide technology matcher."""
+    return get_taxonomy().matcher
+
+def _prompt(name):
+    prompt = _PROMPTS.get(name)
+    if prompt is None:
+        from langchain.prompts import PromptTemplate
+        prompt = _PROMPTS[name] = PromptTemplate(**_PROMPT_SPECS[name])
+    return prompt
+
+_PROMPTS = {}
+
+# Template for generating questions
+_QUESTION_PROMPT = dict(
+    input_variables=["tech_stack", "difficulty_level"],
+    template="""
+    Generate {difficulty_level} technical questions to assess a candidate's proficiency in the following technologies: {tech_stack}
+    
+    For each technology, create 1-2 questions that:
+    1. Assess real-world knowledge and practical application (not just syntax)
+    2. Cannot be easily answered with a simple Google search
+    3. Reveal the depth of the candidate's understanding
+    4. Are specific to the technology mentioned
+    5. Can be answered concisely in a chat format (not requiring code samples)
+    
+    Format each question with a clear indication of which technology it's testing.
+    """
+)
+
+# Template for follow-up questions based on the candidate's previous answer
+_FOLLOW_UP_QUESTION_PROMPT = dict(
+    input_variables=["tech_stack", "previous_question", "previous_answer"],
+    template="""
+    Based on the candidate's answer to a technical question about {tech_stack}, generate a relevant follow-up question.
+    
+    Previous question: {previous_question}
+    Candidate's answer: {previous_answer}
+    
+    The follow-up question should:
+    1. Dig deeper into the topic based on their response
+    2. Test a related but different aspect of the technology
+    3. Be more specific if their previous answer was very general
+    4. Assess practical application if their previous answer was theoretical
+    
+    Generate ONE natural follow-up question that a skilled technical interviewer would ask.
+    """
+)
+
+_PROMPT_SPECS = {
+    "QUESTION_PROMPT": _QUESTION_PROMPT,
+    "FOLLOW_UP_QUESTION_PROMPT": _FOLLOW_UP_QUESTION_PROMPT
+}
+
+class TechQuestionGenerator:
+    def __init__(self, llm, question_bank=None, max_concurrency=4, timeout=None, per_technology=False,
+                 chain_registry=None):
+        """
+        Initialize the tech question generator with an LLM.
+        If a question_bank.QuestionBank is given, known technologies are served
+        from it and the LLM is only used for technologies it doesn't cover.
+        Generation calls run concurrently on up to max_concurrency threads; a call
+        that takes longer than timeout seconds is dropped. With per_technology,
+        each technology gets its own calls instead of one call for the whole stack.
+        """
+        self.llm = llm
+        self.question_bank = question_bank
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.per_technology = per_technology
+        self._executor = None
+        
+        # Chains are built once per registry; pass a shared registry to reuse
+        # them across generators that share an LLM client
+        self.chain_registry = chain_registry if chain_registry is not None else ChainRegistry()
+        self.question_template = _prompt("QUESTION_PROMPT")
+        self.question_chain = self.chain_registry.get("question", self.llm, self.question_template, verbose=True)
+    
+    def parse_tech_stack(self, tech_stack_text):
+        """
+        Parse the tech stack text to identify known technologies.
+        Returns a dictionary grouped by domain.
+        """
+        # Initialize results
+        tech_domains = {}
+        
+        # Scan the text once for every known technology and alias
+        taxonomy = get_taxonomy()
+        for tech in taxonomy.matcher.technologies(tech_stack_text):
+            domain = taxonomy.domain_of(tech)
+            if domain not in tech_domains:
+                tech_domains[domain] = []
+            tech_domains[domain].append(tech)
+        
+        return tech_domains
+    
+    def parse_questions(self, text):
+        """Pick out the lines of an LLM response that look like questions."""
+        # In a production system, you'd need more robust parsing
+        lines = [line.strip() for line in text.split("\n") if line.strip()]
+        # Filter lines that look like questions (ending with ?)
+        return [line for line in lines if line.endswith("?") and len(line) > 10]  # Simple heuristic for questions
+    
+    def generate_questions_for_level(self, tech_stack_formatted, difficulty_level):
+        """Generate and parse questions for one difficulty level with the LLM."""
+        response = self.question_chain.run(
+            tech_stack=tech_stack_formatted,
+            difficulty_level=difficulty_level
+        )
+        return self.parse_questions(response)
+    
+    def generate_question_batches(self, jobs):
+        """
+        Run (tech_stack, difficulty_level) generation jobs concurrently.
+        Returns one question list per job, in job order regardless of completion
+        order. Jobs that fail or are unfinished when the timeout (one deadline
+        for the whole batch) expires contribute no questions.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        futures = [self._executor.submit(self.generate_questions_for_level, *job) for job in jobs]
+        wait(futures, timeout=self.timeout)
+        
+        batches = []
+        for job, future in zip(jobs, futures):
+            if not future.done():
+                future.cancel()
+                logger.warning("Question generation for %s (%s) timed out after %ss", *job, self.timeout)
+                batches.append([])
+            elif future.exception() is not None:
+                logger.warning("Question generation for %s (%s) failed: %r", *job, future.exception())
+                batches.append([])
+            else:
+                batches.append(future.result())
+        return batches
+    
+    def generate_questions(self, tech_stack, num_questions=5):
+        """
+        Generate technical questions based on the candidate's tech stack.
+        Returns a list of questions.
+        """
+        if num_questions <= 0:
+            return []
+
+        # Parse tech stack to identify technologies by domain
+        tech_domains = self.parse_tech_stack(tech_stack)
+        technologies = [tech for domain in tech_domains.values() for tech in domain]
+        
+        # Serve known technologies from the pre-generated bank
+        bank_questions = []
+        if self.question_bank is not None and technologies:
+            # Leave room for live questions about technologies the bank doesn't cover
+            known = [tech for tech in technologies if tech in self.question_bank]
+            quota = round(num_questions * len(known) / len(technologies))
+            bank_questions, missing = self.question_bank.assemble(technologies, quota)
+            if len(bank_questions) >= num_questions:
+                return bank_questions
+            # Generate the rest live: for the uncovered technologies, or for all
+            # of them when the bank knows them but has too few questions
+            technologies = missing or technologies
+            num_questions -= len(bank_questions)
+        
+        # Prepare the tech stack string for the prompt
+        tech_stack_formatted = ", ".join(technologies)
+        if not tech_stack_formatted:
+            tech_stack_formatted = tech_stack  # Use original if no matches found
+        
+        # Generate different difficulty questions concurrently, merged basic first
+        if self.per_technology and technologies:
+            jobs = [(tech, level) for level in ("basic", "advanced") for tech in technologies]
+        else:
+            jobs = [(tech_stack_formatted, "basic"), (tech_stack_formatted, "advanced")]
+        all_questions = [question for batch in self.generate_question_batches(jobs) for question in batch]
+        
+        # Limit to requested number, but ensure at least one question if any generated
+        all_questions = bank_questions + all_questions[:num_questions]
+        return all_questions if all_questions else ["Could you describe your experience with " + tech_stack_formatted + "?"]
+    
+    def generate_follow_up_question(self, tech_stack, previous_question, previous_answer):
+        """
+        Generate a follow-up question based on the candidate's previous answer.
+        This provides more dynamic conversation flow.
+        """
+        follow_up_chain = self.chain_registry.get("follow_up_question", self.llm, _prompt("FOLLOW_UP_QUESTION_PROMPT"),
+                                                 verbose=True)
+        
+        return follow_up_chain.run(
+            tech_stack=tech_stack,
+            previous_question=previous_question,
+            previous_answer=previous_answer
+        ).strip()
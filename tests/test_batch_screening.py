@@ -0,0 +1,19 @@
+from batch_screening import read_candidates
+
+
+def test_malformed_lines_are_skipped(tmp_path, capsys):
+    path = tmp_path / "transcripts.jsonl"
+    path.write_text('{"candidate_id": "c-1", "messages": []}\n'
+                    '{"candidate_id": "c-2", "messa\n'
+                    '["not", "an", "object"]\n'
+                    '\n'
+                    '{"messages": ["Hello"]}\n')
+    candidates = list(read_candidates(path, done=set()))
+    assert [candidate["candidate_id"] for candidate in candidates] == ["c-1", "line-5"]
+    assert f"{path}:2:" in capsys.readouterr().err
+
+
+def test_done_candidates_are_skipped(tmp_path):
+    path = tmp_path / "transcripts.jsonl"
+    path.write_text('{"candidate_id": "c-1"}\n{"candidate_id": "c-2"}\n')
+    assert [candidate["candidate_id"] for candidate in read_candidates(path, done={"c-1"})] == ["c-2"]
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+
+from hiring_assistant import HiringAssistant
+
+
+class RecordingGuard:
+    """call_guard that records whether a call is held and from which threads it was entered."""
+
+    def __init__(self):
+        self.held = []
+        self.entered_on = []
+        self.events = []
+
+    @contextmanager
+    def __call__(self, chain_name):
+        self.entered_on.append(threading.get_ident())
+        self.held.append(chain_name)
+        self.events.append(("enter", chain_name))
+        try:
+            yield
+        finally:
+            self.held.remove(chain_name)
+            self.events.append(("exit", chain_name))
+
+
+class FakeChain:
+    def __init__(self, guard):
+        self.guard = guard
+
+    async def ainvoke(self, payload):
+        assert self.guard.held == ["greeting"]
+        return {"output": "Hello!"}
+
+
+class FakeLLM:
+    def __init__(self, guard):
+        self.guard = guard
+
+    async def astream(self, prompt):
+        for word in ("Hello", " there"):
+            assert self.guard.held == ["greeting"]
+            yield word
+
+
+def make_assistant(guard):
+    assistant = object.__new__(HiringAssistant)
+    assistant.call_guard = guard
+    assistant.chains = {"greeting": FakeChain(guard)}
+    assistant.llm = FakeLLM(guard)
+    return assistant
+
+
+def test_async_invoke_holds_the_guard():
+    guard = RecordingGuard()
+    assistant = make_assistant(guard)
+
+    async def run():
+        return await assistant._ainvoke_chain("greeting", {}), threading.get_ident()
+
+    response, loop_thread = asyncio.run(run())
+    assert response == "Hello!"
+    assert guard.events == [("enter", "greeting"), ("exit", "greeting")]
+    # A guard may block while entering, so it mustn't be entered on the event loop
+    assert guard.entered_on != [loop_thread]
+
+
+def test_async_stream_holds_the_guard_until_exhausted():
+    guard = RecordingGuard()
+    assistant = make_assistant(guard)
+
+    async def run():
+        return [chunk async for chunk in assistant._astream_chain("greeting", "prompt")]
+
+    assert asyncio.run(run()) == ["Hello", " there"]
+    assert guard.events == [("enter", "greeting"), ("exit", "greeting")]
+
+
+def test_guard_is_released_when_the_call_fails():
+    guard = RecordingGuard()
+    assistant = make_assistant(guard)
+    assistant.chains["greeting"].ainvoke = lambda payload: asyncio.sleep(0, result={})
+
+    async def run():
+        try:
+            await assistant._ainvoke_chain("greeting", {})
+        except KeyError:
+            return True
+
+    assert asyncio.run(run())
+    assert guard.held == []
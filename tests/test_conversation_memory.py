@@ -0,0 +1,39 @@
+from conversation_memory import PROMPT_SIZE_HISTORY, TRUNCATION_MARKER, ConversationMemory
+
+
+def test_render_keeps_newest_lines_within_budget():
+    memory = ConversationMemory(token_budgets={"greeting": 20})
+    for i in range(10):
+        memory.append("user", f"message number {i}")
+    history = memory.render("greeting")
+    assert history.endswith("user: message number 9")
+    assert "message number 0" not in history
+    assert memory.last_prompt_tokens <= 20
+
+
+def test_oversized_newest_line_is_truncated_to_budget():
+    memory = ConversationMemory(token_budgets={"greeting": 256})
+    memory.append("user", "x" * 40000)
+    history = memory.render("greeting")
+    assert history.endswith(TRUNCATION_MARKER)
+    assert memory.last_prompt_tokens <= 256
+
+
+def test_prompt_sizes_are_bounded_but_totals_kept():
+    memory = ConversationMemory()
+    memory.append("user", "hello")
+    for _ in range(PROMPT_SIZE_HISTORY + 50):
+        memory.render()
+    assert len(memory.prompt_sizes) == PROMPT_SIZE_HISTORY
+    assert memory.stats()["prompts_rendered"] == PROMPT_SIZE_HISTORY + 50
+
+
+def test_snapshot_round_trip():
+    memory = ConversationMemory()
+    memory.append("user", "hello")
+    memory.append("assistant", "hi there")
+    memory.render()
+    restored = ConversationMemory()
+    restored.restore(memory.snapshot())
+    assert restored.render() == memory.render()
+    assert restored.stats() == memory.stats()
@@ -0,0 +1,44 @@
+from field_extractor import extract_fields
+
+MESSAGE = ("Reach me at jane.doe@example.com or 555-123-4567. "
+           "I have 5 years of Python and I'm based in New York, NY.")
+
+
+def test_extracts_every_field_in_one_pass():
+    result = extract_fields(MESSAGE)
+    assert result.fields() == {
+        "email": "jane.doe@example.com",
+        "phone": "555-123-4567",
+        "experience": "5 years",
+        "location": "New York, NY",
+        "tech_stack": "python",
+    }
+    assert result.years == 5.0
+
+
+def test_spans_point_into_the_message():
+    result = extract_fields(MESSAGE)
+    for match in (result.email, result.phone, result.experience, result.location):
+        assert MESSAGE[match.start:match.end] == match.value
+
+
+def test_email_digits_are_not_taken_as_phone():
+    result = extract_fields("contact: 5551234567@example.com")
+    assert result.email.value == "5551234567@example.com"
+    assert result.phone is None
+
+
+def test_first_match_of_each_field_wins():
+    result = extract_fields("first@example.com, second@example.com, 3 years here and 10 years there")
+    assert result.email.value == "first@example.com"
+    assert result.years == 3.0
+
+
+def test_technologies_can_be_skipped():
+    result = extract_fields("5 yrs of Go and Rust", technologies=False)
+    assert result.technologies == []
+    assert result.fields() == {"experience": "5 yrs"}
+
+
+def test_message_without_fields():
+    assert extract_fields("Hello there!").fields() == {}
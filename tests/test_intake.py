@@ -0,0 +1,72 @@
+import json
+
+from conversation_memory import ConversationMemory
+from hiring_assistant import HiringAssistant
+from models import CandidateProfile, ConversationState
+
+
+def make_assistant(extraction=None):
+    """Assistant with intake state only; chain calls are recorded instead of sent."""
+    assistant = object.__new__(HiringAssistant)
+    assistant.candidate_data = CandidateProfile()
+    assistant.state = ConversationState()
+    assistant.memory = ConversationMemory()
+    assistant.templated_intake = True
+    assistant.structured_intake = True
+    assistant.calls = []
+
+    def run_chain(chain_name, payload):
+        assistant.calls.append(chain_name)
+        return json.dumps(extraction or {})
+
+    assistant._run_chain = run_chain
+    return assistant
+
+
+def collect(assistant, **fields):
+    for field, value in fields.items():
+        assistant.candidate_data[field] = value
+        assistant.state["fields_collected"].append(field)
+    assistant.state["stage"] = "info_gathering"
+
+
+def test_comma_separated_answer_is_a_single_field():
+    assistant = make_assistant()
+    collect(assistant, full_name="Jane Doe", email="jane.doe@example.com", phone="555-123-4567")
+    answer = "I have 4 years of experience with java, spring, and kafka"
+
+    chain_name, _ = assistant._plan_response(answer)
+
+    assert assistant.calls == []
+    assert chain_name is None
+    assert assistant.candidate_data["experience"] == answer
+    assert assistant.state["fields_collected"][3:] == ["experience"]
+
+
+def test_comma_separated_tech_stack_answer_is_a_single_field():
+    assistant = make_assistant()
+    collect(assistant, full_name="Jane Doe", email="jane.doe@example.com", phone="555-123-4567",
+            experience="5 years", desired_position="Backend Engineer", location="Berlin")
+
+    chain_name, _ = assistant._plan_response("python, django, postgresql")
+
+    assert assistant.calls == []
+    assert chain_name == "tech_question"
+    assert assistant.candidate_data["tech_stack"] == "python, django, postgresql"
+
+
+def test_multi_field_message_fills_every_field_with_one_extraction_call():
+    assistant = make_assistant(extraction={"full_name": "Jane Doe", "desired_position": "Backend Engineer"})
+    assistant.state["stage"] = "greeting"
+    message = "I'm Jane Doe, jane.doe@example.com, 555-123-4567, 5 years of Python, based in Berlin"
+
+    chain_name, _ = assistant._plan_response(message)
+
+    assert assistant.calls == ["extraction"]
+    assert chain_name is None
+    assert assistant.candidate_data["full_name"] == "Jane Doe"
+    assert assistant.candidate_data["email"] == "jane.doe@example.com"
+    assert assistant.candidate_data["experience"] == "5 years"
+    assert assistant.candidate_data["location"] == "Berlin"
+    assert assistant.candidate_data["desired_position"] == "Backend Engineer"
+    assert assistant.get_remaining_field_keys() == ["tech_stack"]
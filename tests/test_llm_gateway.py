@@ -0,0 +1,279 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from llm_gateway import CircuitBreaker, CircuitOpenError, LLMGateway, TokenBucket
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def failing(exc_type, times):
+    """Return a callable that raises exc_type the first `times` calls, then returns "ok"."""
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= times:
+            raise exc_type()
+        return "ok"
+
+    func.calls = calls
+    return func
+
+
+def gateway(**settings):
+    settings.setdefault("base_delay", 0)
+    return LLMGateway(**settings)
+
+
+# Token bucket
+
+def test_token_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=50, burst=5)
+    started = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    assert time.monotonic() - started < 0.05
+    for _ in range(10):
+        bucket.acquire()
+    # Ten more tokens at 50/s take about 0.2s
+    assert 0.15 < time.monotonic() - started < 0.5
+
+
+def test_token_bucket_async_paces():
+    bucket = TokenBucket(rate=50, burst=1)
+
+    async def main():
+        started = time.monotonic()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(11)))
+        return time.monotonic() - started
+
+    assert 0.15 < asyncio.run(main()) < 0.5
+
+
+# Retries
+
+def test_retries_transient_errors():
+    gw = gateway()
+    func = failing(RateLimitError, 2)
+    assert gw.call(func) == "ok"
+    assert len(func.calls) == 3
+    assert gw.stats["retries"] == 2
+
+
+def test_does_not_retry_other_errors():
+    gw = gateway()
+    func = failing(ValueError, 1)
+    with pytest.raises(ValueError):
+        gw.call(func)
+    assert len(func.calls) == 1
+
+
+def test_gives_up_after_max_retries():
+    gw = gateway(max_retries=2)
+    func = failing(RateLimitError, 10)
+    with pytest.raises(RateLimitError):
+        gw.call(func)
+    assert len(func.calls) == 3
+
+
+# Circuit breaker
+
+def test_breaker_counts_one_failure_per_call():
+    gw = gateway(max_retries=3, failure_threshold=5)
+    for _ in range(2):
+        with pytest.raises(RateLimitError):
+            gw.call(failing(RateLimitError, 10))
+    assert gw.breaker.failures == 2
+    assert gw.breaker.state == "closed"
+
+
+def test_breaker_ignores_non_retryable_errors():
+    gw = gateway(failure_threshold=1)
+    with pytest.raises(ValueError):
+        gw.call(failing(ValueError, 1))
+    assert gw.breaker.state == "closed"
+
+
+def test_breaker_opens_and_recovers_after_trial():
+    gw = gateway(max_retries=0, failure_threshold=2, reset_timeout=0.05)
+    for _ in range(2):
+        with pytest.raises(RateLimitError):
+            gw.call(failing(RateLimitError, 1))
+    with pytest.raises(CircuitOpenError) as excinfo:
+        gw.call(lambda: "ok")
+    assert 0 < excinfo.value.retry_after <= 1
+    time.sleep(0.06)
+    assert gw.breaker.state == "half_open"
+    assert gw.call(lambda: "ok") == "ok"
+    assert gw.breaker.state == "closed"
+
+
+def test_failed_trial_reopens_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    trial = breaker.before_call()
+    assert trial
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure(trial)
+    assert breaker.state == "open"
+
+
+def test_cancelled_trial_releases_breaker():
+    gw = gateway(max_retries=0, failure_threshold=1, reset_timeout=0.05)
+    with pytest.raises(RateLimitError):
+        gw.call(failing(RateLimitError, 1))
+    time.sleep(0.06)
+
+    async def main():
+        task = asyncio.ensure_future(gw.acall(lambda: asyncio.sleep(10)))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert gw.breaker.state == "half_open"
+    assert gw.call(lambda: "ok") == "ok"
+    assert gw.breaker.state == "closed"
+
+
+# Single-flight coalescing
+
+def test_concurrent_identical_calls_share_one_request():
+    gw = gateway()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.1)
+        return "hello"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(gw.call(slow, key="greeting"))) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["hello"] * 10
+    assert len(calls) == 1
+    assert gw.stats["coalesced"] == 9
+
+
+def test_coalesced_callers_share_errors():
+    gw = gateway()
+
+    def slow_failure():
+        time.sleep(0.1)
+        raise ValueError("bad prompt")
+
+    errors = []
+
+    def call():
+        try:
+            gw.call(slow_failure, key="k")
+        except ValueError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(errors) == 3
+
+
+def test_async_calls_coalesce():
+    gw = gateway()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "hello"
+
+    async def main():
+        return await asyncio.gather(*(gw.acall(slow, key="greeting") for _ in range(5)))
+
+    assert asyncio.run(main()) == ["hello"] * 5
+    assert len(calls) == 1
+
+
+def test_cancelled_leader_hands_request_to_follower():
+    gw = gateway()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "hello"
+
+    async def main():
+        leader = asyncio.ensure_future(gw.acall(slow, key="k"))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(gw.acall(slow, key="k"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        result = await follower
+        assert leader.cancelled()
+        return result
+
+    assert asyncio.run(main()) == "hello"
+    assert len(calls) == 2
+
+
+# Streams
+
+def test_stream_retries_before_first_chunk():
+    gw = gateway()
+    attempts = []
+
+    def chunks():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RateLimitError()
+        yield from ["a", "b"]
+
+    assert list(gw.stream(chunks)) == ["a", "b"]
+    assert len(attempts) == 2
+
+
+def test_stream_does_not_retry_after_first_chunk():
+    gw = gateway()
+    attempts = []
+
+    def chunks():
+        attempts.append(1)
+        yield "a"
+        raise RateLimitError()
+
+    received = []
+    with pytest.raises(RateLimitError):
+        for chunk in gw.stream(chunks):
+            received.append(chunk)
+    assert received == ["a"]
+    assert len(attempts) == 1
+
+
+def test_async_stream_retries_before_first_chunk():
+    gw = gateway()
+    attempts = []
+
+    async def chunks():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RateLimitError()
+        for chunk in ["a", "b"]:
+            yield chunk
+
+    async def main():
+        return [chunk async for chunk in gw.astream(chunks)]
+
+    assert asyncio.run(main()) == ["a", "b"]
+    assert len(attempts) == 2
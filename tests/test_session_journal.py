@@ -0,0 +1,129 @@
+import uuid
+
+from candidate_journal import BatchedJournalWriter, SessionJournal
+from conversation_memory import ConversationMemory
+from export_candidates import scan_directory
+from hiring_assistant import HiringAssistant
+from models import CandidateProfile, ConversationState
+
+MESSAGES = ["Hello", "Jane Doe", "jane.doe@example.com", "555-123-4567", "5 years of Python"]
+
+
+def make_assistant(directory, compact_every=3):
+    """Assistant with a real journal in directory; chain calls return a canned reply."""
+    assistant = object.__new__(HiringAssistant)
+    assistant.candidate_data = CandidateProfile()
+    assistant.state = ConversationState()
+    assistant.memory = ConversationMemory()
+    assistant.templated_intake = True
+    assistant.structured_intake = True
+    assistant.response_cache = None
+    assistant.metrics = None
+    assistant.prefetch_questions = False
+    assistant._prefetch = None
+    assistant.session_id = uuid.uuid4().hex
+    assistant.journal = SessionJournal(assistant.session_id, str(directory), BatchedJournalWriter(flush_interval=0))
+    assistant.compact_every = compact_every
+    assistant._turns_since_compaction = 0
+    assistant._journaled_fields = {}
+    assistant._journaled_responses = 0
+    assistant._journaled_stage = assistant.state["stage"]
+    assistant._run_chain = lambda chain_name, payload: "Hi! What's your full name?"
+    return assistant
+
+
+def crash(assistant):
+    """Lose the process: only what the journal writer had flushed survives."""
+    assistant.journal.writer.flush()
+
+
+def test_load_applies_journal_after_snapshot(tmp_path):
+    journal = SessionJournal("abc123", str(tmp_path), BatchedJournalWriter(flush_interval=0))
+    journal.compact({"full_name": "Jane Doe", "conversation_log": []}, "Jane Doe", turn=1, state={"stage": "greeting"})
+    for turn, entry in ((1, "already in the snapshot"), (2, "jane.doe@example.com")):
+        journal.append({"turn": turn, "stage": "info_gathering", "user": entry, "assistant": "Thanks!",
+                        "timestamp": "2024-01-01T00:00:00", "fields": {"email": entry},
+                        "technical_responses": [], "state": {"stage": "info_gathering"}})
+
+    record = SessionJournal("abc123", str(tmp_path), journal.writer).load()
+
+    assert record["email"] == "jane.doe@example.com"
+    assert [message["content"] for message in record["conversation_log"]] == ["jane.doe@example.com", "Thanks!"]
+    assert record["session"]["turn"] == 2
+    assert record["session"]["state"] == {"stage": "info_gathering"}
+
+
+def test_session_killed_between_compactions_is_recovered(tmp_path):
+    assistant = make_assistant(tmp_path)
+    for message in MESSAGES:
+        assistant.process_user_input(message)
+    crash(assistant)
+
+    recovered = make_assistant(tmp_path)
+    assert recovered.resume(assistant.session_id)
+
+    assert recovered.candidate_data == assistant.candidate_data
+    assert recovered.state == assistant.state
+    assert recovered.memory.turn == assistant.memory.turn
+    assert recovered.memory.render() == assistant.memory.render()
+
+
+def test_restore_replays_turns_after_the_session_snapshot(tmp_path):
+    assistant = make_assistant(tmp_path)
+    for message in MESSAGES[:2]:
+        assistant.process_user_input(message)
+    checkpoint = assistant.snapshot()
+    for message in MESSAGES[2:]:
+        assistant.process_user_input(message)
+    crash(assistant)
+
+    recovered = make_assistant(tmp_path)
+    recovered.restore(checkpoint)
+
+    assert recovered.candidate_data == assistant.candidate_data
+    assert recovered.state == assistant.state
+
+
+def test_export_includes_journaled_turns(tmp_path):
+    assistant = make_assistant(tmp_path, compact_every=100)
+    for message in MESSAGES:
+        assistant.process_user_input(message)
+    crash(assistant)
+
+    [(_, _, record)] = scan_directory(str(tmp_path), "candidates", workers=1)
+    assert record["full_name"] == "Jane Doe"
+    assert record["phone"] == "555-123-4567"
+    assert len(record["conversation_log"]) == 2 * len(MESSAGES)
+
+
+def test_unknown_or_unsafe_session_ids_are_not_resumed(tmp_path):
+    assistant = make_assistant(tmp_path)
+    session_id = assistant.session_id
+    assert not assistant.resume(uuid.uuid4().hex)
+    assert not assistant.resume("../etc/passwd")
+    assert assistant.session_id == session_id
+
+
+def test_snapshot_stores_transcript_once(tmp_path):
+    assistant = make_assistant(tmp_path)
+    for message in MESSAGES:
+        assistant.process_user_input(message)
+    snapshot = assistant.snapshot()
+    assert "lines" not in snapshot["memory"]
+    assert "prompt_sizes" not in snapshot["memory"]
+
+    restored = make_assistant(tmp_path)
+    restored.restore(snapshot)
+    assert restored.memory.render() == assistant.memory.render()
+    assert restored.memory.turn == assistant.memory.turn
+
+
+def test_version_1_snapshots_are_still_restored(tmp_path):
+    assistant = make_assistant(tmp_path)
+    for message in MESSAGES:
+        assistant.process_user_input(message)
+    snapshot = dict(assistant.snapshot(), version=1, memory=assistant.memory.snapshot())
+
+    restored = make_assistant(tmp_path)
+    restored.restore(snapshot)
+    assert restored.memory.render() == assistant.memory.render()
@@ -0,0 +1,46 @@
+from taxonomy import Taxonomy, get_taxonomy
+
+DATA = {
+    "domains": {"web_development": None, "frontend_framework": "web_development"},
+    "technologies": [
+        {"name": "JavaScript", "domain": "programming_language", "aliases": ["JS", "ECMAScript"]},
+        {"name": "TypeScript", "domain": "programming_language", "aliases": ["ts"], "parent": "javascript"},
+        {"name": "React", "domain": "frontend_framework", "parent": "javascript", "related": ["typescript"]},
+        {"name": "Next.js", "domain": "frontend_framework", "aliases": ["nextjs"], "parent": "react"},
+    ],
+}
+
+
+def test_lookup_by_name_or_alias_is_case_insensitive():
+    taxonomy = Taxonomy.from_dict(DATA)
+    assert taxonomy.lookup("JS").name == "javascript"
+    assert taxonomy.lookup("ecmascript").name == "javascript"
+    assert taxonomy.lookup("NEXTJS").name == "next.js"
+    assert taxonomy.lookup("cobol") is None
+    assert "ts" in taxonomy
+
+
+def test_parent_chain_and_related():
+    taxonomy = Taxonomy.from_dict(DATA)
+    assert taxonomy.ancestors("nextjs") == ["react", "javascript"]
+    assert taxonomy.ancestors("javascript") == []
+    assert taxonomy.related("react") == ["typescript"]
+
+
+def test_domain_hierarchy():
+    taxonomy = Taxonomy.from_dict(DATA)
+    assert taxonomy.domain_of("next.js") == "frontend_framework"
+    assert taxonomy.domain_path("frontend_framework") == ["frontend_framework", "web_development"]
+
+
+def test_matcher_uses_aliases():
+    taxonomy = Taxonomy.from_dict(DATA)
+    assert taxonomy.matcher.technologies("JS, TS and Next.js") == ["javascript", "typescript", "next.js"]
+
+
+def test_bundled_taxonomy_is_shared_and_loaded():
+    taxonomy = get_taxonomy()
+    assert taxonomy is get_taxonomy()
+    assert taxonomy.lookup("golang").name == "go"
+    assert taxonomy.lookup("k8s").name == "kubernetes"
+    assert taxonomy.ancestors("django") == ["python"]
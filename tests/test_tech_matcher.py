@@ -0,0 +1,49 @@
+from tech_matcher import TechMatcher
+
+PATTERNS = {
+    "go": "go", "golang": "go",
+    "java": "java", "javascript": "javascript", "js": "javascript",
+    "react": "react", "react native": "react native",
+    "c++": "c++", "c#": "c#", "c": "c",
+    "node.js": "node", "python": "python",
+}
+
+
+def technologies(text):
+    return TechMatcher(PATTERNS).technologies(text)
+
+
+def test_matches_need_word_boundaries():
+    assert technologies("I'm good at this") == []
+    assert technologies("I write Go daily") == ["go"]
+    assert technologies("golang") == ["go"]
+
+
+def test_java_does_not_match_inside_javascript():
+    assert technologies("JavaScript") == ["javascript"]
+    assert technologies("JavaScript and Java") == ["javascript", "java"]
+
+
+def test_longest_match_wins():
+    assert technologies("React Native") == ["react native"]
+    assert technologies("react native and react") == ["react native", "react"]
+
+
+def test_symbol_names():
+    assert technologies("C++, C# and C") == ["c++", "c#", "c"]
+    assert technologies("node.js") == ["node"]
+
+
+def test_versions_are_captured():
+    matches = TechMatcher(PATTERNS).find("python3, java 17")
+    assert [(match.technology, match.version) for match in matches] == [("python", "3"), ("java", "17")]
+
+
+def test_match_spans_point_into_the_text():
+    text = "Mostly Python and Go"
+    for match in TechMatcher(PATTERNS).find(text):
+        assert text[match.start:match.end].lower() in PATTERNS
+
+
+def test_technologies_are_distinct_in_order():
+    assert technologies("go, python, golang, go") == ["go", "python"]